@@ -0,0 +1,274 @@
+"""Benchmarks for gallagher_restapi.
+
+Run from the repository root with `python -m benchmarks`. Every benchmark runs
+the client against the FakeCommandCentre transport without latency, so the
+numbers measure the client itself and are comparable between runs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import platform
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+from datetime import UTC, datetime
+from importlib.metadata import PackageNotFoundError, version
+from typing import Any
+
+import httpx
+
+from gallagher_restapi import Client, models
+from gallagher_restapi.testing import FakeCommandCentre, FakeSite
+
+CARDHOLDER_FIELDS = ["defaults", "personalDataFields", "cards", "accessGroups"]
+
+
+@dataclass
+class BenchmarkResult:
+    """Result of a single benchmark."""
+
+    name: str
+    value: float
+    unit: str
+    higher_is_better: bool
+    rounds: int
+
+
+def _best_of(rounds: int, run: Callable[[], float]) -> float:
+    """Return the best duration of a number of rounds."""
+    return min(run() for _ in range(rounds))
+
+
+async def _best_of_async(rounds: int, run: Callable[[], Awaitable[float]]) -> float:
+    """Return the best duration of a number of async rounds."""
+    return min([await run() for _ in range(rounds)])
+
+
+def _client(site: FakeSite, **kwargs: Any) -> tuple[FakeCommandCentre, Client]:
+    """Return a fake server and a client connected to it."""
+    fake = FakeCommandCentre(site, **kwargs)
+    return fake, fake.client()
+
+
+async def bench_yield_cardholders(count: int, rounds: int) -> BenchmarkResult:
+    """Measure cardholders per second through yield_cardholders."""
+    _, client = _client(FakeSite(cardholders=count))
+    await client.initialize()
+
+    async def run() -> float:
+        start = time.perf_counter()
+        async for _ in client.yield_cardholders(
+            response_fields=CARDHOLDER_FIELDS, top=1000
+        ):
+            pass
+        return time.perf_counter() - start
+
+    duration = await _best_of_async(rounds, run)
+    return BenchmarkResult(
+        "yield_cardholders", count / duration, "rows/s", True, rounds
+    )
+
+
+async def bench_yield_events(count: int, rounds: int) -> BenchmarkResult:
+    """Measure events per second through yield_events."""
+    _, client = _client(FakeSite(events=count))
+    await client.initialize()
+
+    async def run() -> float:
+        start = time.perf_counter()
+        async for _ in client.yield_events(models.EventQuery(top=1000)):
+            pass
+        return time.perf_counter() - start
+
+    duration = await _best_of_async(rounds, run)
+    return BenchmarkResult("yield_events", count / duration, "rows/s", True, rounds)
+
+
+async def bench_yield_new_events(count: int, rounds: int) -> BenchmarkResult:
+    """Measure events per second through yield_new_events.
+
+    The fake server generates live events fast enough that every poll returns a
+    full page, so the adaptive poll delay never kicks in.
+    """
+    _, client = _client(FakeSite(events=0, live_event_rate=1e9), long_poll_timeout=0)
+    await client.initialize()
+
+    async def run() -> float:
+        received = 0
+        updates = client.yield_new_events()
+        start = time.perf_counter()
+        async for events in updates:
+            received += len(events)
+            if received >= count:
+                break
+        duration = time.perf_counter() - start
+        await updates.aclose()
+        return duration * count / received
+
+    duration = await _best_of_async(rounds, run)
+    return BenchmarkResult("yield_new_events", count / duration, "rows/s", True, rounds)
+
+
+def bench_validation(
+    name: str, model: type[models.FTModel], rows: list[dict[str, Any]], rounds: int
+) -> BenchmarkResult:
+    """Measure the cost of validating one row of a model.
+
+    Rows are copied before timing because some validators mutate their input.
+    """
+
+    def run() -> float:
+        batch = [copy.copy(row) for row in rows]
+        start = time.perf_counter()
+        for row in batch:
+            model.model_validate(row)
+        return time.perf_counter() - start
+
+    duration = _best_of(rounds, run)
+    return BenchmarkResult(name, duration / len(rows) * 1e6, "us/row", False, rounds)
+
+
+def bench_query_serialization(count: int, rounds: int) -> list[BenchmarkResult]:
+    """Measure building and serializing the query of a by-ID lookup.
+
+    Compares the pydantic path (build the model, model_dump), the precompiled
+    to_params() and the cached query_params().
+    """
+    fields = ["defaults", "cards", "accessGroups"]
+    event_query = models.EventQuery(
+        after=datetime(2025, 1, 1, tzinfo=UTC), event_types=["1", "2"], top=1000
+    )
+
+    def timed(build: Callable[[], Any]) -> Callable[[], float]:
+        def run() -> float:
+            start = time.perf_counter()
+            for _ in range(count):
+                build()
+            return time.perf_counter() - start
+
+        return run
+
+    cases: dict[str, Callable[[], Any]] = {
+        "query_model_dump": lambda: models.QueryBase(
+            response_fields=fields
+        ).model_dump(),
+        "query_to_params": lambda: models.QueryBase(response_fields=fields).to_params(),
+        "query_params_cached": lambda: models.query_params(
+            models.QueryBase, response_fields=fields
+        ),
+        "event_query_model_dump": event_query.model_dump,
+        "event_query_to_params": event_query.to_params,
+    }
+    return [
+        BenchmarkResult(
+            name,
+            _best_of(rounds, timed(build)) / count * 1e6,
+            "us/query",
+            False,
+            rounds,
+        )
+        for name, build in cases.items()
+    ]
+
+
+async def bench_request_overhead(count: int, rounds: int) -> BenchmarkResult:
+    """Measure the time _async_request adds on top of the transport round trip."""
+    fake, client = _client(FakeSite(doors=1))
+    await client.initialize()
+    url = f"{client.server_url}/api/doors/1"
+    raw = httpx.AsyncClient(transport=fake)
+    params = models.QueryBase(response_fields=["defaults", "statusFlags"])
+
+    async def run_client() -> float:
+        start = time.perf_counter()
+        for _ in range(count):
+            await client._async_request(models.HTTPMethods.GET, url, params=params)
+        return time.perf_counter() - start
+
+    async def run_raw() -> float:
+        start = time.perf_counter()
+        for _ in range(count):
+            (await raw.get(url, params={"fields": "defaults,statusFlags"})).json()
+        return time.perf_counter() - start
+
+    overhead = await _best_of_async(rounds, run_client) - await _best_of_async(
+        rounds, run_raw
+    )
+    await raw.aclose()
+    return BenchmarkResult(
+        "async_request_overhead", overhead / count * 1e6, "us/request", False, rounds
+    )
+
+
+async def run_benchmarks(scale: float = 1.0, rounds: int = 3) -> dict[str, Any]:
+    """Run all benchmarks and return the results as a JSON serializable dict.
+
+    Args:
+        scale: Multiplier of the number of rows and requests of every benchmark.
+        rounds: Number of times each benchmark is repeated, the best round is kept.
+    """
+    rows = max(1, int(10_000 * scale))
+    fake = FakeCommandCentre(FakeSite())
+    fields = {"fields": ",".join(CARDHOLDER_FIELDS)}
+    cardholders = [fake._cardholder(index, fields) for index in range(rows)]
+    plain_cardholders = [
+        fake._cardholder(index, {"fields": "defaults"}) for index in range(rows)
+    ]
+    events = [fake._event(index) for index in range(rows)]
+    alarms = [fake._alarm(index) for index in range(rows)]
+    access_zones = [fake._access_zone(index) for index in range(rows)]
+
+    results = [
+        await bench_yield_cardholders(rows * 2, rounds),
+        await bench_yield_events(rows * 2, rounds),
+        await bench_yield_new_events(rows * 2, rounds),
+        bench_validation(
+            "validate_cardholder", models.FTCardholder, cardholders, rounds
+        ),
+        bench_validation(
+            "validate_cardholder_without_pdfs",
+            models.FTCardholder,
+            plain_cardholders,
+            rounds,
+        ),
+        bench_validation("validate_event", models.FTEvent, events, rounds),
+        bench_validation("validate_alarm", models.FTAlarm, alarms, rounds),
+        bench_validation(
+            "validate_access_zone_commands", models.FTAccessZone, access_zones, rounds
+        ),
+        await bench_request_overhead(max(1, rows // 10), rounds),
+        *bench_query_serialization(rows, rounds),
+    ]
+    try:
+        package_version = version("gallagher-restapi")
+    except PackageNotFoundError:
+        package_version = "unknown"
+    return {
+        "timestamp": datetime.now(UTC).isoformat(),
+        "version": package_version,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "scale": scale,
+        "results": {result.name: asdict(result) for result in results},
+    }
+
+
+def compare(baseline: dict[str, Any], current: dict[str, Any]) -> list[str]:
+    """Return a line per benchmark with the change from a baseline run."""
+    lines = []
+    for name, result in current["results"].items():
+        line = f"{name:<36} {result['value']:>14.2f} {result['unit']}"
+        if base := baseline["results"].get(name):
+            change = (result["value"] - base["value"]) / base["value"] * 100
+            if not result["higher_is_better"]:
+                change = -change
+            line += f"  {change:+.1f}% {'better' if change >= 0 else 'worse'}"
+        lines.append(line)
+    return lines
+
+
+def main(scale: float = 1.0, rounds: int = 3) -> dict[str, Any]:
+    """Run the benchmarks in a new event loop."""
+    return asyncio.run(run_benchmarks(scale, rounds))
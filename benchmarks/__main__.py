@@ -0,0 +1,23 @@
+"""Command line entry point of the benchmarks.
+
+python -m benchmarks --output results.json --baseline previous.json
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from . import compare, main
+
+parser = argparse.ArgumentParser(prog="python -m benchmarks")
+parser.add_argument("--scale", type=float, default=1.0, help="multiplier of rows")
+parser.add_argument("--rounds", type=int, default=3, help="rounds per benchmark")
+parser.add_argument("--output", type=Path, help="file to write the JSON results to")
+parser.add_argument("--baseline", type=Path, help="JSON results to compare with")
+args = parser.parse_args()
+
+results = main(args.scale, args.rounds)
+baseline = json.loads(args.baseline.read_text()) if args.baseline else {"results": {}}
+print("\n".join(compare(baseline, results)))
+if args.output:
+    args.output.write_text(json.dumps(results, indent=2))
@@ -0,0 +1,342 @@
+"""Local indexes of access group memberships and of the access group hierarchy."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Iterable
+from datetime import UTC, datetime
+from typing import Any
+
+from . import models
+from .changes import CardholderChangeFollower
+from .client import MAX_CONCURRENT_REQUESTS, Client
+from .utils import id_from_href
+
+_LOGGER = logging.getLogger(__name__)
+
+MEMBERSHIP_FIELDS = ["id", "accessGroups"]
+
+Validity = tuple[datetime | None, datetime | None]
+
+
+def _validity(membership: models.FTAccessGroupMembership) -> Validity:
+    """Return the from and until times of a membership. Naive times are local."""
+    active_from, active_until = membership.active_from, membership.active_until
+    return (
+        active_from and active_from.astimezone(),
+        active_until and active_until.astimezone(),
+    )
+
+
+def _is_valid(validity: Validity, at: datetime) -> bool:
+    """Return True if a membership is active at a time."""
+    active_from, active_until = validity
+    return (active_from is None or active_from <= at) and (
+        active_until is None or at < active_until
+    )
+
+
+class AccessGroupMemberships(CardholderChangeFollower):
+    """Bidirectional index of the cardholders of every access group.
+
+    Seed it once with load(), then call sync() periodically (or feed it the
+    batches of yield_cardholder_changes through apply_changes()) to keep it fresh.
+    Both "members of a group" and "groups of a cardholder" are dict lookups.
+    Memberships keep their from and until times, and queries only return the
+    memberships active at the given time, now by default. A cardholder can be a
+    member of the same group for several periods; it is a member while any of
+    them is active.
+    """
+
+    def __init__(
+        self, client: Client, *, max_concurrency: int = MAX_CONCURRENT_REQUESTS
+    ) -> None:
+        """Initialize the index.
+
+        Args:
+            client: An initialized Gallagher client.
+            max_concurrency: Maximum number of access groups fetched at the same time.
+        """
+        self.client = client
+        self.max_concurrency = max_concurrency
+        self.changes_href: str | None = None
+        self._groups_by_cardholder: dict[str, dict[str, list[Validity]]] = {}
+        self._cardholders_by_group: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of cardholders with memberships."""
+        return len(self._groups_by_cardholder)
+
+    async def load(self) -> None:
+        """Seed the index with the members of every access group.
+
+        The access groups are listed first, then their members are fetched
+        concurrently. The changes href is requested before the export starts so
+        that changes made during the export are picked up by the next sync().
+        """
+        self.changes_href = await self.client.get_cardholder_changes_href(
+            filter=["accessGroups"], cardholder_fields=MEMBERSHIP_FIELDS
+        )
+        self._groups_by_cardholder.clear()
+        self._cardholders_by_group.clear()
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def load_members(group: models.FTAccessGroup) -> None:
+            if not group.cardholders:
+                return
+            group_id = group.id or id_from_href(group.cardholders.href)
+            async with semaphore:
+                async for page in self.client._yield_pages(
+                    group.cardholders.href, results_key="cardholders"
+                ):
+                    for item in page:
+                        if not (href := (item.get("cardholder") or {}).get("href")):
+                            continue
+                        membership = models.FTAccessGroupMembership.model_validate(item)
+                        self._add(id_from_href(href), group_id, _validity(membership))
+
+        tasks: list[asyncio.Task[None]] = []
+        async for groups in self.client.yield_access_groups(
+            response_fields=["id", "href", "cardholders"]
+        ):
+            tasks.extend(asyncio.create_task(load_members(group)) for group in groups)
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+        _LOGGER.debug(
+            "Access group memberships loaded for %s access groups", len(tasks)
+        )
+
+    def _upsert(self, id: str, href: str, change: models.CardholderChange) -> None:
+        """Index the memberships of an added or updated cardholder.
+
+        The access groups of a change replace all the memberships of its
+        cardholder. Changes without access groups leave the index as is.
+        """
+        if change.cardholder is not None and isinstance(
+            change.cardholder.access_groups, list
+        ):
+            self._store(id, change.cardholder.access_groups)
+        elif change.new_values and isinstance(
+            access_groups := change.new_values.get("accessGroups"), list
+        ):
+            self._store(
+                id,
+                [
+                    models.FTAccessGroupMembership.model_validate(item)
+                    for item in access_groups
+                ],
+            )
+
+    def groups_of(self, cardholder_id: str, at: datetime | None = None) -> set[str]:
+        """Return the IDs of the access groups a cardholder is a member of.
+
+        Args:
+            cardholder_id: The cardholder ID.
+            at: Only memberships active at this time. Defaults to now.
+                A naive time is taken as local time.
+        """
+        at = at.astimezone() if at else datetime.now(UTC)
+        return {
+            group_id
+            for group_id, validities in self._groups_by_cardholder.get(
+                cardholder_id, {}
+            ).items()
+            if any(_is_valid(validity, at) for validity in validities)
+        }
+
+    def members_of(self, group_id: str, at: datetime | None = None) -> set[str]:
+        """Return the IDs of the cardholders who are members of an access group.
+
+        Args:
+            group_id: The access group ID.
+            at: Only memberships active at this time. Defaults to now.
+                A naive time is taken as local time.
+        """
+        at = at.astimezone() if at else datetime.now(UTC)
+        return {
+            cardholder_id
+            for cardholder_id in self._cardholders_by_group.get(group_id, ())
+            if any(
+                _is_valid(validity, at)
+                for validity in self._groups_by_cardholder[cardholder_id][group_id]
+            )
+        }
+
+    def validities(self, cardholder_id: str, group_id: str) -> list[Validity]:
+        """Return the from and until times of every membership of a cardholder."""
+        return list(self._groups_by_cardholder.get(cardholder_id, {}).get(group_id, ()))
+
+    def _add(self, cardholder_id: str, group_id: str, validity: Validity) -> None:
+        """Add a membership to both maps."""
+        self._groups_by_cardholder.setdefault(cardholder_id, {}).setdefault(
+            group_id, []
+        ).append(validity)
+        self._cardholders_by_group.setdefault(group_id, set()).add(cardholder_id)
+
+    def _store(
+        self, cardholder_id: str, memberships: Iterable[models.FTAccessGroupMembership]
+    ) -> None:
+        """Replace the memberships of a cardholder."""
+        self._remove(cardholder_id)
+        for membership in memberships:
+            group: Any = membership.access_group
+            if group is None or not (group.id or group.href):
+                continue
+            self._add(
+                cardholder_id,
+                group.id or id_from_href(group.href),
+                _validity(membership),
+            )
+
+    def _remove(self, id: str) -> None:
+        """Remove all the memberships of a cardholder."""
+        for group_id in self._groups_by_cardholder.pop(id, {}):
+            if members := self._cardholders_by_group.get(group_id):
+                members.discard(id)
+                if not members:
+                    del self._cardholders_by_group[group_id]
+
+
+class AccessGroupHierarchy:
+    """Cache of the access group tree with precomputed ancestors and descendants.
+
+    Members of an access group also get the access of its parent groups, so the
+    effective groups of a cardholder are its groups and all their ancestors.
+    Ancestor and descendant checks are set lookups.
+
+        hierarchy = AccessGroupHierarchy(client, memberships)
+        await hierarchy.load()
+        hierarchy.is_descendant("352", "349")
+        hierarchy.effective_groups_of("325")
+
+    Call invalidate() when access groups are added, moved or removed, the next
+    ensure_loaded() fetches the tree again. Queries raise until it is loaded.
+    """
+
+    def __init__(
+        self, client: Client, memberships: AccessGroupMemberships | None = None
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            client: An initialized Gallagher client.
+            memberships: The membership index used by effective_groups_of().
+        """
+        self.client = client
+        self.memberships = memberships
+        self._parents: dict[str, str | None] = {}
+        self._ancestors: dict[str, frozenset[str]] = {}
+        self._descendants: dict[str, frozenset[str]] = {}
+        self._loaded = False
+
+    def __len__(self) -> int:
+        """Return the number of access groups."""
+        return len(self._parents)
+
+    async def load(self) -> None:
+        """Fetch all the access groups and compute the closures."""
+        parents: dict[str, str | None] = {}
+        async for groups in self.client.yield_access_groups(
+            response_fields=["id", "href", "parent"]
+        ):
+            for group in groups:
+                if group_id := group.id or (group.href and id_from_href(group.href)):
+                    parents[group_id] = (
+                        id_from_href(group.parent.href)
+                        if group.parent and group.parent.href
+                        else None
+                    )
+        self._build(parents)
+        _LOGGER.debug("Access group hierarchy loaded %s access groups", len(self))
+
+    async def ensure_loaded(self) -> None:
+        """Load the access groups unless they are cached."""
+        if not self._loaded:
+            await self.load()
+
+    def invalidate(self) -> None:
+        """Drop the cached hierarchy."""
+        self._parents, self._ancestors, self._descendants = {}, {}, {}
+        self._loaded = False
+
+    def _build(self, parents: dict[str, str | None]) -> None:
+        """Compute the ancestors and descendants of every group."""
+        ancestors: dict[str, frozenset[str]] = {}
+        for group_id in parents:
+            # Walk up to the root or to a group with known ancestors
+            path: list[str] = []
+            current: str | None = group_id
+            while current is not None and current not in ancestors:
+                if current in path:
+                    _LOGGER.warning("Access group %s is its own ancestor", current)
+                    current = None
+                    break
+                path.append(current)
+                current = parents.get(current)
+            above = (
+                ancestors[current] | {current} if current is not None else frozenset()
+            )
+            for node in reversed(path):
+                ancestors[node] = above
+                above = above | {node}
+        descendants: dict[str, set[str]] = {group_id: set() for group_id in parents}
+        for group_id, group_ancestors in ancestors.items():
+            for ancestor in group_ancestors:
+                descendants.setdefault(ancestor, set()).add(group_id)
+        self._parents = parents
+        self._ancestors = ancestors
+        self._descendants = {
+            group_id: frozenset(ids) for group_id, ids in descendants.items()
+        }
+        self._loaded = True
+
+    def _check_loaded(self) -> None:
+        """Raise if the hierarchy is not loaded, or was invalidated."""
+        if not self._loaded:
+            raise ValueError("The hierarchy must be loaded before querying it")
+
+    def parent(self, group_id: str) -> str | None:
+        """Return the ID of the parent of an access group."""
+        self._check_loaded()
+        return self._parents.get(group_id)
+
+    def ancestors(self, group_id: str) -> frozenset[str]:
+        """Return the IDs of the parent, grandparent and so on of an access group."""
+        self._check_loaded()
+        return self._ancestors.get(group_id, frozenset())
+
+    def descendants(self, group_id: str) -> frozenset[str]:
+        """Return the IDs of the children, grandchildren and so on of an access group."""
+        self._check_loaded()
+        return self._descendants.get(group_id, frozenset())
+
+    def is_descendant(self, group_id: str, ancestor_id: str) -> bool:
+        """Return True if an access group is below another one in the tree."""
+        self._check_loaded()
+        return ancestor_id in self._ancestors.get(group_id, ())
+
+    def effective_groups(self, group_ids: Iterable[str]) -> set[str]:
+        """Return access groups together with all their ancestors."""
+        self._check_loaded()
+        effective: set[str] = set()
+        for group_id in group_ids:
+            effective.add(group_id)
+            effective |= self._ancestors.get(group_id, frozenset())
+        return effective
+
+    def effective_groups_of(
+        self, cardholder_id: str, at: datetime | None = None
+    ) -> set[str]:
+        """Return the access groups a cardholder gets access from.
+
+        Args:
+            cardholder_id: The cardholder ID.
+            at: Only memberships active at this time. Defaults to now.
+        """
+        if self.memberships is None:
+            raise ValueError("A membership index is required")
+        return self.effective_groups(self.memberships.groups_of(cardholder_id, at))
@@ -0,0 +1,237 @@
+"""Streaming aggregation of events over tumbling and sliding time windows."""
+
+from __future__ import annotations
+
+import inspect
+import math
+import time
+from array import array
+from collections.abc import AsyncIterable, Awaitable, Callable, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+
+from . import models
+from .columnar import StringTable
+from .utils import ref_id
+
+AGGREGATION_WINDOW = timedelta(minutes=1)
+AGGREGATION_DELAY = timedelta(seconds=5)
+
+KEY_FIELDS = ("group", "type", "division", *models.EVENT_ITEM_FIELDS)
+
+
+@dataclass(slots=True)
+class WindowResult:
+    """The counters of a closed window.
+
+    Attributes:
+        start: Start of the window, inclusive.
+        end: End of the window, exclusive.
+        counts: The count of every key with events, per measure.
+    """
+
+    start: datetime
+    end: datetime
+    counts: dict[str, dict[str, int]]
+
+    def rate(self, measure: str, of: str = "count") -> dict[str, float]:
+        """Return the ratio of two measures for every key of the second one."""
+        numerators = self.counts.get(measure, {})
+        return {
+            key: numerators.get(key, 0) / total
+            for key, total in self.counts.get(of, {}).items()
+        }
+
+
+class EventAggregator:
+    """Count events per key over tumbling or sliding event-time windows.
+
+    The window is split into buckets of one slide each. Every bucket holds one
+    counter array per measure, indexed by the code of the key in a StringTable,
+    and running totals over the window are kept alongside. Adding an event is
+    O(1); closing a bucket costs one pass over the keys.
+
+        aggregator = EventAggregator(
+            "door",
+            measures={"count": None, "denied": lambda event: event.group.id == "2"},
+            on_window=publish,
+        )
+        await aggregator.feed(client.yield_new_events())
+
+    Events older than the open window are dropped and counted in late.
+    """
+
+    def __init__(
+        self,
+        key: str | Callable[[models.FTEvent], str | None] = "source",
+        *,
+        window: timedelta = AGGREGATION_WINDOW,
+        slide: timedelta | None = None,
+        measures: Mapping[str, Callable[[models.FTEvent], bool] | None] | None = None,
+        on_window: Callable[[WindowResult], Awaitable[None] | None] | None = None,
+        delay: timedelta = AGGREGATION_DELAY,
+    ) -> None:
+        """Initialize the aggregator.
+
+        Args:
+            key: One of KEY_FIELDS, or a function returning the key of an event.
+                Events without a key are not counted.
+            window: The length of the windows.
+            slide: How often a sliding window is emitted. The window must be a
+                multiple of it. None for tumbling windows.
+            measures: The name of every counter and the predicate of the events it
+                counts, None to count all events. Defaults to a single "count".
+            on_window: Called, or awaited, with every closed window by process()
+                and feed().
+            delay: How long feed() waits past the end of a window, by the clock,
+                for late events before closing it.
+        """
+        slide = slide or window
+        buckets = window / slide
+        if slide <= timedelta(0) or buckets < 1 or buckets != int(buckets):
+            raise ValueError("window must be a positive multiple of slide")
+        if isinstance(key, str):
+            if key not in KEY_FIELDS:
+                raise ValueError(f"key must be one of {', '.join(KEY_FIELDS)}")
+            field = key
+            self._key: Callable[[models.FTEvent], str | None] = lambda event: ref_id(
+                getattr(event, field)
+            )
+        else:
+            self._key = key
+        measures = measures or {"count": None}
+        self.measures = list(measures)
+        self._predicates = list(measures.values())
+        self.on_window = on_window
+        self.delay = delay.total_seconds()
+        self.keys = StringTable()
+        self.late = 0
+        self._slide = slide.total_seconds()
+        self._size = int(buckets)
+        self._buckets = [[array("L") for _ in self.measures] for _ in range(self._size)]
+        self._bucket_events = [0] * self._size
+        self._totals = [array("L") for _ in self.measures]
+        self._window_events = 0
+        self._current: int | None = None
+
+    def _grow(self, size: int) -> None:
+        """Extend all counter arrays to hold size keys."""
+        missing = size - len(self._totals[0])
+        for counters in (*self._buckets, self._totals):
+            for counter in counters:
+                counter.extend([0] * missing)
+
+    def _close(self, bucket: int) -> WindowResult | None:
+        """Close a bucket and return the window ending with it, None if empty."""
+        result = None
+        if self._window_events:
+            end = (bucket + 1) * self._slide
+            values = self.keys.values
+            result = WindowResult(
+                datetime.fromtimestamp(end - self._size * self._slide, UTC),
+                datetime.fromtimestamp(end, UTC),
+                {
+                    measure: {
+                        values[code]: count for code, count in enumerate(total) if count
+                    }
+                    for measure, total in zip(self.measures, self._totals, strict=True)
+                },
+            )
+        # The oldest bucket leaves the window
+        slot = (bucket + 1) % self._size
+        if self._bucket_events[slot]:
+            for total, counter in zip(self._totals, self._buckets[slot], strict=True):
+                for code, count in enumerate(counter):
+                    if count:
+                        total[code] -= count
+                        counter[code] = 0
+            self._window_events -= self._bucket_events[slot]
+            self._bucket_events[slot] = 0
+        return result
+
+    def _advance(self, bucket: int) -> list[WindowResult]:
+        """Close the buckets before a bucket and return the non-empty windows."""
+        results: list[WindowResult] = []
+        if self._current is None:
+            self._current = bucket
+        while self._current < bucket:
+            if not self._window_events:
+                # Nothing left to emit, skip the idle buckets
+                self._current = bucket
+                break
+            if result := self._close(self._current):
+                results.append(result)
+            self._current += 1
+        return results
+
+    def add(self, events: Iterable[models.FTEvent]) -> list[WindowResult]:
+        """Count events and return the windows they closed.
+
+        Windows close on event time, when an event of a later bucket arrives.
+        """
+        results: list[WindowResult] = []
+        for event in events:
+            bucket = math.floor(event.time.timestamp() / self._slide)
+            if self._current is None or bucket > self._current:
+                results.extend(self._advance(bucket))
+            elif bucket <= self._current - self._size:
+                self.late += 1
+                continue
+            if (key := self._key(event)) is None:
+                continue
+            if (code := self.keys.code(key)) >= len(self._totals[0]):
+                self._grow(len(self.keys))
+            slot = bucket % self._size
+            counted = False
+            for index, predicate in enumerate(self._predicates):
+                if predicate is None or predicate(event):
+                    self._buckets[slot][index][code] += 1
+                    self._totals[index][code] += 1
+                    counted = True
+            if counted:
+                self._bucket_events[slot] += 1
+                self._window_events += 1
+        return results
+
+    def advance(self, now: datetime | float | None = None) -> list[WindowResult]:
+        """Close the windows ending before a time and return them.
+
+        Args:
+            now: A datetime or POSIX timestamp. Defaults to the clock minus delay.
+        """
+        if now is None:
+            timestamp = time.time() - self.delay
+        elif isinstance(now, datetime):
+            timestamp = now.timestamp()
+        else:
+            timestamp = now
+        return self._advance(math.floor(timestamp / self._slide))
+
+    def flush(self) -> list[WindowResult]:
+        """Close the open bucket and return the remaining non-empty windows."""
+        if self._current is None:
+            return []
+        return self._advance(self._current + self._size)
+
+    async def _emit(self, results: list[WindowResult]) -> None:
+        """Pass closed windows to on_window."""
+        if self.on_window is None:
+            return
+        for result in results:
+            if inspect.isawaitable(awaitable := self.on_window(result)):
+                await awaitable
+
+    async def process(self, events: Iterable[models.FTEvent]) -> None:
+        """Count events and pass the windows they closed to on_window."""
+        await self._emit(self.add(events))
+
+    async def feed(self, stream: AsyncIterable[list[models.FTEvent]]) -> None:
+        """Aggregate a live stream, like yield_new_events(), until it ends.
+
+        Windows are also closed by the clock after every batch, so quiet periods
+        still emit their windows once the delay has passed.
+        """
+        async for events in stream:
+            await self.process(events)
+            await self._emit(self.advance())
+        await self._emit(self.flush())
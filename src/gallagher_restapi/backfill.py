@@ -0,0 +1,225 @@
+"""Parallel backfill of historical events."""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+import os
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import IO, Any
+
+from . import models
+from .client import MAX_CONCURRENT_REQUESTS, Client
+from .utils import open_partial
+
+BACKFILL_WINDOW = timedelta(days=1)
+BACKFILL_BUFFERED_PAGES = 4
+
+
+def _write_events(file: IO[str], page: list[dict[str, Any]]) -> None:
+    """Write raw events to a file, one JSON object per line."""
+    file.writelines(f"{json.dumps(event)}\n" for event in page)
+
+
+@dataclass
+class BackfillProgress:
+    """Progress of a backfill run."""
+
+    windows: int
+    completed: int = 0
+    events: int = 0
+
+    @property
+    def fraction(self) -> float:
+        """Return the fraction of windows completed."""
+        return self.completed / self.windows if self.windows else 1.0
+
+
+class EventBackfill:
+    """Fetch the events of a time range as concurrent time windows.
+
+    yield_events() follows a single next chain, so a long range is fetched one page
+    at a time. The backfill splits the after/before range of the query into windows,
+    fetches up to max_concurrency windows at once and merges them back in time
+    order.
+
+        backfill = EventBackfill(client, models.EventQuery(after=start, before=end))
+        async for events in backfill.stream():
+            ...
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        event_filter: models.EventQuery,
+        *,
+        window: timedelta = BACKFILL_WINDOW,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+        progress: Callable[[BackfillProgress], Awaitable[None] | None] | None = None,
+    ) -> None:
+        """Initialize the backfill.
+
+        Args:
+            client: An initialized Gallagher client.
+            event_filter: The events to fetch. It must have an after time. The
+                before time defaults to now. Naive times are taken as local time.
+            window: The length of the time windows fetched concurrently.
+            max_concurrency: Maximum number of windows fetched at the same time.
+            progress: Called, or awaited, after every completed window.
+        """
+        if event_filter.after is None:
+            raise ValueError("event_filter must have an after time")
+        if event_filter.previous:
+            raise ValueError(
+                "previous is not supported, events are fetched oldest first"
+            )
+        if window <= timedelta(0):
+            raise ValueError("window must be positive")
+        self.client = client
+        self.event_filter = event_filter
+        self.after = event_filter.after.astimezone()
+        self.before = (event_filter.before or datetime.now()).astimezone()
+        self.window = window
+        self.max_concurrency = max_concurrency
+        self.progress = progress
+
+    def windows(self) -> list[tuple[datetime, datetime]]:
+        """Return the start and end of every window, oldest first."""
+        windows: list[tuple[datetime, datetime]] = []
+        start = self.after
+        while start < self.before:
+            end = min(start + self.window, self.before)
+            windows.append((start, end))
+            start = end
+        return windows
+
+    async def _fetch_window(
+        self,
+        window: tuple[datetime, datetime],
+        emit: Callable[[list[dict[str, Any]]], Awaitable[None]],
+        progress: BackfillProgress,
+    ) -> None:
+        """Fetch the raw events of a window and pass every page to emit.
+
+        Windows after the first are requested from just before their start, so an
+        event exactly on a boundary is returned whether the server treats the
+        after time as inclusive or not. Events before the start or from the end of
+        the window on are dropped, so boundary events are delivered once.
+        """
+        start, end = window
+        query = self.event_filter.model_copy(
+            update={
+                "after": start
+                if start == self.after
+                else start - timedelta(microseconds=1),
+                "before": end,
+            }
+        )
+        async for page in self.client._yield_pages(
+            self.client.api_features.events(),
+            params=await self.client._event_filter_ids(query),
+            results_key="events",
+            stop_on_empty=True,
+        ):
+            events = [
+                event
+                for event in page
+                if start <= (time := datetime.fromisoformat(event["time"]))
+                and (time < end or end == self.before)
+            ]
+            progress.events += len(events)
+            await emit(events)
+        progress.completed += 1
+        if self.progress and inspect.isawaitable(result := self.progress(progress)):
+            await result
+
+    async def stream(self) -> AsyncGenerator[list[models.FTEvent]]:
+        """Yield the events of all windows in time order.
+
+        The oldest window is streamed page by page while the next windows are
+        fetched in the background. Every window buffers at most
+        BACKFILL_BUFFERED_PAGES pages, then waits for the consumer to catch up.
+
+        Yields:
+            A list of FTEvent objects per page.
+        """
+        windows = self.windows()
+        progress = BackfillProgress(len(windows))
+        queues: dict[int, asyncio.Queue[list[dict[str, Any]] | None]] = {}
+        tasks: dict[int, asyncio.Task[None]] = {}
+
+        async def fetch(
+            window: tuple[datetime, datetime],
+            queue: asyncio.Queue[list[dict[str, Any]] | None],
+        ) -> None:
+            try:
+                await self._fetch_window(window, queue.put, progress)
+            except Exception:
+                # Let the consumer reach the error
+                await queue.put(None)
+                raise
+            await queue.put(None)
+
+        def start(index: int) -> None:
+            if index < len(windows):
+                queue = queues[index] = asyncio.Queue(BACKFILL_BUFFERED_PAGES)
+                tasks[index] = asyncio.create_task(fetch(windows[index], queue))
+
+        try:
+            for index in range(self.max_concurrency):
+                start(index)
+            for index in range(len(windows)):
+                queue = queues.pop(index)
+                while (page := await queue.get()) is not None:
+                    if page:
+                        yield self.client._validate(
+                            models.FTEvent, page, self.client.api_features.events()
+                        )
+                await tasks.pop(index)
+                start(index + self.max_concurrency)
+        finally:
+            for task in tasks.values():
+                task.cancel()
+
+    async def to_files(self, directory: str | os.PathLike[str]) -> list[Path]:
+        """Write the raw events of every window to its own JSON lines file.
+
+        Windows are written concurrently, off the event loop. Files that already
+        exist are kept, so an interrupted export resumes with the missing windows.
+        A window is written to a temporary file first, so a failed window leaves
+        no file behind.
+
+        Args:
+            directory: The directory the files are written to.
+
+        Returns:
+            The file of every window, oldest first.
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        windows = self.windows()
+        progress = BackfillProgress(len(windows))
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def export(window: tuple[datetime, datetime]) -> Path:
+            start, end = window
+            path = (
+                directory
+                / f"events_{start:%Y%m%dT%H%M%S%z}_{end:%Y%m%dT%H%M%S%z}.jsonl"
+            )
+            if await asyncio.to_thread(path.exists):
+                progress.completed += 1
+                return path
+            async with semaphore, open_partial(path, "w", encoding="utf-8") as file:
+
+                async def write(page: list[dict[str, Any]]) -> None:
+                    await asyncio.to_thread(_write_events, file, page)
+
+                await self._fetch_window(window, write, progress)
+            return path
+
+        return list(await asyncio.gather(*(export(window) for window in windows)))
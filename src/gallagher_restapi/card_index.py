@@ -0,0 +1,135 @@
+"""Local index resolving cards to cardholders, kept fresh through cardholder changes."""
+
+from __future__ import annotations
+
+import logging
+import sys
+from collections.abc import Iterable
+from typing import Any
+
+from . import models
+from .changes import CardholderChangeFollower
+from .client import Client
+
+_LOGGER = logging.getLogger(__name__)
+
+CARD_INDEX_FIELDS = ["id", "cards"]
+CARD_KEY_KINDS = ("number", "serial_number", "href")
+
+CardKey = tuple[str, str]
+
+
+def _card_keys(card: models.FTCardholderCard | dict[str, Any]) -> tuple[CardKey, ...]:
+    """Return the kind and value of the number, serial number and href of a card."""
+    if isinstance(card, dict):
+        values = (card.get("number"), card.get("cardSerialNumber"), card.get("href"))
+    else:
+        values = (card.number, card.card_serial_number, card.href)
+    return tuple(
+        (kind, sys.intern(value))
+        for kind, value in zip(CARD_KEY_KINDS, values, strict=True)
+        if value
+    )
+
+
+class CardIndex(CardholderChangeFollower):
+    """Resolve card numbers, card serial numbers and card hrefs to cardholder IDs.
+
+    Seed it once with load(), then call sync() periodically (or feed it the
+    batches of yield_cardholder_changes through apply_changes()) to keep it fresh.
+    Numbers, serial numbers and hrefs are kept in separate maps, so a number
+    never resolves to the card that has it as serial number. Keys and IDs are
+    interned strings, and only the keys of every cardholder are kept, not the
+    cards themselves.
+
+    Card numbers are unique per card type, so sites issuing the same number on
+    several card types should resolve by serial number or href instead.
+    """
+
+    def __init__(self, client: Client) -> None:
+        """Initialize the index.
+
+        Args:
+            client: An initialized Gallagher client.
+        """
+        self.client = client
+        self.changes_href: str | None = None
+        self._cardholder_by_key: dict[str, dict[str, str]] = {
+            kind: {} for kind in CARD_KEY_KINDS
+        }
+        self._keys_by_cardholder: dict[str, tuple[CardKey, ...]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of indexed cardholders."""
+        return len(self._keys_by_cardholder)
+
+    async def load(self, *, top: int = 1000) -> None:
+        """Seed the index with a full export of the cardholder cards.
+
+        The changes href is requested before the export starts so that
+        changes made during the export are picked up by the next sync().
+
+        Args:
+            top: Number of cardholders requested per page.
+        """
+        self.changes_href = await self.client.get_cardholder_changes_href(
+            filter=["cards"], cardholder_fields=CARD_INDEX_FIELDS
+        )
+        for cardholder_by_key in self._cardholder_by_key.values():
+            cardholder_by_key.clear()
+        self._keys_by_cardholder.clear()
+        async for cardholders in self.client.yield_cardholders(
+            response_fields=CARD_INDEX_FIELDS, top=top
+        ):
+            for cardholder in cardholders:
+                if cardholder.id and isinstance(cardholder.cards, list):
+                    self._store(cardholder.id, cardholder.cards)
+        _LOGGER.debug(
+            "Card index loaded %s cards", len(self._cardholder_by_key["href"])
+        )
+
+    def _upsert(self, id: str, href: str, change: models.CardholderChange) -> None:
+        """Index the cards of an added or updated cardholder.
+
+        The cards of a change replace all the indexed cards of its cardholder.
+        Changes without cards leave the index as is.
+        """
+        if change.cardholder is not None and isinstance(change.cardholder.cards, list):
+            self._store(id, change.cardholder.cards)
+        elif change.new_values and isinstance(
+            cards := change.new_values.get("cards"), list
+        ):
+            self._store(id, cards)
+
+    def cardholder_id(self, key: str, kind: str = "number") -> str | None:
+        """Return the ID of the cardholder of a card.
+
+        Args:
+            key: The card number, card serial number or card href.
+            kind: One of CARD_KEY_KINDS, the kind of key.
+        """
+        if (cardholder_by_key := self._cardholder_by_key.get(kind)) is None:
+            raise ValueError(f"kind must be one of {', '.join(CARD_KEY_KINDS)}")
+        return cardholder_by_key.get(key)
+
+    def _store(
+        self, id: str, cards: Iterable[models.FTCardholderCard | dict[str, Any]]
+    ) -> None:
+        """Index the cards of a cardholder, replacing its previous cards."""
+        self._remove(id)
+        id = sys.intern(id)
+        if not (keys := tuple(key for card in cards for key in _card_keys(card))):
+            return
+        for kind, key in keys:
+            cardholder_by_key = self._cardholder_by_key[kind]
+            if (other := cardholder_by_key.get(key)) not in (None, id):
+                _LOGGER.debug("Card %s moved from cardholder %s to %s", key, other, id)
+            cardholder_by_key[key] = id
+        self._keys_by_cardholder[id] = keys
+
+    def _remove(self, id: str) -> None:
+        """Remove the cards of a cardholder."""
+        for kind, key in self._keys_by_cardholder.pop(id, ()):
+            cardholder_by_key = self._cardholder_by_key[kind]
+            if cardholder_by_key.get(key) == id:
+                del cardholder_by_key[key]
@@ -0,0 +1,168 @@
+"""Helpers for processing cardholder change batches."""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+from typing import TYPE_CHECKING
+
+from .models import CardholderChange, CardholderChangeType
+from .utils import id_from_href
+
+if TYPE_CHECKING:
+    from .client import Client
+
+
+def change_href(change: CardholderChange) -> str | None:
+    """Return the href of the cardholder of a change, None if it has none."""
+    if change.item and change.item.href:
+        return change.item.href
+    if change.cardholder and change.cardholder.href:
+        return change.cardholder.href
+    return None
+
+
+class CardholderChangeFollower(ABC):
+    """Base of the local indexes kept fresh through cardholder changes.
+
+    Subclasses request changes_href in load(), before their export starts, and
+    implement how an added, updated or removed cardholder changes the index.
+    """
+
+    client: Client
+    changes_href: str | None
+
+    def apply_changes(self, changes: Iterable[CardholderChange]) -> None:
+        """Merge a batch of cardholder changes into the index.
+
+        Changes without a cardholder href are skipped.
+        """
+        for change in changes:
+            if not (href := change_href(change)):
+                continue
+            id = id_from_href(href)
+            if change.type == CardholderChangeType.REMOVE:
+                self._remove(id)
+            else:
+                self._upsert(id, href, change)
+
+    @abstractmethod
+    def _upsert(self, id: str, href: str, change: CardholderChange) -> None:
+        """Merge an added or updated cardholder into the index."""
+
+    @abstractmethod
+    def _remove(self, id: str) -> None:
+        """Remove a cardholder from the index."""
+
+    async def sync(self) -> list[CardholderChange]:
+        """Fetch the pending cardholder changes and apply them.
+
+        Returns:
+            The list of applied CardholderChange objects.
+        """
+        if self.changes_href is None:
+            raise ValueError(f"{type(self).__name__} must be loaded before syncing")
+        changes, self.changes_href = await self.client.get_cardholder_changes(
+            self.changes_href
+        )
+        self.apply_changes(changes)
+        return changes
+
+
+def _merge(net: CardholderChange, change: CardholderChange) -> CardholderChange | None:
+    """Merge a later change of the same cardholder into the net change.
+
+    Returns None when the two changes cancel each other out.
+    """
+    net_type, change_type = net.type, change.type
+    if net_type == CardholderChangeType.ADD:
+        if change_type == CardholderChangeType.REMOVE:
+            return None
+        change_type = CardholderChangeType.ADD
+    elif net_type == CardholderChangeType.REMOVE:
+        if change_type == CardholderChangeType.ADD:
+            change_type = CardholderChangeType.UPDATE
+    old_values = (
+        None
+        if change_type == CardholderChangeType.ADD
+        else (change.old_values or {}) | (net.old_values or {})
+    )
+    new_values = (
+        None
+        if change_type == CardholderChangeType.REMOVE
+        else (net.new_values or {}) | (change.new_values or {})
+    )
+    return change.model_copy(
+        update={
+            "type": change_type,
+            "old_values": old_values or None,
+            "new_values": new_values or None,
+        }
+    )
+
+
+def _drop_unchanged(change: CardholderChange) -> CardholderChange | None:
+    """Drop the fields of an update that were set back to their old value.
+
+    Returns None if nothing is left of the update.
+    """
+    if change.type != CardholderChangeType.UPDATE:
+        return change
+    if change.old_values is None or change.new_values is None:
+        return change
+    old_values = change.old_values
+    new_values = {
+        key: value
+        for key, value in change.new_values.items()
+        if key not in old_values or old_values[key] != value
+    }
+    if not new_values:
+        return None
+    return change.model_copy(
+        update={
+            "old_values": {
+                key: value
+                for key, value in old_values.items()
+                if key in new_values or key not in change.new_values
+            },
+            "new_values": new_values,
+        }
+    )
+
+
+def compact_cardholder_changes(
+    changes: Iterable[CardholderChange],
+) -> list[CardholderChange]:
+    """Collapse a batch of cardholder changes into one net change per cardholder.
+
+    - Successive updates merge into one update keeping the first old values
+      and the last new values. Fields set back to their old value are dropped.
+    - An add followed by updates becomes a single add with the merged values.
+    - An add followed by a remove cancels out.
+    - The net changes keep the order in which each cardholder first changed.
+
+    Changes without an item href are passed through unchanged.
+
+    Args:
+        changes: The cardholder changes in the order they were returned by the server.
+
+    Returns:
+        The compacted list of CardholderChange objects.
+    """
+    net_changes: dict[object, CardholderChange | None] = {}
+    for change in changes:
+        if not (change.item and change.item.href):
+            net_changes[object()] = change
+            continue
+        href = change.item.href
+        if (net := net_changes.get(href)) is not None:
+            net_changes[href] = _merge(net, change)
+        else:
+            # A cardholder whose changes cancelled out moves to the end if it changes again.
+            net_changes.pop(href, None)
+            net_changes[href] = change
+    return [
+        compacted
+        for net in net_changes.values()
+        if net is not None and (compacted := _drop_unchanged(net)) is not None
+    ]
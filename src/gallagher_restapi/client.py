@@ -2,21 +2,42 @@
 
 import asyncio
 import base64
+import inspect
 import logging
-from collections.abc import AsyncGenerator
+import os
+import random
+import time
+from collections.abc import AsyncGenerator, AsyncIterator, Awaitable, Callable, Iterable
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from enum import StrEnum
 from json import JSONDecodeError
+from pathlib import Path
 from ssl import SSLError
-from typing import Any, cast
+from typing import IO, Any, TypeVar, cast
 
 import httpx
 
 from . import models
+from .changes import compact_cardholder_changes
+from .columnar import EventBatch, StringTable
+from .diff import diff_cardholder
 from .exceptions import ConnectError, GllApiError, RequestError, UnauthorizedError
+from .hooks import RequestHooks, RequestInfo, ResponseInfo, endpoint_family
+from .records import EventRecord, StatusRecord
+from .utils import open_partial
 
 _LOGGER = logging.getLogger(__name__)
 
+_ModelT = TypeVar("_ModelT", bound=models.FTModel)
+
+MAX_CONCURRENT_REQUESTS = 10
+IMAGE_CHUNK_SIZE = 64 * 1024
+POLL_MIN_DELAY = 1.0
+POLL_MAX_DELAY = 30.0
+LONG_POLL_MAX_DELAY = POLL_MIN_DELAY
+LOG_BODY_LIMIT = 2048
+
 
 class CloudGateway(StrEnum):
     """Cloud Gateways."""
@@ -25,7 +46,79 @@ class CloudGateway(StrEnum):
     US_GATEWAY = "commandcentre-api-us.security.gallagher.cloud"
 
 
+class PollScheduler:
+    """Adaptive delay between the polls of an update stream.
+
+    After a non-empty batch the next poll is sent immediately to drain any
+    backlog. Every empty batch doubles the delay, from min_delay up to max_delay.
+
+    Endpoints that answer straight away, like cardholder changes, back off while
+    idle. The event and alarm update endpoints are long-polls that already wait
+    on the server, so they use LONG_POLL_MAX_DELAY to never wait longer than
+    min_delay.
+    """
+
+    def __init__(
+        self, min_delay: float = POLL_MIN_DELAY, max_delay: float = POLL_MAX_DELAY
+    ) -> None:
+        """Initialize the scheduler."""
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.delay = 0.0
+
+    def next_delay(self, received: bool) -> float:
+        """Return the delay before the next poll.
+
+        Args:
+            received: Whether the last poll returned any updates.
+        """
+        if received:
+            self.delay = 0.0
+        else:
+            self.delay = min(self.max_delay, max(self.min_delay, self.delay * 2))
+        return self.delay
+
+    async def wait(self, received: bool) -> None:
+        """Sleep until the next poll is due."""
+        if delay := self.next_delay(received):
+            await asyncio.sleep(delay)
+
+
+@dataclass(slots=True, frozen=True)
+class _LogBody:
+    """Response body that is only decoded, and truncated, when a log record is emitted."""
+
+    content: bytes
+    content_type: str
+    limit: int
+
+    def __str__(self) -> str:
+        if "application/json" not in self.content_type:
+            return f"<{len(self.content)} bytes>"
+        if self.limit and len(self.content) > self.limit:
+            text = self.content[: self.limit].decode("utf-8", "replace")
+            return f"{text}... <{len(self.content)} bytes>"
+        return self.content.decode("utf-8", "replace")
+
+
 # TODO: Add wraper that checks the version and raises error if the method is not supported
+async def _b64_chunks(chunks: AsyncIterator[bytes]) -> AsyncGenerator[str]:
+    """Encode a stream of bytes chunks as base64 text chunks.
+
+    The concatenated text chunks are the base64 encoding of the whole stream.
+    """
+    remainder = b""
+    async for chunk in chunks:
+        # base64 encodes 3 bytes at a time, carry the rest to the next chunk
+        chunk = remainder + chunk
+        cut = len(chunk) - len(chunk) % 3
+        remainder = chunk[cut:]
+        if cut:
+            yield base64.b64encode(chunk[:cut]).decode("utf-8")
+    if remainder:
+        yield base64.b64encode(remainder).decode("utf-8")
+
+
 class Client:
     """Gallagher REST api base client."""
 
@@ -38,6 +131,9 @@ class Client:
         cloud_gateway: CloudGateway | None = None,
         token: str | None = None,
         httpx_client: httpx.AsyncClient | None = None,
+        hooks: Iterable[RequestHooks] | None = None,
+        log_body_limit: int = LOG_BODY_LIMIT,
+        log_sample_rate: float = 1.0,
     ) -> None:
         """Initialize REST api client.
 
@@ -48,6 +144,9 @@ class Client:
             cloud_gateway: Use cloud gateway instead of direct host/port connection.
             token: Integration license token.
             httpx_client: Custom httpx AsyncClient instance.
+            hooks: Request hooks notified of every request, e.g. a MetricsCollector.
+            log_body_limit: Maximum number of response bytes in debug logs, 0 for no limit.
+            log_sample_rate: Fraction of requests logged when debug logging is enabled.
         """
         if cloud_gateway is not None:
             host = cloud_gateway.value
@@ -70,13 +169,16 @@ class Client:
         self.event_groups: dict[str, models.FTEventGroup] = {}
         self.event_types: dict[str, models.FTEventType] = {}
         self.version: str | None = None
+        self.hooks: list[RequestHooks] = list(hooks or [])
+        self.log_body_limit = log_body_limit
+        self.log_sample_rate = log_sample_rate
 
     async def _async_request(
         self,
         method: models.HTTPMethods,
         endpoint: str,
         *,
-        params: models.QueryBase | None = None,
+        params: models.QueryBase | dict[str, Any] | None = None,
         data: models.FTModel | None = None,
     ) -> dict[str, Any]:
         """Send a http request and return the response.
@@ -84,53 +186,52 @@ class Client:
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: Full URL of the endpoint.
-            params: Query parameters as a Pydantic model.
+            params: Query parameters as a Pydantic model, or as a dict built
+                with models.query_params().
             data: Request body as a Pydantic model.
 
         Returns:
             The response as a dictionary.
         """
-        _LOGGER.debug(
-            "Sending %s request to endpoint: %s, data: %s, params: %s",
-            method,
-            endpoint,
-            data.model_dump() if data else None,
-            params.model_dump() if params else None,
+        query = params.to_params() if isinstance(params, models.QueryBase) else params
+        body = data.model_dump() if data else None
+        debug = _LOGGER.isEnabledFor(logging.DEBUG) and (
+            self.log_sample_rate >= 1 or random.random() < self.log_sample_rate
         )
-        try:
-            response = await self.httpx_client.request(
+        if debug:
+            _LOGGER.debug(
+                "Sending %s request to endpoint: %s, data: %s, params: %s",
                 method,
                 endpoint,
-                params=params.model_dump() if params else None,
-                json=data.model_dump() if data else None,
+                body,
+                query,
+            )
+        request_info: RequestInfo | None = None
+        try:
+            request = self.httpx_client.build_request(
+                method, endpoint, params=query, json=body
             )
+            request_info = self._hook_request(method, endpoint, len(request.content))
+            start = time.perf_counter()
+            response = await self.httpx_client.send(request)
         except (httpx.RequestError, SSLError) as err:
-            raise ConnectError(
-                f"Connection failed while sending request: {err}"
-            ) from err
-        _LOGGER.debug(
-            "status_code: %s, response: %s", response.status_code, response.text
+            error = ConnectError(f"Connection failed while sending request: {err}")
+            self._notify_hooks(request_info, error=error)
+            raise error from err
+        self._notify_hooks(
+            request_info, response, start=start, bytes_received=len(response.content)
         )
-        if httpx.codes.is_error(response.status_code):
-            if response.status_code == httpx.codes.UNAUTHORIZED:
-                raise UnauthorizedError(
-                    "Unauthorized request. Ensure api key is correct"
-                )
-            if response.status_code == httpx.codes.NOT_FOUND:
-                message = (
-                    "Requested item does not exist or "
-                    "your operator does not have the privilege to view it"
-                )
-            elif response.status_code == httpx.codes.SERVICE_UNAVAILABLE:
-                message = "Service Unavailable"
-            else:
-                try:
-                    message = cast(dict[str, Any], response.json()).get(
-                        "message", "Invalid operation"
-                    )
-                except JSONDecodeError:
-                    message = "Unknown error"
-            raise RequestError(message)
+        if debug:
+            _LOGGER.debug(
+                "status_code: %s, response: %s",
+                response.status_code,
+                _LogBody(
+                    response.content,
+                    response.headers.get("content-type", ""),
+                    self.log_body_limit,
+                ),
+            )
+        self._check_response(request_info, response)
         if response.status_code == httpx.codes.CREATED:
             return {"location": response.headers.get("location")}
         if response.status_code == httpx.codes.NO_CONTENT:
@@ -139,6 +240,230 @@ class Client:
             return response.json()
         return {"results": response.content}
 
+    def _hook_request(
+        self, method: str, url: str, bytes_sent: int = 0
+    ) -> RequestInfo | None:
+        """Notify the hooks of a request about to be sent.
+
+        Returns:
+            The RequestInfo to pass to _notify_hooks(), None without hooks.
+        """
+        if not self.hooks:
+            return None
+        request_info = RequestInfo(
+            method, url, endpoint_family(method, url), bytes_sent
+        )
+        for hook in self.hooks:
+            hook.before_send(request_info)
+        return request_info
+
+    def _notify_hooks(
+        self,
+        request_info: RequestInfo | None,
+        response: httpx.Response | None = None,
+        *,
+        start: float = 0.0,
+        bytes_received: int = 0,
+        error: GllApiError | None = None,
+    ) -> None:
+        """Pass the response received at, or the error of, a request to the hooks.
+
+        Args:
+            request_info: The request returned by _hook_request().
+            response: The response received. Its duration is counted from start.
+            start: The perf_counter() time the request was sent at.
+            bytes_received: The size of the response body.
+            error: The error the request failed with.
+        """
+        if request_info is None:
+            return
+        if response is not None:
+            response_info = ResponseInfo(
+                request_info,
+                response.status_code,
+                time.perf_counter() - start,
+                bytes_received,
+            )
+            for hook in self.hooks:
+                hook.after_response(response_info)
+        if error is not None:
+            for hook in self.hooks:
+                hook.on_error(request_info, error)
+
+    def _check_response(
+        self, request_info: RequestInfo | None, response: httpx.Response
+    ) -> None:
+        """Raise the matching GllApiError if the response is an error.
+
+        The error is passed to the hooks first.
+        """
+        try:
+            self._raise_for_status(response)
+        except GllApiError as err:
+            self._notify_hooks(request_info, error=err)
+            raise
+
+    @staticmethod
+    def _raise_for_status(response: httpx.Response) -> None:
+        """Raise the matching GllApiError if the response is an error.
+
+        The response body must have been read.
+        """
+        if not httpx.codes.is_error(response.status_code):
+            return
+        if response.status_code == httpx.codes.UNAUTHORIZED:
+            raise UnauthorizedError("Unauthorized request. Ensure api key is correct")
+        if response.status_code == httpx.codes.NOT_FOUND:
+            message = (
+                "Requested item does not exist or "
+                "your operator does not have the privilege to view it"
+            )
+        elif response.status_code == httpx.codes.SERVICE_UNAVAILABLE:
+            message = "Service Unavailable"
+        else:
+            try:
+                message = cast(dict[str, Any], response.json()).get(
+                    "message", "Invalid operation"
+                )
+            except JSONDecodeError:
+                message = "Unknown error"
+        raise RequestError(message, response.status_code)
+
+    def _validate(
+        self, model: type[_ModelT], rows: list[dict[str, Any]], endpoint: str
+    ) -> list[_ModelT]:
+        """Validate the rows of a response page and report the time spent to the hooks."""
+        if not self.hooks:
+            return [model.model_validate(row) for row in rows]
+        start = time.perf_counter()
+        results = [model.model_validate(row) for row in rows]
+        duration = time.perf_counter() - start
+        family = endpoint_family(models.HTTPMethods.GET, endpoint)
+        for hook in self.hooks:
+            hook.on_validation(family, model.__name__, len(rows), duration)
+        return results
+
+    async def _yield_pages(
+        self,
+        endpoint: str,
+        *,
+        params: models.QueryBase | None = None,
+        results_key: str = "results",
+        stop_on_empty: bool = False,
+        prefetch: bool = True,
+    ) -> AsyncGenerator[list[dict[str, Any]]]:
+        """Yield the raw result pages of a paginated endpoint.
+
+        The 'next' link of every page is followed until the server stops returning one.
+        With prefetch enabled the next page is requested while the caller consumes the
+        current one, so no more than two pages are held in memory at any time.
+
+        Args:
+            endpoint: Full URL of the first page.
+            params: Query parameters of the first page. Next links already carry them.
+            results_key: The response key holding the page items.
+            stop_on_empty: Stop at the first empty page. Needed for endpoints that
+                always return a next link, like events.
+            prefetch: Request the next page before the current page is consumed.
+
+        Yields:
+            The list of raw items of each page.
+        """
+        pending: asyncio.Task[dict[str, Any]] | None = None
+        response = await self._async_request(
+            models.HTTPMethods.GET, endpoint, params=params
+        )
+        try:
+            while True:
+                results: list[dict[str, Any]] = response.get(results_key) or []
+                if stop_on_empty and not results:
+                    return
+                next_href = (response.get("next") or {}).get("href")
+                if next_href and prefetch:
+                    pending = asyncio.create_task(
+                        self._async_request(models.HTTPMethods.GET, next_href)
+                    )
+                yield results
+                if not next_href:
+                    return
+                if pending is not None:
+                    response = await pending
+                    pending = None
+                else:
+                    response = await self._async_request(
+                        models.HTTPMethods.GET, next_href
+                    )
+        finally:
+            if pending is not None:
+                if pending.done():
+                    if not pending.cancelled():
+                        pending.exception()
+                else:
+                    pending.cancel()
+
+    async def _yield_models(
+        self,
+        model: type[_ModelT],
+        endpoint: str,
+        *,
+        params: models.QueryBase | None = None,
+        results_key: str = "results",
+        stop_on_empty: bool = False,
+    ) -> AsyncGenerator[list[_ModelT]]:
+        """Yield the pages of a paginated endpoint validated as the given model."""
+        async for page in self._yield_pages(
+            endpoint,
+            params=params,
+            results_key=results_key,
+            stop_on_empty=stop_on_empty,
+        ):
+            yield self._validate(model, page, endpoint)
+
+    async def _get_by_ids(
+        self,
+        model: type[_ModelT],
+        endpoint: str,
+        ids: Iterable[str],
+        *,
+        response_fields: list[str] | None = None,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+    ) -> dict[str, _ModelT | None]:
+        """Fetch many items of the same kind by ID concurrently.
+
+        Duplicate IDs are fetched once. IDs that do not exist or that the operator
+        is not allowed to view (404 responses) are returned as None instead of
+        raising. Other errors, like an unavailable server, are raised.
+
+        Args:
+            model: The model to validate each response with.
+            endpoint: The collection href, the ID is appended to it.
+            ids: The IDs to fetch.
+            response_fields: Fields to include in every response.
+            max_concurrency: Maximum number of requests in flight.
+
+        Returns:
+            A dict mapping each requested ID to its object, or None when missing.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        params = models.QueryBase(response_fields=response_fields)
+
+        async def fetch(id: str) -> _ModelT | None:
+            async with semaphore:
+                try:
+                    response = await self._async_request(
+                        models.HTTPMethods.GET, f"{endpoint}/{id}", params=params
+                    )
+                except RequestError as err:
+                    if err.status_code != httpx.codes.NOT_FOUND:
+                        raise
+                    _LOGGER.debug("Failed to fetch %s/%s: %s", endpoint, id, err)
+                    return None
+            return self._validate(model, [response], endpoint)[0]
+
+        unique_ids = list(dict.fromkeys(ids))
+        results = await asyncio.gather(*(fetch(id) for id in unique_ids))
+        return dict(zip(unique_ids, results))
+
     async def initialize(self) -> None:
         """Connect to Server and construct the api features."""
         response = await self._async_request(
@@ -164,6 +489,19 @@ class Client:
             }
         return self._item_types
 
+    async def _item_type_ids(self, item_types: list[str] | None) -> list[str] | None:
+        """Map item type names to their IDs, fetching the item types if needed."""
+        if not item_types:
+            return None
+        if not self._item_types:
+            await self.get_item_types()
+        type_ids: list[str] = []
+        for item_type in item_types:
+            if (type_id := self._item_types.get(item_type)) is None:
+                raise ValueError(f"Unknown item type: {item_type}")
+            type_ids.append(type_id)
+        return type_ids
+
     async def get_item(
         self,
         *,
@@ -198,31 +536,96 @@ class Client:
             response = await self._async_request(
                 models.HTTPMethods.GET,
                 f"{self.api_features.items()}/{id}",
-                params=models.ItemQuery(response_fields=response_fields),
+                params=models.query_params(
+                    models.ItemQuery, response_fields=response_fields
+                ),
             )
-            return [models.FTItem.model_validate(response)]
-
-        if item_types:
-            if not self._item_types:
-                await self.get_item_types()
-            type_ids: list[str] = []
-            for item_type in item_types or []:
-                if (type_id := self._item_types.get(item_type)) is None:
-                    raise ValueError(f"Unknown item type: {item_type}")
-                type_ids.append(type_id)
+            return self._validate(models.FTItem, [response], self.api_features.items())
+
         response = await self._async_request(
             models.HTTPMethods.GET,
             self.api_features.items(),
             params=models.ItemQuery(
                 name=name,
-                item_types=type_ids,
+                item_types=await self._item_type_ids(item_types),
+                division=division,
+                response_fields=response_fields,
+                sort=sort,
+                top=top,
+            ),
+        )
+        return self._validate(
+            models.FTItem, response["results"], self.api_features.items()
+        )
+
+    async def yield_items(
+        self,
+        *,
+        item_types: list[str] | None = None,
+        name: str | None = None,
+        response_fields: list[str] | None = None,
+        division: list[str] | None = None,
+        sort: models.SortMethod | None = None,
+        top: int | None = None,
+    ) -> AsyncGenerator[list[models.FTItem]]:
+        """Yield all items matching the filters in pages.
+
+        The 'next' link is followed until every matching item is retrieved,
+        so large sites are not truncated to a single page.
+
+        Args:
+            item_types: Filter by item type names; unknown types raise a ValueError.
+                The names can be fetched using get_item_types().
+            name: Filter by item name (substring match).
+            response_fields: Specify the exact fields to include in the response. See get_item().
+            division: Filter by division IDs.
+            sort: Sort the order of the results.
+            top: Number of items per page.
+
+        Yields:
+            A list of FTItem instances for each page.
+        """
+        async for page in self._yield_models(
+            models.FTItem,
+            self.api_features.items(),
+            params=models.ItemQuery(
+                name=name,
+                item_types=await self._item_type_ids(item_types),
                 division=division,
                 response_fields=response_fields,
                 sort=sort,
                 top=top,
             ),
+        ):
+            yield page
+
+    async def get_items_by_ids(
+        self,
+        ids: Iterable[str],
+        *,
+        response_fields: list[str] | None = None,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+    ) -> dict[str, models.FTItem | None]:
+        """Retrieve many items by ID concurrently.
+
+        Duplicate IDs are requested once and all requests share the same response_fields.
+
+        Args:
+            ids: The item IDs to fetch.
+            response_fields: Specify the exact fields to include in each response.
+            max_concurrency: Maximum number of requests sent at the same time.
+
+        Returns:
+            A dict mapping each ID to its FTItem object.
+            IDs that are missing or not visible to the operator map to None.
+        """
+        return await self._get_by_ids(
+            models.FTItem,
+            self.api_features.items(),
+            ids,
+            response_fields=response_fields,
+            max_concurrency=max_concurrency,
         )
-        return [models.FTItem.model_validate(item) for item in response["results"]]
 
     # region Access zone methods
     async def get_access_zone(
@@ -261,9 +664,13 @@ class Client:
             response = await self._async_request(
                 models.HTTPMethods.GET,
                 f"{self.api_features.access_zones()}/{id}",
-                params=models.QueryBase(response_fields=response_fields),
+                params=models.query_params(
+                    models.QueryBase, response_fields=response_fields
+                ),
+            )
+            return self._validate(
+                models.FTAccessZone, [response], self.api_features.access_zones()
             )
-            return [models.FTAccessZone.model_validate(response)]
         response = await self._async_request(
             models.HTTPMethods.GET,
             self.api_features.access_zones(),
@@ -276,9 +683,77 @@ class Client:
                 top=top,
             ),
         )
-        return [
-            models.FTAccessZone.model_validate(item) for item in response["results"]
-        ]
+        return self._validate(
+            models.FTAccessZone, response["results"], self.api_features.access_zones()
+        )
+
+    async def yield_access_zones(
+        self,
+        *,
+        name: str | None = None,
+        description: str | None = None,
+        response_fields: list[str] | None = None,
+        division: list[str] | None = None,
+        sort: models.SortMethod | None = None,
+        top: int | None = None,
+    ) -> AsyncGenerator[list[models.FTAccessZone]]:
+        """Yield all the access zones matching the filters in pages.
+
+        The 'next' link is followed until every matching access zone is retrieved,
+        so large sites are not truncated to a single page.
+
+        Args:
+            name: Filter by access zone name (substring match).
+            description: Filter by access zone description (substring match).
+            response_fields: Specify the exact fields to include in the response. See get_access_zone().
+            division: Filter by division IDs.
+            sort: Sort the order of the results.
+            top: Number of access zones per page.
+
+        Yields:
+            A list of FTAccessZone objects for each page.
+        """
+        async for page in self._yield_models(
+            models.FTAccessZone,
+            self.api_features.access_zones(),
+            params=models.QueryBase(
+                name=name,
+                description=description,
+                division=division,
+                response_fields=response_fields,
+                sort=sort,
+                top=top,
+            ),
+        ):
+            yield page
+
+    async def get_access_zones_by_ids(
+        self,
+        ids: Iterable[str],
+        *,
+        response_fields: list[str] | None = None,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+    ) -> dict[str, models.FTAccessZone | None]:
+        """Retrieve many access zones by ID concurrently.
+
+        Duplicate IDs are requested once and all requests share the same response_fields.
+
+        Args:
+            ids: The access zone IDs to fetch.
+            response_fields: Specify the exact fields to include in each response.
+            max_concurrency: Maximum number of requests sent at the same time.
+
+        Returns:
+            A dict mapping each ID to its FTAccessZone object.
+            IDs that are missing or not visible to the operator map to None.
+        """
+        return await self._get_by_ids(
+            models.FTAccessZone,
+            self.api_features.access_zones(),
+            ids,
+            response_fields=response_fields,
+            max_concurrency=max_concurrency,
+        )
 
     async def override_access_zone(
         self,
@@ -341,9 +816,13 @@ class Client:
             response = await self._async_request(
                 models.HTTPMethods.GET,
                 f"{self.api_features.alarm_zones()}/{id}",
-                params=models.QueryBase(response_fields=response_fields),
+                params=models.query_params(
+                    models.QueryBase, response_fields=response_fields
+                ),
+            )
+            return self._validate(
+                models.FTAlarmZone, [response], self.api_features.alarm_zones()
             )
-            return [models.FTAlarmZone.model_validate(response)]
 
         response = await self._async_request(
             models.HTTPMethods.GET,
@@ -357,7 +836,49 @@ class Client:
                 top=top,
             ),
         )
-        return [models.FTAlarmZone.model_validate(item) for item in response["results"]]
+        return self._validate(
+            models.FTAlarmZone, response["results"], self.api_features.alarm_zones()
+        )
+
+    async def yield_alarm_zones(
+        self,
+        *,
+        name: str | None = None,
+        description: str | None = None,
+        response_fields: list[str] | None = None,
+        division: list[str] | None = None,
+        sort: models.SortMethod | None = None,
+        top: int | None = None,
+    ) -> AsyncGenerator[list[models.FTAlarmZone]]:
+        """Yield all the alarm zones matching the filters in pages.
+
+        The 'next' link is followed until every matching alarm zone is retrieved,
+        so large sites are not truncated to a single page.
+
+        Args:
+            name: Filter by alarm zone name (substring match).
+            description: Filter by alarm zone description (substring match).
+            response_fields: Specify the exact fields to include in the response. See get_alarm_zone().
+            division: Filter by division IDs.
+            sort: Sort the order of the results.
+            top: Number of alarm zones per page.
+
+        Yields:
+            A list of FTAlarmZone objects for each page.
+        """
+        async for page in self._yield_models(
+            models.FTAlarmZone,
+            self.api_features.alarm_zones(),
+            params=models.QueryBase(
+                name=name,
+                description=description,
+                division=division,
+                response_fields=response_fields,
+                sort=sort,
+                top=top,
+            ),
+        ):
+            yield page
 
     async def override_alarm_zone(
         self, command_href: str, *, end_time: datetime | None = None
@@ -413,9 +934,13 @@ class Client:
             response = await self._async_request(
                 models.HTTPMethods.GET,
                 f"{self.api_features.fence_zones()}/{id}",
-                params=models.QueryBase(response_fields=response_fields),
+                params=models.query_params(
+                    models.QueryBase, response_fields=response_fields
+                ),
+            )
+            return self._validate(
+                models.FTFenceZone, [response], self.api_features.fence_zones()
             )
-            return [models.FTFenceZone.model_validate(response)]
         response = await self._async_request(
             models.HTTPMethods.GET,
             self.api_features.fence_zones(),
@@ -428,7 +953,49 @@ class Client:
                 top=top,
             ),
         )
-        return [models.FTFenceZone.model_validate(item) for item in response["results"]]
+        return self._validate(
+            models.FTFenceZone, response["results"], self.api_features.fence_zones()
+        )
+
+    async def yield_fence_zones(
+        self,
+        *,
+        name: str | None = None,
+        description: str | None = None,
+        response_fields: list[str] | None = None,
+        division: list[str] | None = None,
+        sort: models.SortMethod | None = None,
+        top: int | None = None,
+    ) -> AsyncGenerator[list[models.FTFenceZone]]:
+        """Yield all the fence zones matching the filters in pages.
+
+        The 'next' link is followed until every matching fence zone is retrieved,
+        so large sites are not truncated to a single page.
+
+        Args:
+            name: Filter by fence zone name (substring match).
+            description: Filter by fence zone description (substring match).
+            response_fields: Specify the exact fields to include in the response. See get_fence_zone().
+            division: Filter by division IDs.
+            sort: Sort the order of the results.
+            top: Number of fence zones per page.
+
+        Yields:
+            A list of FTFenceZone objects for each page.
+        """
+        async for page in self._yield_models(
+            models.FTFenceZone,
+            self.api_features.fence_zones(),
+            params=models.QueryBase(
+                name=name,
+                description=description,
+                division=division,
+                response_fields=response_fields,
+                sort=sort,
+                top=top,
+            ),
+        ):
+            yield page
 
     async def override_fence_zone(self, command_href: str) -> None:
         """Send a POST command to override a fence zone.
@@ -478,9 +1045,13 @@ class Client:
             response = await self._async_request(
                 models.HTTPMethods.GET,
                 f"{self.api_features.inputs()}/{id}",
-                params=models.QueryBase(response_fields=response_fields),
+                params=models.query_params(
+                    models.QueryBase, response_fields=response_fields
+                ),
+            )
+            return self._validate(
+                models.FTInput, [response], self.api_features.inputs()
             )
-            return [models.FTInput.model_validate(response)]
         response = await self._async_request(
             models.HTTPMethods.GET,
             self.api_features.inputs(),
@@ -493,7 +1064,49 @@ class Client:
                 top=top,
             ),
         )
-        return [models.FTInput.model_validate(item) for item in response["results"]]
+        return self._validate(
+            models.FTInput, response["results"], self.api_features.inputs()
+        )
+
+    async def yield_inputs(
+        self,
+        *,
+        name: str | None = None,
+        description: str | None = None,
+        response_fields: list[str] | None = None,
+        division: list[str] | None = None,
+        sort: models.SortMethod | None = None,
+        top: int | None = None,
+    ) -> AsyncGenerator[list[models.FTInput]]:
+        """Yield all the input items matching the filters in pages.
+
+        The 'next' link is followed until every matching input item is retrieved,
+        so large sites are not truncated to a single page.
+
+        Args:
+            name: Filter by input item name (substring match).
+            description: Filter by input item description (substring match).
+            response_fields: Specify the exact fields to include in the response. See get_input().
+            division: Filter by division IDs.
+            sort: Sort the order of the results.
+            top: Number of input items per page.
+
+        Yields:
+            A list of FTInput objects for each page.
+        """
+        async for page in self._yield_models(
+            models.FTInput,
+            self.api_features.inputs(),
+            params=models.QueryBase(
+                name=name,
+                description=description,
+                division=division,
+                response_fields=response_fields,
+                sort=sort,
+                top=top,
+            ),
+        ):
+            yield page
 
     async def override_input(self, command_href: str) -> None:
         """Send a POST command to override an input item.
@@ -543,9 +1156,13 @@ class Client:
             response = await self._async_request(
                 models.HTTPMethods.GET,
                 f"{self.api_features.outputs()}/{id}",
-                params=models.QueryBase(response_fields=response_fields),
+                params=models.query_params(
+                    models.QueryBase, response_fields=response_fields
+                ),
+            )
+            return self._validate(
+                models.FTOutput, [response], self.api_features.outputs()
             )
-            return [models.FTOutput.model_validate(response)]
 
         response = await self._async_request(
             models.HTTPMethods.GET,
@@ -559,7 +1176,49 @@ class Client:
                 top=top,
             ),
         )
-        return [models.FTOutput.model_validate(item) for item in response["results"]]
+        return self._validate(
+            models.FTOutput, response["results"], self.api_features.outputs()
+        )
+
+    async def yield_outputs(
+        self,
+        *,
+        name: str | None = None,
+        description: str | None = None,
+        response_fields: list[str] | None = None,
+        division: list[str] | None = None,
+        sort: models.SortMethod | None = None,
+        top: int | None = None,
+    ) -> AsyncGenerator[list[models.FTOutput]]:
+        """Yield all the output items matching the filters in pages.
+
+        The 'next' link is followed until every matching output item is retrieved,
+        so large sites are not truncated to a single page.
+
+        Args:
+            name: Filter by output item name (substring match).
+            description: Filter by output item description (substring match).
+            response_fields: Specify the exact fields to include in the response. See get_output().
+            division: Filter by division IDs.
+            sort: Sort the order of the results.
+            top: Number of output items per page.
+
+        Yields:
+            A list of FTOutput objects for each page.
+        """
+        async for page in self._yield_models(
+            models.FTOutput,
+            self.api_features.outputs(),
+            params=models.QueryBase(
+                name=name,
+                description=description,
+                division=division,
+                response_fields=response_fields,
+                sort=sort,
+                top=top,
+            ),
+        ):
+            yield page
 
     async def override_output(
         self, command_href: str, *, end_time: datetime | timedelta | None = None
@@ -618,9 +1277,11 @@ class Client:
             response = await self._async_request(
                 models.HTTPMethods.GET,
                 f"{self.api_features.doors()}/{id}",
-                params=models.QueryBase(response_fields=response_fields),
+                params=models.query_params(
+                    models.QueryBase, response_fields=response_fields
+                ),
             )
-            return [models.FTDoor.model_validate(response)]
+            return self._validate(models.FTDoor, [response], self.api_features.doors())
         response = await self._async_request(
             models.HTTPMethods.GET,
             self.api_features.doors(),
@@ -633,7 +1294,77 @@ class Client:
                 top=top,
             ),
         )
-        return [models.FTDoor.model_validate(door) for door in response["results"]]
+        return self._validate(
+            models.FTDoor, response["results"], self.api_features.doors()
+        )
+
+    async def yield_doors(
+        self,
+        *,
+        name: str | None = None,
+        description: str | None = None,
+        response_fields: list[str] | None = None,
+        division: list[str] | None = None,
+        sort: models.SortMethod | None = None,
+        top: int | None = None,
+    ) -> AsyncGenerator[list[models.FTDoor]]:
+        """Yield all the door items matching the filters in pages.
+
+        The 'next' link is followed until every matching door item is retrieved,
+        so large sites are not truncated to a single page.
+
+        Args:
+            name: Filter by door item name (substring match).
+            description: Filter by door item description (substring match).
+            response_fields: Specify the exact fields to include in the response. See get_door().
+            division: Filter by division IDs.
+            sort: Sort the order of the results.
+            top: Number of door items per page.
+
+        Yields:
+            A list of FTDoor objects for each page.
+        """
+        async for page in self._yield_models(
+            models.FTDoor,
+            self.api_features.doors(),
+            params=models.QueryBase(
+                name=name,
+                description=description,
+                division=division,
+                response_fields=response_fields,
+                sort=sort,
+                top=top,
+            ),
+        ):
+            yield page
+
+    async def get_doors_by_ids(
+        self,
+        ids: Iterable[str],
+        *,
+        response_fields: list[str] | None = None,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+    ) -> dict[str, models.FTDoor | None]:
+        """Retrieve many doors by ID concurrently.
+
+        Duplicate IDs are requested once and all requests share the same response_fields.
+
+        Args:
+            ids: The door IDs to fetch.
+            response_fields: Specify the exact fields to include in each response.
+            max_concurrency: Maximum number of requests sent at the same time.
+
+        Returns:
+            A dict mapping each ID to its FTDoor object.
+            IDs that are missing or not visible to the operator map to None.
+        """
+        return await self._get_by_ids(
+            models.FTDoor,
+            self.api_features.doors(),
+            ids,
+            response_fields=response_fields,
+            max_concurrency=max_concurrency,
+        )
 
     async def override_door(self, command_href: str) -> None:
         """Send a POST command to override a door item.
@@ -683,9 +1414,13 @@ class Client:
             response = await self._async_request(
                 models.HTTPMethods.GET,
                 f"{self.api_features.card_types()}/{id}",
-                params=models.QueryBase(response_fields=response_fields),
+                params=models.query_params(
+                    models.QueryBase, response_fields=response_fields
+                ),
+            )
+            return self._validate(
+                models.FTCardType, [response], self.api_features.card_types()
             )
-            return [models.FTCardType.model_validate(response)]
 
         response = await self._async_request(
             models.HTTPMethods.GET,
@@ -699,7 +1434,49 @@ class Client:
                 top=top,
             ),
         )
-        return [models.FTCardType.model_validate(item) for item in response["results"]]
+        return self._validate(
+            models.FTCardType, response["results"], self.api_features.card_types()
+        )
+
+    async def yield_card_types(
+        self,
+        *,
+        name: str | None = None,
+        description: str | None = None,
+        response_fields: list[str] | None = None,
+        division: list[str] | None = None,
+        sort: models.SortMethod | None = None,
+        top: int | None = None,
+    ) -> AsyncGenerator[list[models.FTCardType]]:
+        """Yield all the card type items matching the filters in pages.
+
+        The 'next' link is followed until every matching card type item is retrieved,
+        so large sites are not truncated to a single page.
+
+        Args:
+            name: Filter by card type item name (substring match).
+            description: Filter by card type item description (substring match).
+            response_fields: Specify the exact fields to include in the response. See get_card_type().
+            division: Filter by division IDs.
+            sort: Sort the order of the results.
+            top: Number of card type items per page.
+
+        Yields:
+            A list of FTCardType objects for each page.
+        """
+        async for page in self._yield_models(
+            models.FTCardType,
+            self.api_features.card_types("assign"),
+            params=models.QueryBase(
+                name=name,
+                description=description,
+                division=division,
+                response_fields=response_fields,
+                sort=sort,
+                top=top,
+            ),
+        ):
+            yield page
 
     async def get_access_group(
         self,
@@ -736,9 +1513,13 @@ class Client:
             response = await self._async_request(
                 models.HTTPMethods.GET,
                 f"{self.api_features.access_groups()}/{id}",
-                params=models.QueryBase(response_fields=response_fields),
+                params=models.query_params(
+                    models.QueryBase, response_fields=response_fields
+                ),
+            )
+            return self._validate(
+                models.FTAccessGroup, [response], self.api_features.access_groups()
             )
-            return [models.FTAccessGroup.model_validate(response)]
 
         response = await self._async_request(
             models.HTTPMethods.GET,
@@ -752,9 +1533,49 @@ class Client:
                 top=top,
             ),
         )
-        return [
-            models.FTAccessGroup.model_validate(item) for item in response["results"]
-        ]
+        return self._validate(
+            models.FTAccessGroup, response["results"], self.api_features.access_groups()
+        )
+
+    async def yield_access_groups(
+        self,
+        *,
+        name: str | None = None,
+        description: str | None = None,
+        response_fields: list[str] | None = None,
+        division: list[str] | None = None,
+        sort: models.SortMethod | None = None,
+        top: int | None = None,
+    ) -> AsyncGenerator[list[models.FTAccessGroup]]:
+        """Yield all the access group items matching the filters in pages.
+
+        The 'next' link is followed until every matching access group item is retrieved,
+        so large sites are not truncated to a single page.
+
+        Args:
+            name: Filter by access group item name (substring match).
+            description: Filter by access group item description (substring match).
+            response_fields: Specify the exact fields to include in the response. See get_access_group().
+            division: Filter by division IDs.
+            sort: Sort the order of the results.
+            top: Number of access group items per page.
+
+        Yields:
+            A list of FTAccessGroup objects for each page.
+        """
+        async for page in self._yield_models(
+            models.FTAccessGroup,
+            self.api_features.access_groups(),
+            params=models.QueryBase(
+                name=name,
+                description=description,
+                division=division,
+                response_fields=response_fields,
+                sort=sort,
+                top=top,
+            ),
+        ):
+            yield page
 
     async def get_access_group_members(
         self, href: str
@@ -773,7 +1594,54 @@ class Client:
             for item in response["cardholders"]
         ]
 
-    async def get_operator_group(
+    async def get_operator_group(
+        self,
+        *,
+        name: str | None = None,
+        description: str | None = None,
+        response_fields: list[str] | None = None,
+        division: list[str] | None = None,
+        sort: models.SortMethod | None = None,
+        top: int | None = None,
+    ) -> list[models.FTOperatorGroup]:
+        """Retrieve the operator group items configured in the system.
+
+        Args:
+            id: If provided, fetch a single detailed operator group item by ID.
+            name: Filter by operator group item name (substring match).
+            description: Filter by operator group item description (substring match).
+            response_fields:
+                Specify the exact fields to include in the response.
+                If you need the default fields to be included along with other requested fields, pass ['defaults']
+                Additional fields that should be explicitly requested include
+                ['division', 'cardholders', 'divisions'].
+            division: Filter by division IDs.
+                To get the list of divisions call get_items method with item_types=['Division'].
+            sort: Sort the order of the results.
+            top: Maximum number of results to return.
+
+        Returns:
+            A list of FTAccessGroup objects matching the filters.
+        """
+        response = await self._async_request(
+            models.HTTPMethods.GET,
+            self.api_features.operator_groups(),
+            params=models.QueryBase(
+                name=name,
+                description=description,
+                division=division,
+                response_fields=response_fields,
+                sort=sort,
+                top=top,
+            ),
+        )
+        return self._validate(
+            models.FTOperatorGroup,
+            response["results"],
+            self.api_features.operator_groups(),
+        )
+
+    async def yield_operator_groups(
         self,
         *,
         name: str | None = None,
@@ -782,28 +1650,25 @@ class Client:
         division: list[str] | None = None,
         sort: models.SortMethod | None = None,
         top: int | None = None,
-    ) -> list[models.FTOperatorGroup]:
-        """Retrieve the operator group items configured in the system.
+    ) -> AsyncGenerator[list[models.FTOperatorGroup]]:
+        """Yield all the operator group items matching the filters in pages.
+
+        The 'next' link is followed until every matching operator group item is retrieved,
+        so large sites are not truncated to a single page.
 
         Args:
-            id: If provided, fetch a single detailed operator group item by ID.
             name: Filter by operator group item name (substring match).
             description: Filter by operator group item description (substring match).
-            response_fields:
-                Specify the exact fields to include in the response.
-                If you need the default fields to be included along with other requested fields, pass ['defaults']
-                Additional fields that should be explicitly requested include
-                ['division', 'cardholders', 'divisions'].
+            response_fields: Specify the exact fields to include in the response. See get_operator_group().
             division: Filter by division IDs.
-                To get the list of divisions call get_items method with item_types=['Division'].
             sort: Sort the order of the results.
-            top: Maximum number of results to return.
+            top: Number of operator group items per page.
 
-        Returns:
-            A list of FTAccessGroup objects matching the filters.
+        Yields:
+            A list of FTOperatorGroup objects for each page.
         """
-        response = await self._async_request(
-            models.HTTPMethods.GET,
+        async for page in self._yield_models(
+            models.FTOperatorGroup,
             self.api_features.operator_groups(),
             params=models.QueryBase(
                 name=name,
@@ -813,10 +1678,8 @@ class Client:
                 sort=sort,
                 top=top,
             ),
-        )
-        return [
-            models.FTOperatorGroup.model_validate(item) for item in response["results"]
-        ]
+        ):
+            yield page
 
     async def get_operator_group_members(
         self, href: str, *, response_fields: list[str] | None = None
@@ -833,7 +1696,9 @@ class Client:
         response = await self._async_request(
             models.HTTPMethods.GET,
             href,
-            params=models.QueryBase(response_fields=response_fields),
+            params=models.query_params(
+                models.QueryBase, response_fields=response_fields
+            ),
         )
         return [
             models.FTOperatorGroupMembership.model_validate(item)
@@ -875,9 +1740,15 @@ class Client:
             response = await self._async_request(
                 models.HTTPMethods.GET,
                 f"{self.api_features.personal_data_fields()}/{id}",
-                params=models.QueryBase(response_fields=response_fields),
+                params=models.query_params(
+                    models.QueryBase, response_fields=response_fields
+                ),
+            )
+            return self._validate(
+                models.FTPersonalDataFieldDefinition,
+                [response],
+                self.api_features.personal_data_fields(),
             )
-            return [models.FTPersonalDataFieldDefinition.model_validate(response)]
 
         response = await self._async_request(
             models.HTTPMethods.GET,
@@ -891,10 +1762,51 @@ class Client:
                 top=top,
             ),
         )
-        return [
-            models.FTPersonalDataFieldDefinition.model_validate(pdf)
-            for pdf in response["results"]
-        ]
+        return self._validate(
+            models.FTPersonalDataFieldDefinition,
+            response["results"],
+            self.api_features.personal_data_fields(),
+        )
+
+    async def yield_personal_data_fields(
+        self,
+        *,
+        name: str | None = None,
+        description: str | None = None,
+        response_fields: list[str] | None = None,
+        division: list[str] | None = None,
+        sort: models.SortMethod | None = None,
+        top: int | None = None,
+    ) -> AsyncGenerator[list[models.FTPersonalDataFieldDefinition]]:
+        """Yield all the personal data field items matching the filters in pages.
+
+        The 'next' link is followed until every matching personal data field item is retrieved,
+        so large sites are not truncated to a single page.
+
+        Args:
+            name: Filter by personal data field item name (substring match).
+            description: Filter by personal data field item description (substring match).
+            response_fields: Specify the exact fields to include in the response. See get_personal_data_field().
+            division: Filter by division IDs.
+            sort: Sort the order of the results.
+            top: Number of personal data field items per page.
+
+        Yields:
+            A list of FTPersonalDataFieldDefinition objects for each page.
+        """
+        async for page in self._yield_models(
+            models.FTPersonalDataFieldDefinition,
+            self.api_features.personal_data_fields(),
+            params=models.QueryBase(
+                name=name,
+                description=description,
+                division=division,
+                response_fields=response_fields,
+                sort=sort,
+                top=top,
+            ),
+        ):
+            yield page
 
     async def get_image_pdf(
         self, pdf_href: str, b64: bool = False
@@ -918,6 +1830,111 @@ class Client:
             )
         return None
 
+    async def stream_image_pdf(
+        self, pdf_href: str, *, b64: bool = False, chunk_size: int = IMAGE_CHUNK_SIZE
+    ) -> AsyncGenerator[bytes | str]:
+        """Stream the image content of a PDF href in chunks.
+
+        Unlike get_image_pdf() the image is never held in memory as a whole.
+
+        Args:
+            pdf_href: The href to the personal data field that contains the image.
+            b64: If True, yield the image as base64 text chunks. The concatenated
+                chunks form the same string get_image_pdf(b64=True) returns.
+            chunk_size: Number of bytes read from the response at a time.
+
+        Yields:
+            The image content as bytes chunks, or base64 string chunks.
+        """
+        request_info = self._hook_request(models.HTTPMethods.GET, pdf_href)
+        start = time.perf_counter()
+        try:
+            async with self.httpx_client.stream(
+                models.HTTPMethods.GET, pdf_href
+            ) as response:
+                _LOGGER.debug("status_code: %s", response.status_code)
+                if httpx.codes.is_error(response.status_code):
+                    await response.aread()
+                    self._notify_hooks(
+                        request_info,
+                        response,
+                        start=start,
+                        bytes_received=len(response.content),
+                    )
+                    self._check_response(request_info, response)
+                if "application/json" in response.headers.get("content-type", ""):
+                    raise ValueError(f"{pdf_href} is not an image href")
+                chunks = response.aiter_bytes(chunk_size)
+                async for chunk in _b64_chunks(chunks) if b64 else chunks:
+                    yield chunk
+                self._notify_hooks(
+                    request_info,
+                    response,
+                    start=start,
+                    bytes_received=response.num_bytes_downloaded,
+                )
+        except (httpx.RequestError, SSLError) as err:
+            error = ConnectError(f"Connection failed while sending request: {err}")
+            self._notify_hooks(request_info, error=error)
+            raise error from err
+
+    async def download_image_pdf(
+        self,
+        pdf_href: str,
+        destination: str | os.PathLike[str] | IO[bytes] | IO[str],
+        *,
+        b64: bool = False,
+    ) -> int:
+        """Write the image content of a PDF href to a file without buffering it.
+
+        Args:
+            pdf_href: The href to the personal data field that contains the image.
+            destination: A file path, or a file object opened in binary mode
+                (text mode when b64 is True).
+            b64: If True, write the image as base64 text.
+
+        A file path is written to a temporary file next to it, in a worker thread,
+        and only replaces the destination once the whole image was received.
+        File objects are written to directly.
+
+        Returns:
+            The number of bytes, or base64 characters, written.
+        """
+        written = 0
+        if not isinstance(destination, (str, os.PathLike)):
+            async for chunk in self.stream_image_pdf(pdf_href, b64=b64):
+                destination.write(chunk)  # type: ignore[arg-type]
+                written += len(chunk)
+            return written
+        async with open_partial(Path(destination), "w" if b64 else "wb") as file:
+            async for chunk in self.stream_image_pdf(pdf_href, b64=b64):
+                await asyncio.to_thread(file.write, chunk)
+                written += len(chunk)
+        return written
+
+    async def _resolve_pdf_filters(self, query: models.CardholderQuery) -> None:
+        """Replace the personal data field names in the query pdfs with their IDs.
+
+        Args:
+            query: The CardholderQuery object containing the search parameters.
+        """
+        if not query.pdfs:
+            return
+        pdf_dict: dict[str, str] = {}
+        for name, value in query.pdfs.items():
+            if str(name).isdigit():
+                pdf_id = str(name)
+            else:
+                pdf_field = await self.get_personal_data_field(
+                    name=name, response_fields=["id"]
+                )
+                if not pdf_field:
+                    raise GllApiError(f"pdf field: {name} not found")
+                assert pdf_field[0].id
+                pdf_id = pdf_field[0].id
+            pdf_dict[f"pdf_{pdf_id}"] = value
+        query.pdfs = pdf_dict
+
     async def _search_cardholders(
         self, query: models.CardholderQuery
     ) -> dict[str, Any]:
@@ -931,22 +1948,7 @@ class Client:
         Returns:
             A response dict from the query.
         """
-        if query.pdfs:
-            pdf_dict: dict[str, str] = {}
-            for name, value in query.pdfs.items():
-                if str(name).isdigit():
-                    pdf_id = str(name)
-                else:
-                    pdf_field = await self.get_personal_data_field(
-                        name=name, response_fields=["id"]
-                    )
-                    if not pdf_field:
-                        raise GllApiError(f"pdf field: {name} not found")
-                    assert pdf_field[0].id
-                    pdf_id = pdf_field[0].id
-                pdf_dict[f"pdf_{pdf_id}"] = value
-            query.pdfs = pdf_dict
-
+        await self._resolve_pdf_filters(query)
         return await self._async_request(
             models.HTTPMethods.GET, self.api_features.cardholders(), params=query
         )
@@ -998,9 +2000,13 @@ class Client:
             response = await self._async_request(
                 models.HTTPMethods.GET,
                 f"{self.api_features.cardholders()}/{id}",
-                params=models.QueryBase(response_fields=response_fields),
+                params=models.query_params(
+                    models.QueryBase, response_fields=response_fields
+                ),
+            )
+            return self._validate(
+                models.FTCardholder, [response], self.api_features.cardholders()
             )
-            return [models.FTCardholder.model_validate(response)]
 
         query = models.CardholderQuery(
             name=name,
@@ -1013,10 +2019,9 @@ class Client:
             top=top,
         )
         response = await self._search_cardholders(query)
-        return [
-            models.FTCardholder.model_validate(cardholder)
-            for cardholder in response["results"]
-        ]
+        return self._validate(
+            models.FTCardholder, response["results"], self.api_features.cardholders()
+        )
 
     async def yield_cardholders(
         self,
@@ -1032,7 +2037,8 @@ class Client:
     ) -> AsyncGenerator[list[models.FTCardholder]]:
         """Returns an Iterator over the cardholder items configured in the system.
 
-        This is useful for looping over cardholder in batches. Each iteration returns the number of cardholders specified in the top parameter (default 100 or 1000 depending on the version of CC).
+        This is useful for looping over cardholder in batches. Each iteration returns the number of cardholders specified in the top parameter (default 100).
+        The next page is requested while the current one is consumed.
 
         Args:
             name: Filter by cardholder item name (substring match).
@@ -1053,7 +2059,7 @@ class Client:
             division: Filter by division IDs.
                 To get the list of divisions call get_items method with item_types=['Division'].
             sort: Sort the order of the results.
-            top: Maximum number of results to return.
+            top: Number of cardholders per page.
 
         Returns:
             An Async Iterator of FTCardholder objects matching the filters.
@@ -1068,19 +2074,39 @@ class Client:
             sort=sort,
             top=top or 100,
         )
-        response = await self._search_cardholders(query)
-        while True:
-            _LOGGER.debug(response)
-            yield [
-                models.FTCardholder.model_validate(cardholder)
-                for cardholder in response["results"]
-            ]
-            await asyncio.sleep(1)
-            if not (next_link := response.get("next")):
-                break
-            response = await self._async_request(
-                models.HTTPMethods.GET, next_link["href"]
-            )
+        await self._resolve_pdf_filters(query)
+        async for page in self._yield_models(
+            models.FTCardholder, self.api_features.cardholders(), params=query
+        ):
+            yield page
+
+    async def get_cardholders_by_ids(
+        self,
+        ids: Iterable[str],
+        *,
+        response_fields: list[str] | None = None,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+    ) -> dict[str, models.FTCardholder | None]:
+        """Retrieve many cardholders by ID concurrently.
+
+        Duplicate IDs are requested once and all requests share the same response_fields.
+
+        Args:
+            ids: The cardholder IDs to fetch.
+            response_fields: Specify the exact fields to include in each response.
+            max_concurrency: Maximum number of requests sent at the same time.
+
+        Returns:
+            A dict mapping each ID to its FTCardholder object.
+            IDs that are missing or not visible to the operator map to None.
+        """
+        return await self._get_by_ids(
+            models.FTCardholder,
+            self.api_features.cardholders(),
+            ids,
+            response_fields=response_fields,
+            max_concurrency=max_concurrency,
+        )
 
     async def get_cardholder_changes(
         self, changes_href: str
@@ -1094,12 +2120,91 @@ class Client:
             A tuple of list of CardholderChange objects and the next href to get new changes.
         """
         response = await self._async_request(models.HTTPMethods.GET, changes_href)
-        changes = [
-            models.CardholderChange.model_validate(change)
-            for change in response["results"]
-        ]
+        changes = self._validate(
+            models.CardholderChange, response["results"], changes_href
+        )
         return changes, response["next"]["href"]
 
+    async def yield_cardholder_changes(
+        self,
+        changes_href: str | None = None,
+        *,
+        filter: list[str] | None = None,
+        cardholder_fields: list[str] | None = None,
+        response_fields: list[str] | None = None,
+        top: int | None = None,
+        batch_window: float = 0,
+        checkpoint: Callable[[str], Awaitable[None] | None] | None = None,
+        compact: bool = False,
+    ) -> AsyncGenerator[list[models.CardholderChange]]:
+        """Yield the cardholder changes continuously.
+
+        The next links are chained with the same adaptive polling as the other update streams:
+        the next poll is sent immediately while changes keep coming, and backs off while idle.
+
+        Args:
+            changes_href: A href returned by get_cardholder_changes_href() or saved by a checkpoint.
+                If not provided a new href is requested using the filter arguments below.
+            filter: List of cardholder fields to monitor. See get_cardholder_changes_href().
+            cardholder_fields: List of cardholder fields to include in the changes.
+            response_fields: Specify the fields to include in the response.
+            top: Maximum number of changes per request.
+            batch_window: Number of seconds to accumulate changes before yielding them.
+                By default every non-empty poll is yielded straight away.
+            checkpoint: Called (or awaited) with the href to resume from once the consumer
+                has processed a batch. Persist it to resume the stream after a restart.
+            compact: Collapse the changes of each batch into one net change per cardholder.
+                See compact_cardholder_changes().
+
+        Yields:
+            A non-empty list of CardholderChange objects.
+        """
+        if changes_href is None:
+            changes_href = await self.get_cardholder_changes_href(
+                filter=filter,
+                cardholder_fields=cardholder_fields,
+                response_fields=response_fields,
+                top=top,
+            )
+        async for batch in self._batch_cardholder_changes(
+            changes_href, batch_window, checkpoint, compact
+        ):
+            yield batch
+
+    async def _batch_cardholder_changes(
+        self,
+        changes_href: str,
+        batch_window: float,
+        checkpoint: Callable[[str], Awaitable[None] | None] | None,
+        compact: bool,
+    ) -> AsyncGenerator[list[models.CardholderChange]]:
+        """Poll the cardholder changes and yield them in batches, then save the checkpoint."""
+        loop = asyncio.get_running_loop()
+        scheduler = PollScheduler()
+        batch: list[models.CardholderChange] = []
+        batch_started = 0.0
+        while True:
+            changes, changes_href = await self.get_cardholder_changes(changes_href)
+            if changes and not batch:
+                batch_started = loop.time()
+            batch.extend(changes)
+            remaining = batch_window - (loop.time() - batch_started)
+            if batch and remaining <= 0:
+                if compact:
+                    batch = compact_cardholder_changes(batch)
+                if batch:
+                    yield batch
+                batch = []
+                if checkpoint is not None and inspect.isawaitable(
+                    result := checkpoint(changes_href)
+                ):
+                    await result
+            delay = scheduler.next_delay(bool(changes))
+            if batch:
+                delay = min(delay, max(remaining, 0))
+            if delay:
+                await asyncio.sleep(delay)
+
     async def get_cardholder_changes_href(
         self,
         *,
@@ -1168,6 +2273,27 @@ class Client:
             models.HTTPMethods.PATCH, cardholder_href, data=patched_cardholder
         )
 
+    async def sync_cardholder(
+        self, current: models.FTCardholder, desired: models.FTCardholder
+    ) -> models.FTCardholderPatch | None:
+        """Patch a cardholder with the minimal changes needed to reach the desired state.
+
+        No request is sent when the cardholder is already up to date.
+        See diff_cardholder() for how the two states are compared.
+
+        Args:
+            current: The cardholder as returned by the server. Its href is used for the update.
+            desired: The desired cardholder state.
+
+        Returns:
+            The FTCardholderPatch that was sent, or None if nothing changed.
+        """
+        if not current.href:
+            raise ValueError("The current cardholder must have an href")
+        if (patch := diff_cardholder(current, desired)) is not None:
+            await self.update_cardholder(current.href, patch)
+        return patch
+
     async def remove_cardholder(self, cardholder_href: str) -> None:
         """Remove existing cardholder in Gallagher.
 
@@ -1186,14 +2312,17 @@ class Client:
             models.HTTPMethods.GET, self.api_features.events("eventGroups")
         )
 
+        event_groups: dict[str, models.FTEventGroup] = {}
         for item in response["eventGroups"]:
             event_group = models.FTEventGroup.model_validate(item)
-            self.event_groups[event_group.name] = event_group
+            event_groups[event_group.name] = event_group
 
-        for event_group in self.event_groups.values():
-            self.event_types.update(
+        event_types: dict[str, models.FTEventType] = {}
+        for event_group in event_groups.values():
+            event_types.update(
                 {event_type.name: event_type for event_type in event_group.event_types}
             )
+        self.event_groups, self.event_types = event_groups, event_types
 
     async def get_event_types(self) -> dict[str, models.FTEventType]:
         """Return the dictionary of event types."""
@@ -1207,6 +2336,55 @@ class Client:
             await self._fetch_event_types_and_groups()
         return self.event_groups
 
+    async def _event_filter_ids(
+        self, event_filter: models.EventQuery | None
+    ) -> models.EventQuery | None:
+        """Replace the event type and group names of a filter by their IDs.
+
+        Names are looked up in the cached event_types and event_groups. They are
+        fetched again once if a name is unknown, in case it was added or renamed.
+        Numeric values are IDs and are passed as is.
+
+        Raises:
+            ValueError: If an event type or group name does not exist.
+        """
+        if event_filter is None:
+            return None
+        types, groups = event_filter.event_types or [], event_filter.event_groups or []
+        if all(value.isdigit() for value in (*types, *groups)):
+            return event_filter
+        if any(
+            not value.isdigit() and value not in known
+            for values, known in (
+                (types, self.event_types),
+                (groups, self.event_groups),
+            )
+            for value in values
+        ):
+            await self._fetch_event_types_and_groups()
+
+        def ids(
+            values: list[str],
+            known: dict[str, models.FTEventType] | dict[str, models.FTEventGroup],
+            kind: str,
+        ) -> list[str] | None:
+            resolved: list[str] = []
+            for value in values:
+                if value.isdigit():
+                    resolved.append(value)
+                elif (item := known.get(value)) is None:
+                    raise ValueError(f"Unknown event {kind}: {value}")
+                else:
+                    resolved.append(item.id)
+            return resolved or None
+
+        return event_filter.model_copy(
+            update={
+                "event_types": ids(types, self.event_types, "type"),
+                "event_groups": ids(groups, self.event_groups, "group"),
+            }
+        )
+
     async def get_events(
         self, event_filter: models.EventQuery | None = None
     ) -> list[models.FTEvent]:
@@ -1222,9 +2400,13 @@ class Client:
             A list of FTEvent objects matching the filters.
         """
         response = await self._async_request(
-            models.HTTPMethods.GET, self.api_features.events(), params=event_filter
+            models.HTTPMethods.GET,
+            self.api_features.events(),
+            params=await self._event_filter_ids(event_filter),
+        )
+        return self._validate(
+            models.FTEvent, response["events"], self.api_features.events()
         )
-        return [models.FTEvent.model_validate(event) for event in response["events"]]
 
     async def yield_events(
         self,
@@ -1240,20 +2422,42 @@ class Client:
         Yields:
             A list of FTEvent objects matching the filters.
         """
-        response = await self._async_request(
-            models.HTTPMethods.GET, self.api_features.events(), params=event_filter
-        )
-        while True:
-            _LOGGER.debug(response)
-            events = [
-                models.FTEvent.model_validate(event) for event in response["events"]
-            ]
-            if not events:
-                break
+        async for events in self._yield_models(
+            models.FTEvent,
+            self.api_features.events(),
+            params=await self._event_filter_ids(event_filter),
+            results_key="events",
+            stop_on_empty=True,
+        ):
             yield events
-            response = await self._async_request(
-                models.HTTPMethods.GET, response["next"]["href"]
-            )
+
+    async def yield_event_batches(
+        self,
+        event_filter: models.EventQuery | None = None,
+        strings: StringTable | None = None,
+    ) -> AsyncGenerator[EventBatch]:
+        """Yield all events based on the filter as columnar batches.
+
+        This is a lighter alternative to yield_events() for reports over large numbers
+        of events. Events are not validated into FTEvent objects, each page is stored
+        as arrays of times, priorities and interned string codes.
+
+        Args:
+            event_filter: The EventQuery object containing the filter parameters.
+            strings: The string table shared by the batches. A new one is used if None.
+
+        Yields:
+            An EventBatch per page of events.
+        """
+        if strings is None:
+            strings = StringTable()
+        async for page in self._yield_pages(
+            self.api_features.events(),
+            params=await self._event_filter_ids(event_filter),
+            results_key="events",
+            stop_on_empty=True,
+        ):
+            yield EventBatch.from_events(page, strings)
 
     async def yield_new_events(
         self, event_filter: models.EventQuery | None = None, from_past: bool = False
@@ -1269,15 +2473,40 @@ class Client:
         Yields:
             A list of FTEvent objects matching the filters.
         """
+        async for events in self._yield_event_updates(event_filter, from_past):
+            yield self._validate(models.FTEvent, events, self.api_features.events())
+
+    async def yield_new_event_records(
+        self, event_filter: models.EventQuery | None = None, from_past: bool = False
+    ) -> AsyncGenerator[list[EventRecord]]:
+        """Yield a list of new events as lightweight records.
+
+        This is a lighter alternative to yield_new_events() for high-rate feeds.
+        Events are not validated, only the fields of EventRecord are kept.
+
+        Args:
+            event_filter: The EventQuery object containing the filter parameters.
+            from_past: If True, fetch events from past matching the filter before yielding new events.
+
+        Yields:
+            A list of EventRecord objects matching the filters.
+        """
+        async for events in self._yield_event_updates(event_filter, from_past):
+            yield [EventRecord.from_event(event) for event in events]
+
+    async def _yield_event_updates(
+        self, event_filter: models.EventQuery | None, from_past: bool
+    ) -> AsyncGenerator[list[dict[str, Any]]]:
+        """Poll the event updates and yield the raw events of every response."""
+        scheduler = PollScheduler(max_delay=LONG_POLL_MAX_DELAY)
         response = await self._async_request(
             models.HTTPMethods.GET,
             self.api_features.events("updates" if not from_past else None),
-            params=event_filter,
+            params=await self._event_filter_ids(event_filter),
         )
         while True:
-            _LOGGER.debug(response)
-            yield [models.FTEvent.model_validate(event) for event in response["events"]]
-            await asyncio.sleep(1)
+            yield response["events"]
+            await scheduler.wait(bool(response["events"]))
             response = await self._async_request(
                 models.HTTPMethods.GET, response["updates"]["href"]
             )
@@ -1319,7 +2548,9 @@ class Client:
         if response := await self._async_request(
             models.HTTPMethods.GET,
             self.api_features.alarms(),
-            params=models.QueryBase(response_fields=response_fields),
+            params=models.query_params(
+                models.QueryBase, response_fields=response_fields
+            ),
         ):
             alarms = [
                 models.FTAlarm.model_validate(alarm) for alarm in response["alarms"]
@@ -1328,7 +2559,9 @@ class Client:
                 if response2 := await self._async_request(
                     models.HTTPMethods.GET,
                     response["next"]["href"],
-                    params=models.QueryBase(response_fields=response_fields),
+                    params=models.query_params(
+                        models.QueryBase, response_fields=response_fields
+                    ),
                 ):
                     alarms.extend(
                         models.FTAlarm.model_validate(alarm)
@@ -1351,21 +2584,25 @@ class Client:
         Yields:
             A list of FTAlarm objects.
         """
+        scheduler = PollScheduler(max_delay=LONG_POLL_MAX_DELAY)
         response = await self._async_request(
             models.HTTPMethods.GET,
             self.api_features.alarms("updates"),
-            params=models.QueryBase(response_fields=response_fields),
+            params=models.query_params(
+                models.QueryBase, response_fields=response_fields
+            ),
         )
         while True:
-            _LOGGER.debug(response)
-            yield [
-                models.FTAlarm.model_validate(alarm) for alarm in response["updates"]
-            ]
-            await asyncio.sleep(1)
+            yield self._validate(
+                models.FTAlarm, response["updates"], self.api_features.alarms()
+            )
+            await scheduler.wait(bool(response["updates"]))
             response = await self._async_request(
                 models.HTTPMethods.GET,
                 response["next"]["href"],
-                params=models.QueryBase(response_fields=response_fields),
+                params=models.query_params(
+                    models.QueryBase, response_fields=response_fields
+                ),
             )
 
     async def alarm_action(self, action_href: str, comment: str | None) -> None:
@@ -1403,6 +2640,44 @@ class Client:
         Returns:
             A tuple of list of FTItemStatus objects and the next FTItemReference link to get new updates.
         """
+        response = await self._item_status_updates(item_ids, next_link)
+        return (
+            self._validate(
+                models.FTItemStatus,
+                response["updates"],
+                self.api_features.items("updates"),
+            ),
+            models.FTItemReference.model_validate(response["next"]),
+        )
+
+    async def get_item_status_records(
+        self,
+        item_ids: list[str] | None = None,
+        next_link: str | None = None,
+    ) -> tuple[list[StatusRecord], str]:
+        """Subscribe to items status and return lightweight status records with next link.
+
+        This is a lighter alternative to get_item_status() for polling many items.
+
+        Args:
+            item_ids: List of item IDs to get status for.
+                The first call should only include the item IDs.
+            next_link: The next link href to get new updates.
+                This is returned from a previous call to this method.
+
+        Returns:
+            A tuple of list of StatusRecord objects and the next link href to get new updates.
+        """
+        response = await self._item_status_updates(item_ids, next_link)
+        return (
+            [StatusRecord.from_update(update) for update in response["updates"]],
+            response["next"]["href"],
+        )
+
+    async def _item_status_updates(
+        self, item_ids: list[str] | None, next_link: str | None
+    ) -> dict[str, Any]:
+        """Start a status subscription or poll its next link and return the response."""
         if next_link:
             response = await self._async_request(models.HTTPMethods.GET, next_link)
         elif item_ids:
@@ -1413,10 +2688,7 @@ class Client:
             )
         else:
             raise ValueError("item ids or a next link must be provided")
-        return (
-            [models.FTItemStatus.model_validate(item) for item in response["updates"]],
-            models.FTItemReference.model_validate(response["next"]),
-        )
+        return response
 
     # endregion Status and override methods
 
@@ -1455,9 +2727,13 @@ class Client:
             response = await self._async_request(
                 models.HTTPMethods.GET,
                 f"{self.api_features.locker_banks()}/{id}",
-                params=models.QueryBase(response_fields=response_fields),
+                params=models.query_params(
+                    models.QueryBase, response_fields=response_fields
+                ),
+            )
+            return self._validate(
+                models.FTLockerBank, [response], self.api_features.locker_banks()
             )
-            return [models.FTLockerBank.model_validate(response)]
 
         response = await self._async_request(
             models.HTTPMethods.GET,
@@ -1471,9 +2747,49 @@ class Client:
                 top=top,
             ),
         )
-        return [
-            models.FTLockerBank.model_validate(locker) for locker in response["results"]
-        ]
+        return self._validate(
+            models.FTLockerBank, response["results"], self.api_features.locker_banks()
+        )
+
+    async def yield_locker_banks(
+        self,
+        *,
+        name: str | None = None,
+        description: str | None = None,
+        response_fields: list[str] | None = None,
+        division: list[str] | None = None,
+        sort: models.SortMethod | None = None,
+        top: int | None = None,
+    ) -> AsyncGenerator[list[models.FTLockerBank]]:
+        """Yield all the locker bank items matching the filters in pages.
+
+        The 'next' link is followed until every matching locker bank item is retrieved,
+        so large sites are not truncated to a single page.
+
+        Args:
+            name: Filter by locker bank item name (substring match).
+            description: Filter by locker bank item description (substring match).
+            response_fields: Specify the exact fields to include in the response. See get_locker_bank().
+            division: Filter by division IDs.
+            sort: Sort the order of the results.
+            top: Number of locker bank items per page.
+
+        Yields:
+            A list of FTLockerBank objects for each page.
+        """
+        async for page in self._yield_models(
+            models.FTLockerBank,
+            self.api_features.locker_banks(),
+            params=models.QueryBase(
+                name=name,
+                description=description,
+                division=division,
+                response_fields=response_fields,
+                sort=sort,
+                top=top,
+            ),
+        ):
+            yield page
 
     async def get_locker(self, id: str | None = None) -> models.FTLocker | None:
         """Return locker item by id.
@@ -1484,14 +2800,15 @@ class Client:
         Returns:
             The FTLocker object if found, else None.
         """
+        endpoint = f"{self.server_url}/api/lockers/{id}"
         try:
             response: dict[str, Any] = await self._async_request(
-                models.HTTPMethods.GET, f"{self.server_url}/api/lockers/{id}"
+                models.HTTPMethods.GET, endpoint
             )
         except RequestError as err:
             _LOGGER.warning(str(err))
             return None
-        return models.FTLocker.model_validate(response)
+        return self._validate(models.FTLocker, [response], endpoint)[0]
 
     async def override_locker(self, command_href: str) -> None:
         """override locker.
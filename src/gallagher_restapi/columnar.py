@@ -0,0 +1,130 @@
+"""Columnar event batches for analytics over large numbers of events."""
+
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from .utils import ref_id
+
+MISSING = -1
+
+
+class StringTable:
+    """Intern strings to integer codes.
+
+    Codes are stable for the life of the table, so batches sharing a table can be
+    compared and aggregated by code without touching the strings.
+    """
+
+    __slots__ = ("_codes", "values")
+
+    def __init__(self) -> None:
+        """Initialize an empty table."""
+        self.values: list[str] = []
+        self._codes: dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __getitem__(self, code: int) -> str | None:
+        """Return the string of a code, None for MISSING."""
+        return None if code == MISSING else self.values[code]
+
+    def code(self, value: str | None) -> int:
+        """Return the code of a string, adding it to the table if needed."""
+        if value is None:
+            return MISSING
+        if (code := self._codes.get(value)) is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def lookup(self, value: str) -> int:
+        """Return the code of a string without adding it, MISSING if unknown."""
+        return self._codes.get(value, MISSING)
+
+
+@dataclass
+class EventBatch:
+    """A batch of events stored as one array per field.
+
+    String fields are stored as codes of a StringTable shared by all the batches
+    of a stream. Arrays support the buffer protocol, so numpy.frombuffer() or
+    memoryview() can use them without copying. Missing values are MISSING (-1).
+
+    Columns:
+        time: Event time as a POSIX timestamp.
+        type: Code of the event type ID.
+        source: Code of the source item ID.
+        cardholder: Code of the cardholder ID.
+        door: Code of the door ID.
+        message: Code of the event message.
+        priority: Event priority.
+    """
+
+    strings: StringTable = field(default_factory=StringTable)
+    time: array[float] = field(default_factory=lambda: array("d"))
+    type: array[int] = field(default_factory=lambda: array("i"))
+    source: array[int] = field(default_factory=lambda: array("i"))
+    cardholder: array[int] = field(default_factory=lambda: array("i"))
+    door: array[int] = field(default_factory=lambda: array("i"))
+    message: array[int] = field(default_factory=lambda: array("i"))
+    priority: array[int] = field(default_factory=lambda: array("b"))
+
+    @classmethod
+    def from_events(
+        cls, events: Iterable[dict[str, Any]], strings: StringTable | None = None
+    ) -> EventBatch:
+        """Build a batch from raw event dicts of an events response.
+
+        Args:
+            events: The raw events.
+            strings: The string table to intern into. A new one is used if None.
+        """
+        batch = cls(StringTable() if strings is None else strings)
+        for event in events:
+            batch.append(event)
+        return batch
+
+    def append(self, event: dict[str, Any]) -> None:
+        """Append a raw event dict to the batch."""
+        code = self.strings.code
+        event_type = event.get("type")
+        self.time.append(datetime.fromisoformat(event["time"]).timestamp())
+        self.type.append(code(ref_id(event_type)))
+        self.source.append(code(ref_id(event.get("source"))))
+        self.cardholder.append(code(ref_id(event.get("cardholder"))))
+        self.door.append(code(ref_id(event.get("door"))))
+        self.message.append(code(event.get("message")))
+        self.priority.append(event.get("priority", 0))
+
+    def __len__(self) -> int:
+        return len(self.time)
+
+    @property
+    def nbytes(self) -> int:
+        """Return the memory used by the columns, excluding the string table."""
+        return sum(
+            column.itemsize * len(column)
+            for column in (
+                self.time,
+                self.type,
+                self.source,
+                self.cardholder,
+                self.door,
+                self.message,
+                self.priority,
+            )
+        )
+
+    def rows(self) -> Iterator[tuple[float, str | None, str | None, str | None]]:
+        """Yield the time, type ID, source ID and cardholder ID of every event."""
+        strings = self.strings
+        for time, type, source, cardholder in zip(
+            self.time, self.type, self.source, self.cardholder, strict=True
+        ):
+            yield time, strings[type], strings[source], strings[cardholder]
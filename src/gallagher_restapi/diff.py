@@ -0,0 +1,191 @@
+"""Compute minimal cardholder patches from a desired state."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from typing import Any, TypeVar
+
+from . import models
+from .utils import ref_id
+
+_MemberT = TypeVar(
+    "_MemberT",
+    models.FTCardholderCard,
+    models.FTAccessGroupMembership,
+    models.FTLockerMembership,
+)
+
+# Fields that are patched through their own section or cannot be written.
+_NON_SCALAR_FIELDS = {
+    "href",
+    "id",
+    "pdfs",
+    "division",
+    "personal_data_definitions",
+    "cards",
+    "access_groups",
+    "lockers",
+    "elevator_groups",
+    "update_location",
+    "last_successful_access_time",
+    "last_successful_access_zone",
+    "last_printed_or_encoded_time",
+    "last_printed_or_encoded_issue_level",
+    "server_display_name",
+    "operator_password_expired",
+}
+
+# Membership fields used to match an entry rather than to update it.
+_IDENTITY_FIELDS = {
+    "href",
+    "type",
+    "number",
+    "card_serial_number",
+    "last_used_time",
+    "access_group",
+    "cardholder",
+    "locker",
+}
+
+
+def _card_keys(card: models.FTCardholderCard) -> list[Hashable]:
+    """Return the keys a card can be matched by."""
+    keys: list[Hashable] = [card.href] if card.href else []
+    if card.number:
+        keys.append((card.number, card.type.href if card.type else None))
+    return keys
+
+
+def _access_group_keys(membership: models.FTAccessGroupMembership) -> list[Hashable]:
+    """Return the keys an access group membership can be matched by."""
+    keys: list[Hashable] = [membership.href] if membership.href else []
+    if membership.access_group and membership.access_group.href:
+        keys.append(membership.access_group.href)
+    return keys
+
+
+def _locker_keys(membership: models.FTLockerMembership) -> list[Hashable]:
+    """Return the keys a locker membership can be matched by."""
+    keys: list[Hashable] = [membership.href] if membership.href else []
+    if membership.locker:
+        keys.append(membership.locker.href)
+    return keys
+
+
+def _partial(model: type[_MemberT], values: dict[str, Any]) -> _MemberT:
+    """Build a member with only the given fields set, without validation.
+
+    Patch entries only carry the href and the changed fields, so required fields
+    of the model may be missing.
+    """
+    return model.model_construct(**values)
+
+
+def _diff_members(
+    model: type[_MemberT],
+    current: list[_MemberT],
+    desired: list[_MemberT],
+    keys: Callable[[_MemberT], list[Hashable]],
+) -> dict[str, list[_MemberT]]:
+    """Diff two lists of cardholder memberships.
+
+    Returns:
+        A dict with the non-empty 'add', 'update' and 'remove' lists.
+    """
+    index: dict[Hashable, _MemberT] = {}
+    for member in current:
+        for key in keys(member):
+            index.setdefault(key, member)
+    matched: set[int] = set()
+    add: list[_MemberT] = []
+    update: list[_MemberT] = []
+    for member in desired:
+        existing = next((index[key] for key in keys(member) if key in index), None)
+        if existing is None or id(existing) in matched:
+            add.append(member)
+            continue
+        matched.add(id(existing))
+        changed: dict[str, Any] = {
+            field: getattr(member, field)
+            for field in member.model_fields_set - _IDENTITY_FIELDS
+            if getattr(member, field) != getattr(existing, field)
+        }
+        if changed:
+            update.append(_partial(model, {"href": existing.href, **changed}))
+    remove = [
+        _partial(model, {"href": member.href})
+        for member in current
+        if id(member) not in matched and member.href
+    ]
+    return {
+        name: members
+        for name, members in (("add", add), ("update", update), ("remove", remove))
+        if members
+    }
+
+
+def diff_cardholder(
+    current: models.FTCardholder, desired: models.FTCardholder
+) -> models.FTCardholderPatch | None:
+    """Return the minimal patch that turns the current cardholder into the desired one.
+
+    Only the fields set on the desired cardholder are compared, so it can hold a partial state.
+    The division is compared by its ID only.
+    Cards, access groups and lockers are compared as a whole when set on the desired
+    cardholder: missing entries are removed, new ones are added and matching entries are
+    updated with their changed fields only. Cards are matched by href or by number and card type,
+    access groups and lockers by href or by the access group/locker href.
+
+    Args:
+        current: The cardholder as returned by the server, including the compared sections.
+            For example response_fields=['defaults', 'personalDataFields', 'cards', 'accessGroups', 'lockers'].
+        desired: The desired cardholder state.
+
+    Returns:
+        An FTCardholderPatch object, or None if the cardholder is already up to date.
+    """
+    patch: dict[str, Any] = {
+        field: getattr(desired, field)
+        for field in desired.model_fields_set - _NON_SCALAR_FIELDS
+        if getattr(desired, field) != getattr(current, field)
+    }
+    if "division" in desired.model_fields_set and ref_id(desired.division) != ref_id(
+        current.division
+    ):
+        patch["division"] = desired.division
+    if pdfs := {
+        name: value
+        for name, value in desired.pdfs.items()
+        if current.pdfs.get(name) != value
+    }:
+        patch["pdfs"] = pdfs
+    if isinstance(desired.cards, list) and (
+        cards := _diff_members(
+            models.FTCardholderCard,
+            current.cards if isinstance(current.cards, list) else [],
+            desired.cards,
+            _card_keys,
+        )
+    ):
+        patch["cards"] = models.FTCardholderCardsPatch(**cards)
+    if isinstance(desired.access_groups, list) and (
+        access_groups := _diff_members(
+            models.FTAccessGroupMembership,
+            current.access_groups if isinstance(current.access_groups, list) else [],
+            desired.access_groups,
+            _access_group_keys,
+        )
+    ):
+        patch["access_groups"] = models.FTCardholderAccessGroupsPatch(**access_groups)
+    if isinstance(desired.lockers, list) and (
+        lockers := _diff_members(
+            models.FTLockerMembership,
+            current.lockers if isinstance(current.lockers, list) else [],
+            desired.lockers,
+            _locker_keys,
+        )
+    ):
+        patch["lockers"] = models.FTCardholderLockersPatch(**lockers)
+    if not patch:
+        return None
+    return models.FTCardholderPatch(**patch)
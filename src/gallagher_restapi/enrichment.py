@@ -0,0 +1,238 @@
+"""Cached enrichment of events with the details of the items they reference."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    Awaitable,
+    Callable,
+    Iterable,
+)
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+
+from . import models
+from .client import Client
+from .utils import id_from_href
+
+ENRICHMENT_CACHE_SIZE = 10_000
+ENRICHMENT_CACHE_TTL = timedelta(minutes=5)
+
+ENRICHED_FIELDS = models.EVENT_ITEM_FIELDS
+
+
+@dataclass(slots=True)
+class EnrichedEvent:
+    """An event with the full details of the items it references.
+
+    Referenced items that do not exist, or that the operator is not allowed to
+    view, are None.
+    """
+
+    event: models.FTEvent
+    source: models.FTItem | models.FTDoor | models.FTAccessZone | None = None
+    door: models.FTDoor | None = None
+    cardholder: models.FTCardholder | None = None
+    entry_access_zone: models.FTAccessZone | None = None
+    exit_access_zone: models.FTAccessZone | None = None
+
+
+class _TTLCache:
+    """LRU cache whose entries expire after a time to live."""
+
+    def __init__(self, max_size: int, ttl: float) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> tuple[bool, Any]:
+        """Return whether the key is cached and its value."""
+        if (entry := self._entries.get(key)) is None:
+            return False, None
+        if entry[0] < time.monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, entry[1]
+
+    def put(self, key: str, value: Any) -> None:
+        """Cache a value, evicting the least recently used entries if full."""
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        """Drop a key if cached."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all entries."""
+        self._entries.clear()
+
+
+class EventEnricher:
+    """Attach the details of the referenced doors, access zones and cardholders.
+
+    Items are cached by href. The misses of a batch of events are grouped by
+    collection and fetched with one get_*_by_ids() call each, and an item already
+    being fetched for another batch is awaited instead of requested again.
+
+        enricher = EventEnricher(client)
+        async for events in enricher.stream(client.yield_new_events()):
+            for enriched in events:
+                print(enriched.cardholder.first_name, enriched.door.name)
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        *,
+        fields: Iterable[str] = ENRICHED_FIELDS,
+        response_fields: dict[str, list[str]] | None = None,
+        max_size: int = ENRICHMENT_CACHE_SIZE,
+        ttl: timedelta = ENRICHMENT_CACHE_TTL,
+    ) -> None:
+        """Initialize the enricher.
+
+        Args:
+            client: An initialized Gallagher client.
+            fields: The event fields to enrich, a subset of ENRICHED_FIELDS.
+            response_fields: The response fields requested per collection.
+                Example: {'cardholders': ['defaults', 'personalDataFields']}
+            max_size: Maximum number of cached items.
+            ttl: How long a cached item is used before it is fetched again.
+        """
+        if unknown := set(fields) - set(ENRICHED_FIELDS):
+            raise ValueError(f"Unknown event fields: {', '.join(sorted(unknown))}")
+        self.client = client
+        self.fields = tuple(fields)
+        self.response_fields = response_fields or {}
+        self.hits = 0
+        self.misses = 0
+        self._cache = _TTLCache(max_size, ttl.total_seconds())
+        self._pending: dict[str, asyncio.Future[Any]] = {}
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def invalidate(self, href: str | None = None) -> None:
+        """Drop an item, or all items, from the cache."""
+        if href is None:
+            self._cache.clear()
+        else:
+            self._cache.pop(href)
+
+    def _href(self, item: Any) -> str | None:
+        """Return the href of a referenced item, built from its ID if needed."""
+        if item is None:
+            return None
+        if href := getattr(item, "href", None):
+            return href
+        if id := getattr(item, "id", None):
+            return f"{self.client.api_features.items()}/{id}"
+        return None
+
+    async def _fetch(self, futures: dict[str, asyncio.Future[Any]]) -> None:
+        """Fetch items by collection and resolve their futures.
+
+        Runs as a task of its own, so a cancelled caller does not stop a fetch
+        other callers wait for. Every future is resolved, with the error of its
+        request if it failed, or cancelled if the task is.
+        """
+        client = self.client
+        fetchers: dict[str, Callable[..., Awaitable[dict[str, Any]]]] = {
+            "doors": client.get_doors_by_ids,
+            "access_zones": client.get_access_zones_by_ids,
+            "cardholders": client.get_cardholders_by_ids,
+        }
+        collections: dict[str, dict[str, str]] = {}
+        for href in futures:
+            if (collection := href.rstrip("/").rsplit("/", 2)[-2]) not in fetchers:
+                collection = "items"
+            collections.setdefault(collection, {})[id_from_href(href)] = href
+
+        async def fetch(collection: str, ids: dict[str, str]) -> None:
+            fetcher = fetchers.get(collection, client.get_items_by_ids)
+            items = await fetcher(
+                ids, response_fields=self.response_fields.get(collection)
+            )
+            for id, href in ids.items():
+                item = items.get(id)
+                self._cache.put(href, item)
+                futures[href].set_result(item)
+
+        try:
+            results = await asyncio.gather(
+                *(fetch(collection, ids) for collection, ids in collections.items()),
+                return_exceptions=True,
+            )
+            for ids, result in zip(collections.values(), results, strict=True):
+                if isinstance(result, Exception):
+                    for href in ids.values():
+                        if not futures[href].done():
+                            futures[href].set_exception(result)
+        finally:
+            for href, future in futures.items():
+                if self._pending.get(href) is future:
+                    del self._pending[href]
+                future.cancel()
+
+    async def resolve(self, hrefs: Iterable[str]) -> dict[str, Any]:
+        """Return the items of some hrefs, from the cache or fetched in batches."""
+        items: dict[str, Any] = {}
+        waiting: dict[str, asyncio.Future[Any]] = {}
+        missing: dict[str, asyncio.Future[Any]] = {}
+        loop = asyncio.get_running_loop()
+        for href in dict.fromkeys(hrefs):
+            hit, item = self._cache.get(href)
+            if hit:
+                self.hits += 1
+                items[href] = item
+            elif (future := self._pending.get(href)) is not None:
+                self.hits += 1
+                waiting[href] = future
+            else:
+                self.misses += 1
+                waiting[href] = missing[href] = self._pending[href] = (
+                    loop.create_future()
+                )
+        if missing:
+            task = asyncio.create_task(self._fetch(missing))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        for href, future in waiting.items():
+            # Shielded, cancelling this call must not cancel a shared future
+            items[href] = await asyncio.shield(future)
+        return items
+
+    async def enrich(self, events: Iterable[models.FTEvent]) -> list[EnrichedEvent]:
+        """Return the events with the details of their referenced items."""
+        events = list(events)
+        references = [
+            {field: self._href(getattr(event, field)) for field in self.fields}
+            for event in events
+        ]
+        items = await self.resolve(
+            href for hrefs in references for href in hrefs.values() if href
+        )
+        return [
+            EnrichedEvent(
+                event,
+                **{field: items[href] for field, href in hrefs.items() if href},
+            )
+            for event, hrefs in zip(events, references, strict=True)
+        ]
+
+    async def stream(
+        self, events: AsyncIterable[list[models.FTEvent]]
+    ) -> AsyncGenerator[list[EnrichedEvent]]:
+        """Enrich every batch of an event stream, like yield_new_events()."""
+        async for batch in events:
+            yield await self.enrich(batch)
@@ -0,0 +1,182 @@
+"""In-memory buffer of recent events."""
+
+from __future__ import annotations
+
+import math
+import sys
+import time
+from collections import deque
+from collections.abc import AsyncIterable, Iterable
+from datetime import datetime, timedelta
+from typing import Any
+
+from . import models
+from .utils import ref_id
+
+BUFFER_RETENTION = timedelta(hours=1)
+BUFFER_MAX_EVENTS = 100_000
+_SIZE_SAMPLE = 20
+
+
+def _deep_size(obj: Any, seen: set[int]) -> int:
+    """Return the approximate memory of an object and everything it references."""
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_deep_size(k, seen) + _deep_size(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(_deep_size(item, seen) for item in obj)
+    elif hasattr(obj, "__dict__"):
+        size += _deep_size(obj.__dict__, seen)
+    return size
+
+
+class EventBuffer:
+    """Bounded, time-indexed ring buffer of recent events.
+
+    Events are kept for the retention time, up to max_events. The buffer is indexed
+    by source, event type and cardholder, so questions like "events of door X in
+    the last 15 minutes" are answered from memory:
+
+        buffer = EventBuffer(retention=timedelta(minutes=30))
+        asyncio.create_task(buffer.feed(client.yield_new_events()))
+        ...
+        buffer.query(since=timedelta(minutes=15), source="359")
+    """
+
+    def __init__(
+        self,
+        *,
+        retention: timedelta = BUFFER_RETENTION,
+        max_events: int = BUFFER_MAX_EVENTS,
+    ) -> None:
+        """Initialize the buffer.
+
+        Args:
+            retention: How long events are kept, by event time.
+            max_events: Maximum number of events kept, the oldest are dropped first.
+        """
+        self.retention = retention.total_seconds()
+        self.max_events = max_events
+        self._events: deque[tuple[float, models.FTEvent]] = deque()
+        self._indexes: dict[str, dict[str, deque[tuple[float, models.FTEvent]]]] = {
+            "source": {},
+            "type": {},
+            "cardholder": {},
+        }
+
+    def __len__(self) -> int:
+        return len(self._events)
+
+    @staticmethod
+    def _keys(event: models.FTEvent) -> dict[str, str | None]:
+        """Return the index keys of an event."""
+        return {
+            "source": ref_id(event.source),
+            "type": ref_id(event.type),
+            "cardholder": ref_id(event.cardholder),
+        }
+
+    def add(self, events: Iterable[models.FTEvent]) -> None:
+        """Add events, oldest first, and drop the events past the retention."""
+        for event in events:
+            entry = (event.time.timestamp(), event)
+            self._events.append(entry)
+            for name, key in self._keys(event).items():
+                if key is not None:
+                    self._indexes[name].setdefault(key, deque()).append(entry)
+        self.expire()
+
+    def expire(self, now: float | None = None) -> None:
+        """Drop the events older than the retention or beyond max_events."""
+        cutoff = (time.time() if now is None else now) - self.retention
+        events = self._events
+        while events and (len(events) > self.max_events or events[0][0] < cutoff):
+            entry = events.popleft()
+            for name, key in self._keys(entry[1]).items():
+                index = self._indexes[name]
+                if key is not None and (entries := index.get(key)):
+                    if entries[0] is entry:
+                        entries.popleft()
+                    if not entries:
+                        del index[key]
+
+    def query(
+        self,
+        *,
+        since: timedelta | datetime | None = None,
+        source: str | None = None,
+        type: str | None = None,
+        cardholder: str | None = None,
+    ) -> list[models.FTEvent]:
+        """Return the buffered events matching all the given filters, oldest first.
+
+        Args:
+            since: Only events newer than this time, or than this long ago.
+            source: ID of the source item.
+            type: ID of the event type.
+            cardholder: ID of the cardholder.
+        """
+        self.expire()
+        if since is None:
+            cutoff = -math.inf
+        elif isinstance(since, timedelta):
+            cutoff = time.time() - since.total_seconds()
+        else:
+            cutoff = since.timestamp()
+        filters = {
+            name: key
+            for name, key in (
+                ("source", source),
+                ("type", type),
+                ("cardholder", cardholder),
+            )
+            if key is not None
+        }
+        # Scan the smallest of the matching indexes, newest first
+        candidates = self._events
+        for name, key in filters.items():
+            entries = self._indexes[name].get(key, deque())
+            if len(entries) < len(candidates):
+                candidates = entries
+        matches: list[models.FTEvent] = []
+        for timestamp, event in reversed(candidates):
+            if timestamp < cutoff:
+                break
+            keys = self._keys(event)
+            if all(keys[name] == key for name, key in filters.items()):
+                matches.append(event)
+        matches.reverse()
+        return matches
+
+    async def feed(self, stream: AsyncIterable[list[models.FTEvent]]) -> None:
+        """Add the events of a live stream, like yield_new_events(), until it ends."""
+        async for events in stream:
+            self.add(events)
+
+    def memory_usage(self) -> dict[str, int]:
+        """Return an estimate of the memory used by the buffer in bytes.
+
+        The size of the events is extrapolated from a sample of recent events.
+        """
+        containers = sys.getsizeof(self._events) + sum(
+            sys.getsizeof(index)
+            + sum(sys.getsizeof(entries) for entries in index.values())
+            for index in self._indexes.values()
+        )
+        sample = [event for _, event in list(self._events)[-_SIZE_SAMPLE:]]
+        seen: set[int] = set()
+        per_event = (
+            sum(_deep_size(event, seen) for event in sample) / len(sample)
+            if sample
+            else 0
+        )
+        return {
+            "events": len(self._events),
+            "index_keys": sum(len(index) for index in self._indexes.values()),
+            "containers_bytes": containers,
+            "events_bytes": int(per_event * len(self._events)),
+            "total_bytes": containers + int(per_event * len(self._events)),
+        }
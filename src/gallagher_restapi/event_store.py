@@ -0,0 +1,285 @@
+"""Local SQLite store of historical events."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from . import models
+from .backfill import BACKFILL_WINDOW, EventBackfill
+from .client import MAX_CONCURRENT_REQUESTS, Client
+from .utils import ref_id
+
+DEFAULT_TOP = 1000
+SETTLE_TIME = timedelta(minutes=15)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id TEXT PRIMARY KEY,
+    time REAL NOT NULL,
+    type_id TEXT,
+    group_id TEXT,
+    source_id TEXT,
+    cardholder_id TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS events_time ON events (time);
+CREATE INDEX IF NOT EXISTS events_type ON events (type_id, time);
+CREATE INDEX IF NOT EXISTS events_group ON events (group_id, time);
+CREATE INDEX IF NOT EXISTS events_source ON events (source_id, time);
+CREATE INDEX IF NOT EXISTS events_cardholder ON events (cardholder_id, time);
+CREATE TABLE IF NOT EXISTS related_items (
+    item_id TEXT NOT NULL,
+    event_id TEXT NOT NULL,
+    PRIMARY KEY (item_id, event_id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS coverage (
+    start_time REAL NOT NULL,
+    end_time REAL NOT NULL
+);
+"""
+
+
+class EventStore:
+    """Indexed SQLite store answering EventQuery filters locally.
+
+    The store keeps track of the time ranges it holds all events of. get_events()
+    fetches only the parts of the requested range the store does not cover yet,
+    then answers the query from the database.
+
+    Filters follow the server semantics: events from after (inclusive) to before
+    (exclusive), oldest first or newest first with previous, at most top events
+    (1000 by default). The type, group, source, cardholders and related_items
+    filters match any of the given IDs.
+
+    The async methods run their database calls in worker threads, so a large
+    query does not block the event loop.
+    """
+
+    def __init__(
+        self,
+        client: Client | None = None,
+        path: str | os.PathLike[str] = ":memory:",
+        *,
+        window: timedelta = BACKFILL_WINDOW,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+        settle_time: timedelta = SETTLE_TIME,
+    ) -> None:
+        """Initialize the store.
+
+        Args:
+            client: An initialized Gallagher client, used to fetch missing ranges.
+                Without a client the store only answers from its database.
+            path: The SQLite database file.
+            window: Length of the time windows missing ranges are fetched in.
+            max_concurrency: Maximum number of windows fetched at the same time.
+            settle_time: How long after an event time the store waits before it
+                considers that time complete. Events can be recorded late, for
+                example by controllers that were offline, so the most recent
+                events are fetched again by the next sync.
+        """
+        self.client = client
+        self.window = window
+        self.max_concurrency = max_concurrency
+        self.settle_time = settle_time
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.executescript(_SCHEMA)
+        # Serializes the worker threads using the connection
+        self._lock = threading.RLock()
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self.connection.close()
+
+    def add_events(self, events: Iterable[models.FTEvent]) -> int:
+        """Insert or replace events and return the number of events written."""
+        rows = []
+        related: list[tuple[str, str]] = []
+        for event in events:
+            type_id = event.type if isinstance(event.type, str) else event.type.id
+            rows.append(
+                (
+                    event.id,
+                    event.time.timestamp(),
+                    type_id,
+                    ref_id(event.group),
+                    ref_id(event.source),
+                    ref_id(event.cardholder),
+                    json.dumps(event.model_dump()),
+                )
+            )
+            related.extend(
+                (item_id, event.id)
+                for item in (
+                    event.source,
+                    event.door,
+                    event.entry_access_zone,
+                    event.exit_access_zone,
+                    event.cardholder,
+                    event.operator,
+                    event.access_group,
+                )
+                if (item_id := ref_id(item))
+            )
+        with self._lock, self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO events VALUES (?, ?, ?, ?, ?, ?, ?)", rows
+            )
+            self.connection.executemany(
+                "INSERT OR IGNORE INTO related_items VALUES (?, ?)", related
+            )
+        return len(rows)
+
+    def covered_ranges(self) -> list[tuple[float, float]]:
+        """Return the merged time ranges the store holds all events of."""
+        with self._lock:
+            return self.connection.execute(
+                "SELECT start_time, end_time FROM coverage ORDER BY start_time"
+            ).fetchall()
+
+    def mark_covered(self, after: datetime, before: datetime) -> None:
+        """Record that the store holds all events from after to before."""
+        start, end = after.timestamp(), before.timestamp()
+        merged: list[tuple[float, float]] = []
+        with self._lock:
+            for range_start, range_end in sorted(
+                [*self.covered_ranges(), (start, end)]
+            ):
+                if merged and range_start <= merged[-1][1]:
+                    merged[-1] = (merged[-1][0], max(merged[-1][1], range_end))
+                else:
+                    merged.append((range_start, range_end))
+            with self.connection:
+                self.connection.execute("DELETE FROM coverage")
+                self.connection.executemany(
+                    "INSERT INTO coverage VALUES (?, ?)", merged
+                )
+
+    def missing_ranges(
+        self, after: datetime, before: datetime
+    ) -> list[tuple[datetime, datetime]]:
+        """Return the parts of a time range the store does not cover."""
+        start, end = after.timestamp(), before.timestamp()
+        missing: list[tuple[float, float]] = []
+        for range_start, range_end in self.covered_ranges():
+            if range_end <= start:
+                continue
+            if range_start >= end:
+                break
+            if range_start > start:
+                missing.append((start, range_start))
+            start = max(start, range_end)
+        if start < end:
+            missing.append((start, end))
+        return [
+            (datetime.fromtimestamp(low, UTC), datetime.fromtimestamp(high, UTC))
+            for low, high in missing
+        ]
+
+    def query(
+        self, event_filter: models.EventQuery | None = None
+    ) -> list[models.FTEvent]:
+        """Answer an event query from the database only.
+
+        Raises:
+            ValueError: If the filter has event type or group names. Only a
+                client can resolve them to IDs, use get_events() with a client.
+        """
+        event_filter = event_filter or models.EventQuery()
+        if any(
+            not value.isdigit()
+            for value in (
+                *(event_filter.event_types or []),
+                *(event_filter.event_groups or []),
+            )
+        ):
+            raise ValueError(
+                "Event type and group names need a client, filter by their IDs"
+            )
+        where: list[str] = []
+        args: list[Any] = []
+        if event_filter.after is not None:
+            where.append("time >= ?")
+            args.append(event_filter.after.timestamp())
+        if event_filter.before is not None:
+            where.append("time < ?")
+            args.append(event_filter.before.timestamp())
+        for column, ids in (
+            ("type_id", event_filter.event_types),
+            ("group_id", event_filter.event_groups),
+            ("source_id", event_filter.source),
+            ("cardholder_id", event_filter.cardholders),
+        ):
+            if ids:
+                where.append(f"{column} IN ({','.join('?' * len(ids))})")
+                args.extend(ids)
+        if event_filter.related_items:
+            ids = event_filter.related_items
+            where.append(
+                "id IN (SELECT event_id FROM related_items "
+                f"WHERE item_id IN ({','.join('?' * len(ids))}))"
+            )
+            args.extend(ids)
+        sql = "SELECT data FROM events"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        order = "DESC" if event_filter.previous else "ASC"
+        sql += f" ORDER BY time {order}, CAST(id AS INTEGER) {order} LIMIT ?"
+        args.append(event_filter.top or DEFAULT_TOP)
+        with self._lock:
+            rows = self.connection.execute(sql, args).fetchall()
+        return [models.FTEvent.model_validate(json.loads(data)) for (data,) in rows]
+
+    async def sync(self, after: datetime, before: datetime) -> int:
+        """Fetch all events of the ranges from after to before the store lacks.
+
+        Returns:
+            The number of events fetched.
+        """
+        if self.client is None:
+            raise ValueError("A client is required to fetch events")
+        fetched = 0
+        for start, end in await asyncio.to_thread(self.missing_ranges, after, before):
+            backfill = EventBackfill(
+                self.client,
+                models.EventQuery(after=start, before=end, top=DEFAULT_TOP),
+                window=self.window,
+                max_concurrency=self.max_concurrency,
+            )
+            async for events in backfill.stream():
+                fetched += await asyncio.to_thread(self.add_events, events)
+            if (settled := min(end, datetime.now(UTC) - self.settle_time)) > start:
+                await asyncio.to_thread(self.mark_covered, start, settled)
+        return fetched
+
+    async def get_events(
+        self, event_filter: models.EventQuery | None = None
+    ) -> list[models.FTEvent]:
+        """Return the events matching the filter, like Client.get_events().
+
+        Ranges the store lacks are fetched from the server first. A query without
+        an after time cannot be covered, so it is sent to the server and its
+        results are added to the store.
+
+        Raises:
+            ValueError: If the filter has event type or group names and the store
+                has no client to resolve them.
+        """
+        event_filter = event_filter or models.EventQuery()
+        if self.client is None:
+            return await asyncio.to_thread(self.query, event_filter)
+        event_filter = await self.client._event_filter_ids(event_filter)
+        assert event_filter is not None
+        if event_filter.after is None:
+            events = await self.client.get_events(event_filter)
+            await asyncio.to_thread(self.add_events, events)
+            return events
+        await self.sync(event_filter.after, event_filter.before or datetime.now(UTC))
+        return await asyncio.to_thread(self.query, event_filter)
@@ -19,3 +19,8 @@ class LicenseError(GllApiError):
 
 class RequestError(GllApiError):
     """Request error."""
+
+    def __init__(self, message: str, status_code: int | None = None) -> None:
+        """Initialize the error with the HTTP status code of the response."""
+        super().__init__(message)
+        self.status_code = status_code
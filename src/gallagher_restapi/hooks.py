@@ -0,0 +1,221 @@
+"""Request lifecycle hooks and latency metrics."""
+
+from __future__ import annotations
+
+import bisect
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlsplit
+
+from .exceptions import GllApiError
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+
+def endpoint_family(method: str, url: str) -> str:
+    """Return the endpoint family of a request used to group metrics.
+
+    POST requests to an item href (e.g. /api/doors/1/open) are overrides and are
+    grouped as 'commands'. Status subscriptions are grouped as 'items/updates'.
+    Everything else is grouped by the first segment of the path after /api.
+    """
+    segments = [s for s in urlsplit(url).path.split("/") if s]
+    if segments and segments[0] == "api":
+        segments = segments[1:]
+    if not segments:
+        return "api"
+    if segments[:2] == ["items", "updates"]:
+        return "items/updates"
+    if method == "POST" and len(segments) >= 3 and segments[0] != "cardholders":
+        return "commands"
+    return segments[0]
+
+
+@dataclass(slots=True)
+class RequestInfo:
+    """A request about to be sent."""
+
+    method: str
+    url: str
+    family: str
+    bytes_sent: int = 0
+
+
+@dataclass(slots=True)
+class ResponseInfo:
+    """A response that was received."""
+
+    request: RequestInfo
+    status_code: int
+    duration: float
+    bytes_received: int
+
+
+class RequestHooks:
+    """Base class of request hooks. Override the methods you need.
+
+    Hooks are called synchronously in the request path, so they should be cheap.
+    """
+
+    def before_send(self, request: RequestInfo) -> None:
+        """Called before a request is sent."""
+
+    def after_response(self, response: ResponseInfo) -> None:
+        """Called when a response is received, including error responses."""
+
+    def on_error(self, request: RequestInfo, error: GllApiError) -> None:
+        """Called when a request fails with a connection or response error."""
+
+    def on_validation(
+        self, family: str, model: str, rows: int, duration: float
+    ) -> None:
+        """Called after a response page is validated into models."""
+
+
+@dataclass
+class Histogram:
+    """Cumulative latency histogram with fixed bucket bounds."""
+
+    buckets: tuple[float, ...] = DEFAULT_BUCKETS
+    counts: list[int] = field(default_factory=list)
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def __post_init__(self) -> None:
+        """Initialize a counter per bucket plus the overflow bucket."""
+        self.counts = self.counts or [0] * (len(self.buckets) + 1)
+
+    def observe(self, value: float) -> None:
+        """Record a value."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """Return the upper bound of the bucket holding the q quantile."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts, strict=False):
+            seen += count
+            if seen >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a JSON serializable summary."""
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "max": self.max,
+            "buckets": dict(
+                zip([*map(str, self.buckets), "+Inf"], self.counts, strict=True)
+            ),
+        }
+
+
+class MetricsCollector(RequestHooks):
+    """Collect request latency, status codes, errors, bytes and validation time.
+
+    Metrics are grouped by endpoint family, e.g. cardholders, events,
+    items/updates and commands.
+
+        metrics = MetricsCollector()
+        client = Client(api_key, hooks=[metrics])
+        ...
+        metrics.snapshot()
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        """Initialize the collector.
+
+        Args:
+            buckets: Upper bounds in seconds of the latency histogram buckets.
+        """
+        self.buckets = buckets
+        self.latency: dict[str, Histogram] = defaultdict(self._histogram)
+        self.status_codes: dict[str, Counter[int]] = defaultdict(Counter)
+        self.errors: dict[str, Counter[str]] = defaultdict(Counter)
+        self.bytes_sent: Counter[str] = Counter()
+        self.bytes_received: Counter[str] = Counter()
+        self.validation_seconds: dict[str, float] = defaultdict(float)
+        self.validated_rows: Counter[str] = Counter()
+
+    def _histogram(self) -> Histogram:
+        return Histogram(self.buckets)
+
+    def before_send(self, request: RequestInfo) -> None:
+        """Record the request body size."""
+        self.bytes_sent[request.family] += request.bytes_sent
+
+    def after_response(self, response: ResponseInfo) -> None:
+        """Record the latency, status code and response size."""
+        family = response.request.family
+        self.latency[family].observe(response.duration)
+        self.status_codes[family][response.status_code] += 1
+        self.bytes_received[family] += response.bytes_received
+
+    def on_error(self, request: RequestInfo, error: GllApiError) -> None:
+        """Record the error type."""
+        self.errors[request.family][type(error).__name__] += 1
+
+    def on_validation(
+        self, family: str, model: str, rows: int, duration: float
+    ) -> None:
+        """Record the time spent validating models."""
+        self.validation_seconds[family] += duration
+        self.validated_rows[family] += rows
+
+    def reset(self) -> None:
+        """Clear all collected metrics."""
+        for metric in (
+            self.latency,
+            self.status_codes,
+            self.errors,
+            self.bytes_sent,
+            self.bytes_received,
+            self.validation_seconds,
+            self.validated_rows,
+        ):
+            metric.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Return the collected metrics per endpoint family."""
+        families = (
+            self.latency.keys() | self.errors.keys() | self.validation_seconds.keys()
+        )
+        return {
+            family: {
+                "latency": self.latency[family].as_dict()
+                if family in self.latency
+                else None,
+                "status_codes": dict(self.status_codes.get(family, {})),
+                "errors": dict(self.errors.get(family, {})),
+                "bytes_sent": self.bytes_sent[family],
+                "bytes_received": self.bytes_received[family],
+                "validation_seconds": self.validation_seconds.get(family, 0.0),
+                "validated_rows": self.validated_rows[family],
+            }
+            for family in sorted(families)
+        }
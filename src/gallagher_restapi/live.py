@@ -0,0 +1,124 @@
+"""Gap-aware live event feed."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict
+from collections.abc import AsyncGenerator
+from datetime import datetime
+
+from . import models
+from .client import POLL_MAX_DELAY, Client, PollScheduler
+from .exceptions import ConnectError, RequestError
+
+_LOGGER = logging.getLogger(__name__)
+
+DEDUPE_SIZE = 10_000
+RECONNECT_MIN_DELAY = 1.0
+
+
+class LiveEventFeed:
+    """Deliver new events without gaps across reconnects and restarts.
+
+    The feed remembers the time and ID of the last event it delivered. When the
+    update stream fails it reconnects, and whenever it (re)connects with a known
+    last time it first fetches the missed interval with yield_events(after=...).
+    Events are deduplicated by ID, so the overlap between the catch-up and the live
+    stream is delivered once.
+
+        feed = LiveEventFeed(client, last_time=saved_time, last_id=saved_id)
+        async for events in feed:
+            ...
+            save(feed.last_time, feed.last_id)
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        event_filter: models.EventQuery | None = None,
+        *,
+        last_time: datetime | None = None,
+        last_id: str | None = None,
+        dedupe_size: int = DEDUPE_SIZE,
+        reconnect_min_delay: float = RECONNECT_MIN_DELAY,
+        reconnect_max_delay: float = POLL_MAX_DELAY,
+    ) -> None:
+        """Initialize the feed.
+
+        Args:
+            client: An initialized Gallagher client.
+            event_filter: The EventQuery object containing the filter parameters.
+            last_time: Time of the last event delivered before a restart.
+                The feed starts with a catch-up from this time.
+            last_id: ID of the last event delivered before a restart.
+            dedupe_size: Number of recent event IDs remembered for deduplication.
+            reconnect_min_delay: Delay before the first reconnect attempt.
+            reconnect_max_delay: Maximum delay between reconnect attempts.
+        """
+        self.client = client
+        self.event_filter = event_filter or models.EventQuery()
+        self.last_time = last_time
+        self.last_id = last_id
+        self.dedupe_size = dedupe_size
+        self._reconnect = PollScheduler(reconnect_min_delay, reconnect_max_delay)
+        self._seen: OrderedDict[str, None] = OrderedDict()
+        if last_id is not None:
+            self._seen[last_id] = None
+
+    def _accept(self, events: list[models.FTEvent]) -> list[models.FTEvent]:
+        """Return the events not delivered yet and remember them."""
+        new: list[models.FTEvent] = []
+        for event in events:
+            if event.id in self._seen:
+                continue
+            self._seen[event.id] = None
+            if len(self._seen) > self.dedupe_size:
+                self._seen.popitem(last=False)
+            new.append(event)
+            if self.last_time is None or event.time >= self.last_time:
+                self.last_time = event.time
+                self.last_id = event.id
+        return new
+
+    async def _catch_up(self) -> AsyncGenerator[list[models.FTEvent]]:
+        """Yield the events since the last delivered event."""
+        query = self.event_filter.model_copy(
+            update={"after": self.last_time, "before": None, "previous": None}
+        )
+        async for events in self.client.yield_events(query):
+            if new := self._accept(events):
+                yield new
+
+    async def _connect(self) -> AsyncGenerator[list[models.FTEvent]]:
+        """Catch up and then follow the update stream until it fails."""
+        if self.last_time is not None:
+            async for events in self._catch_up():
+                yield events
+        caught_up = self.last_time is None
+        async for events in self.client.yield_new_events(self.event_filter):
+            if not caught_up:
+                # Events between the catch-up and the start of the subscription
+                caught_up = True
+                async for missed in self._catch_up():
+                    yield missed
+            self._reconnect.next_delay(True)
+            if new := self._accept(events):
+                yield new
+
+    async def __aiter__(self) -> AsyncGenerator[list[models.FTEvent]]:
+        """Yield new events, reconnecting and filling the gap when the stream fails.
+
+        Yields:
+            A non-empty list of FTEvent objects not delivered before.
+        """
+        while True:
+            try:
+                async for events in self._connect():
+                    yield events
+            except (ConnectError, RequestError) as err:
+                delay = self._reconnect.next_delay(False)
+                _LOGGER.warning(
+                    "Live event feed interrupted, reconnecting in %ss: %s", delay, err
+                )
+                await asyncio.sleep(delay)
@@ -0,0 +1,142 @@
+"""Local mirror of the cardholders kept fresh through cardholder changes."""
+
+from __future__ import annotations
+
+import logging
+
+from . import models
+from .changes import CardholderChangeFollower
+from .client import Client
+
+_LOGGER = logging.getLogger(__name__)
+
+DEFAULT_MIRROR_FIELDS = ["defaults", "personalDataFields"]
+
+
+def _name_key(first_name: str | None, last_name: str | None) -> str:
+    """Return the normalized lookup key of a cardholder name."""
+    return " ".join(filter(None, (first_name, last_name))).casefold()
+
+
+class CardholderMirror(CardholderChangeFollower):
+    """In-memory copy of the cardholders for fast local lookups.
+
+    Seed it once with load(), then call sync() periodically (or feed it the
+    batches of yield_cardholder_changes through apply_changes()) to keep it fresh.
+    Lookups by ID, name and personal data field value are plain dict lookups.
+    """
+
+    def __init__(
+        self, client: Client, *, response_fields: list[str] | None = None
+    ) -> None:
+        """Initialize the mirror.
+
+        Args:
+            client: An initialized Gallagher client.
+            response_fields: Cardholder fields to keep in the mirror.
+                Include 'personalDataFields' to be able to look up by PDF values.
+        """
+        self.client = client
+        self.response_fields = response_fields or DEFAULT_MIRROR_FIELDS
+        self.changes_href: str | None = None
+        self._cardholders: dict[str, models.FTCardholder] = {}
+        self._by_name: dict[str, set[str]] = {}
+        self._by_pdf: dict[tuple[str, str | int], set[str]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of mirrored cardholders."""
+        return len(self._cardholders)
+
+    def __contains__(self, id: object) -> bool:
+        """Return True if the cardholder ID is mirrored."""
+        return id in self._cardholders
+
+    async def load(self, *, top: int = 1000) -> None:
+        """Seed the mirror with a full export of the cardholders.
+
+        The changes href is requested before the export starts so that
+        changes made during the export are picked up by the next sync().
+
+        Args:
+            top: Number of cardholders requested per page.
+        """
+        self.changes_href = await self.client.get_cardholder_changes_href(
+            cardholder_fields=self.response_fields
+        )
+        self._cardholders.clear()
+        self._by_name.clear()
+        self._by_pdf.clear()
+        async for cardholders in self.client.yield_cardholders(
+            response_fields=self.response_fields, top=top
+        ):
+            for cardholder in cardholders:
+                if cardholder.id:
+                    self._store(cardholder.id, cardholder)
+        _LOGGER.debug("Cardholder mirror loaded %s cardholders", len(self))
+
+    def _upsert(self, id: str, href: str, change: models.CardholderChange) -> None:
+        """Store an added or updated cardholder.
+
+        The cardholder included in the change replaces the stored one when
+        available, otherwise the new values are merged into the stored cardholder.
+        """
+        if change.cardholder is not None:
+            cardholder = change.cardholder
+        elif change.new_values:
+            current = self._cardholders.get(id)
+            values = current.model_dump() if current else {"href": href}
+            cardholder = models.FTCardholder.model_validate(values | change.new_values)
+        else:
+            return
+        cardholder.href = cardholder.href or href
+        cardholder.id = cardholder.id or id
+        self._store(id, cardholder)
+
+    def get(self, id: str) -> models.FTCardholder | None:
+        """Return the mirrored cardholder with this ID."""
+        return self._cardholders.get(id)
+
+    def find_by_name(
+        self, first_name: str | None = None, last_name: str | None = None
+    ) -> list[models.FTCardholder]:
+        """Return the cardholders matching the full name (case insensitive)."""
+        ids = self._by_name.get(_name_key(first_name, last_name), ())
+        return [self._cardholders[id] for id in ids]
+
+    def find_by_pdf(self, name: str, value: str | int) -> list[models.FTCardholder]:
+        """Return the cardholders whose personal data field has this value.
+
+        Args:
+            name: The personal data field name, without the '@' prefix.
+            value: The value to look up.
+        """
+        ids = self._by_pdf.get((name, value), ())
+        return [self._cardholders[id] for id in ids]
+
+    def _store(self, id: str, cardholder: models.FTCardholder) -> None:
+        """Store a cardholder and index it, replacing any previous version."""
+        self._remove(id)
+        self._cardholders[id] = cardholder
+        self._by_name.setdefault(
+            _name_key(cardholder.first_name, cardholder.last_name), set()
+        ).add(id)
+        for name, value in cardholder.pdfs.items():
+            if isinstance(value, (str, int)):
+                self._by_pdf.setdefault((name, value), set()).add(id)
+
+    def _remove(self, id: str) -> None:
+        """Remove a cardholder and its index entries."""
+        if (cardholder := self._cardholders.pop(id, None)) is None:
+            return
+        name_key = _name_key(cardholder.first_name, cardholder.last_name)
+        if ids := self._by_name.get(name_key):
+            ids.discard(id)
+            if not ids:
+                del self._by_name[name_key]
+        for name, value in cardholder.pdfs.items():
+            if isinstance(value, (str, int)) and (
+                ids := self._by_pdf.get((name, value))
+            ):
+                ids.discard(id)
+                if not ids:
+                    del self._by_pdf[(name, value)]
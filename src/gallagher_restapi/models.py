@@ -5,12 +5,14 @@ from __future__ import annotations
 from collections.abc import Callable
 from datetime import datetime
 from enum import StrEnum
+from functools import cache, lru_cache
 from typing import Any
 
 from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    TypeAdapter,
     field_serializer,
     field_validator,
     model_validator,
@@ -19,6 +21,17 @@ from pydantic import (
 from .exceptions import LicenseError
 
 MOVEMENT_EVENT_TYPES = ["20001", "20002", "20003", "20047", "20107", "42415"]
+QUERY_CACHE_SIZE = 256
+# FTEvent fields that reference an item.
+EVENT_ITEM_FIELDS = (
+    "source",
+    "door",
+    "cardholder",
+    "entry_access_zone",
+    "exit_access_zone",
+)
+
+_DATETIME_ADAPTER = TypeAdapter(datetime)
 
 
 class HTTPMethods(StrEnum):
@@ -715,11 +728,12 @@ class FTCardholder(FTModel):
     def model_dump(self, **kwargs) -> Any:
         """Ensure private PDFs are included when serializing via model_dump.
 
-        We call the parent model_dump then inject any entries from the
-        private `_pdfs` attribute as keys prefixed with '@'. Nested
-        FTModel instances are serialized via their own model_dump.
+        We call the parent model_dump then replace the `pdfs` field with
+        its entries as keys prefixed with '@'. Nested FTModel instances
+        are serialized via their own model_dump.
         """
         raw = super().model_dump(**kwargs)
+        raw.pop("pdfs", None)
         raw.update({f"@{name}": value for name, value in self.pdfs.items()})
 
         return raw
@@ -763,7 +777,9 @@ class FTCardholderPatch(FTCardholder):
     """FTCardholder model for patching existing cardholders."""
 
     cards: FTCardholderCardsPatch | None = None
-    access_groups: FTCardholderAccessGroupsPatch | None = None
+    access_groups: FTCardholderAccessGroupsPatch | None = Field(
+        None, alias="accessGroups"
+    )
     lockers: FTCardholderLockersPatch | None = None
 
 
@@ -974,6 +990,33 @@ class QueryBase(FTModel):
         """Serialize fields to comma-separated string."""
         return ",".join(v) if v else None
 
+    def to_params(self) -> dict[str, Any]:
+        """Return the query string parameters of the query.
+
+        This gives the same result as model_dump() without going through the pydantic
+        serializers, which makes it cheap enough to call for every request.
+        Personal data field filters are expanded into one parameter per field.
+        """
+        params: dict[str, Any] = {}
+        values = self.__dict__
+        for name, alias, joined in _query_plan(type(self)):
+            if (value := values[name]) is None:
+                continue
+            if joined:
+                if not value:
+                    continue
+                if not isinstance(value, str):
+                    value = ",".join(value)
+            elif isinstance(value, dict):
+                params.update(value)
+                continue
+            elif isinstance(value, StrEnum):
+                value = value.value
+            elif isinstance(value, datetime):
+                value = _DATETIME_ADAPTER.dump_python(value, mode="json")
+            params[alias] = value
+        return params
+
 
 class ItemQuery(QueryBase):
     """Item query params model."""
@@ -1037,8 +1080,12 @@ class EventQuery(QueryBase):
     source: list[str] | None = Field(
         None, description="List of source item IDs that generated the events."
     )
-    event_types: list[str] | None = Field(None, alias="type")
-    event_groups: list[str] | None = Field(None, alias="group")
+    event_types: list[str] | None = Field(
+        None, alias="type", description="List of event type IDs or names."
+    )
+    event_groups: list[str] | None = Field(
+        None, alias="group", description="List of event group IDs or names."
+    )
     cardholders: list[str] | None = None
     related_items: list[str] | None = Field(
         None,
@@ -1066,4 +1113,54 @@ class ItemStatusQuery(QueryBase):
     item_ids: list[str] | None = Field(None, alias="itemIds")
 
 
+@cache
+def _query_plan(model: type[QueryBase]) -> tuple[tuple[str, str, bool], ...]:
+    """Return the attribute, parameter name and join flag of every field of a query model.
+
+    The plan is built once per query class from its fields and field serializers.
+    """
+    joined = {
+        field
+        for decorator in model.__pydantic_decorators__.field_serializers.values()
+        for field in decorator.info.fields
+    }
+    return tuple(
+        (name, field.alias or name, name in joined)
+        for name, field in model.model_fields.items()
+        if not field.exclude
+    )
+
+
+@lru_cache(maxsize=QUERY_CACHE_SIZE)
+def _cached_query_params(
+    model: type[QueryBase], values: tuple[tuple[str, Any], ...]
+) -> dict[str, Any]:
+    """Build and serialize a query once per distinct set of values."""
+    return model(**dict(values)).to_params()
+
+
+def query_params(model: type[QueryBase], **values: Any) -> dict[str, Any]:
+    """Return the query string parameters of a query built from keyword values.
+
+    Repeated identical queries, like fetching items by ID with the same response
+    fields, are served from a cache without building the pydantic model again.
+
+    Args:
+        model: The query model class.
+        values: The query field values.
+
+    Returns:
+        A new dict of query string parameters.
+    """
+    try:
+        key = tuple(
+            (name, tuple(value) if isinstance(value, list) else value)
+            for name, value in values.items()
+        )
+        return dict(_cached_query_params(model, key))
+    except TypeError:
+        # Unhashable values, like a pdfs dict, are not cached
+        return model(**values).to_params()
+
+
 # endregion query params models
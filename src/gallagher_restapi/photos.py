@@ -0,0 +1,174 @@
+"""Bulk export of cardholder photos."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from . import models
+from .client import MAX_CONCURRENT_REQUESTS, Client
+from .exceptions import GllApiError
+
+_LOGGER = logging.getLogger(__name__)
+
+MANIFEST_FILE = "manifest.json"
+
+
+@dataclass
+class PhotoExportResult:
+    """Counters of a photo export run."""
+
+    downloaded: int = 0
+    unchanged: int = 0
+    skipped: int = 0
+    failed: int = 0
+
+
+class PhotoExporter:
+    """Download the image personal data fields of all cardholders to a directory.
+
+    A manifest maps every image href to the sha256 of its content and the file it was
+    written to. Incremental runs only download images whose href is not in the
+    manifest yet. A refresh run downloads every image again but only rewrites the
+    files whose content hash changed.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        directory: str | os.PathLike[str],
+        *,
+        manifest_path: str | os.PathLike[str] | None = None,
+        profile_images_only: bool = False,
+        max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+    ) -> None:
+        """Initialize the exporter.
+
+        Args:
+            client: An initialized Gallagher client.
+            directory: The directory the photos are written to.
+            manifest_path: Where the manifest is stored. Defaults to manifest.json in the directory.
+            profile_images_only: Export only the image fields flagged as the profile image.
+            max_concurrency: Maximum number of downloads at the same time.
+        """
+        self.client = client
+        self.directory = Path(directory)
+        self.manifest_path = (
+            Path(manifest_path) if manifest_path else self.directory / MANIFEST_FILE
+        )
+        self.profile_images_only = profile_images_only
+        self.max_concurrency = max_concurrency
+        self.manifest: dict[str, dict[str, str]] = {}
+
+    async def image_fields(self) -> list[models.FTPersonalDataFieldDefinition]:
+        """Return the personal data field definitions holding images."""
+        fields: list[models.FTPersonalDataFieldDefinition] = []
+        async for definitions in self.client.yield_personal_data_fields(
+            response_fields=["id", "name", "type", "isProfileImage"]
+        ):
+            fields.extend(
+                definition
+                for definition in definitions
+                if definition.type == models.PDFType.IMAGE
+                and (definition.is_profile_image or not self.profile_images_only)
+            )
+        return fields
+
+    def load_manifest(self) -> None:
+        """Load the manifest of a previous run, if any."""
+        if self.manifest_path.exists():
+            self.manifest = json.loads(self.manifest_path.read_text(encoding="utf-8"))
+
+    def save_manifest(self) -> None:
+        """Write the manifest next to the photos."""
+        self.manifest_path.parent.mkdir(parents=True, exist_ok=True)
+        self.manifest_path.write_text(
+            json.dumps(self.manifest, indent=2, sort_keys=True), encoding="utf-8"
+        )
+
+    async def export(self, *, refresh: bool = False) -> PhotoExportResult:
+        """Export the photos of all the cardholders.
+
+        Args:
+            refresh: Download the images already in the manifest again to pick up
+                replaced photos. Unchanged content is not rewritten.
+
+        Returns:
+            A PhotoExportResult with the number of photos per outcome.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.load_manifest()
+        result = PhotoExportResult()
+        if not (fields := await self.image_fields()):
+            _LOGGER.warning("No image personal data fields found")
+            return result
+        field_ids = {field.name: field.id for field in fields if field.name}
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def export_photo(href: str, path: Path) -> None:
+            async with semaphore:
+                try:
+                    changed = await self._download(href, path)
+                except (GllApiError, ValueError, OSError) as err:
+                    # Request errors, non-image responses and write errors
+                    _LOGGER.warning("Failed to download %s: %s", href, err)
+                    result.failed += 1
+                    return
+            if changed:
+                result.downloaded += 1
+            else:
+                result.unchanged += 1
+
+        try:
+            async for cardholders in self.client.yield_cardholders(
+                response_fields=["id", "personalDataFields"], top=1000
+            ):
+                downloads = []
+                for cardholder in cardholders:
+                    for name, value in cardholder.pdfs.items():
+                        if name not in field_ids or not isinstance(
+                            value, models.FTItemReference
+                        ):
+                            continue
+                        if value.href in self.manifest and not refresh:
+                            result.skipped += 1
+                            continue
+                        path = self.directory / f"{cardholder.id}_{field_ids[name]}"
+                        downloads.append(export_photo(value.href, path))
+                await asyncio.gather(*downloads)
+                self.save_manifest()
+        finally:
+            # Keep the photos downloaded so far when the export is interrupted
+            self.save_manifest()
+        return result
+
+    async def _download(self, href: str, path: Path) -> bool:
+        """Download an image to path unless its content hash is unchanged.
+
+        Returns:
+            True if the file was written.
+        """
+        digest = hashlib.sha256()
+        partial = path.with_name(f"{path.name}.partial")
+        # File operations run in worker threads to not stall the other downloads
+        file = await asyncio.to_thread(partial.open, "wb")
+        try:
+            async for chunk in self.client.stream_image_pdf(href):
+                assert isinstance(chunk, bytes)
+                digest.update(chunk)
+                await asyncio.to_thread(file.write, chunk)
+            await asyncio.to_thread(file.close)
+            sha256 = digest.hexdigest()
+            if (entry := self.manifest.get(href)) and entry["sha256"] == sha256:
+                return False
+            await asyncio.to_thread(partial.replace, path)
+        finally:
+            file.close()
+            partial.unlink(missing_ok=True)
+        self.manifest[href] = {"sha256": sha256, "path": path.name}
+        return True
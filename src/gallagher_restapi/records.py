@@ -0,0 +1,73 @@
+"""Lightweight records for high-rate live event and status feeds.
+
+The records are tuples built straight from response dicts without pydantic
+validation. Repeated strings, like IDs, statuses and status flags, are interned
+so thousands of live records share the same string objects.
+"""
+
+from __future__ import annotations
+
+import sys
+from datetime import datetime
+from typing import Any, NamedTuple
+
+from .utils import ref_id
+
+_FLAGS: dict[tuple[str, ...], tuple[str, ...]] = {}
+
+
+def _intern(value: str | None) -> str | None:
+    """Intern a string, passing None through."""
+    return None if value is None else sys.intern(value)
+
+
+def _intern_flags(flags: list[str]) -> tuple[str, ...]:
+    """Return a shared tuple for a combination of status flags."""
+    key = tuple(flags)
+    if (shared := _FLAGS.get(key)) is None:
+        shared = _FLAGS[key] = tuple(sys.intern(flag) for flag in key)
+    return shared
+
+
+class EventRecord(NamedTuple):
+    """The essential fields of an event."""
+
+    id: str
+    time: datetime
+    type_id: str | None
+    source_id: str | None
+    cardholder_id: str | None
+    priority: int
+    message: str | None
+
+    @classmethod
+    def from_event(cls, event: dict[str, Any]) -> EventRecord:
+        """Build a record from a raw event dict."""
+        return cls(
+            event["id"],
+            datetime.fromisoformat(event["time"]),
+            _intern(ref_id(event.get("type"))),
+            _intern(ref_id(event.get("source"))),
+            _intern(ref_id(event.get("cardholder"))),
+            event.get("priority", 0),
+            event.get("message"),
+        )
+
+
+class StatusRecord(NamedTuple):
+    """The status of an item from a status subscription."""
+
+    id: str
+    status: str
+    status_text: str
+    status_flags: tuple[str, ...]
+
+    @classmethod
+    def from_update(cls, update: dict[str, Any]) -> StatusRecord:
+        """Build a record from a raw item status update dict."""
+        return cls(
+            sys.intern(update["id"]),
+            sys.intern(update["status"]),
+            sys.intern(update["statusText"]),
+            _intern_flags(update.get("statusFlags") or []),
+        )
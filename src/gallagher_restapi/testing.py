@@ -0,0 +1,612 @@
+"""Local stand-in for a Command Centre server.
+
+FakeCommandCentre is an httpx transport that generates a synthetic site on the fly,
+so the client can be exercised against large sites without a real server:
+
+    transport = FakeCommandCentre(FakeSite(cardholders=100_000), latency=0.02)
+    client = transport.client()
+    await client.initialize()
+
+Every item is derived from its index, so sites with millions of events do not
+use more memory than small ones.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+import random
+import time
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from urllib.parse import urlencode
+
+import httpx
+
+from .client import Client
+
+EVENT_GROUPS: dict[str, dict[str, str]] = {
+    "Card Event": {"20001": "Card Event", "20003": "Door Access Granted"},
+    "Access Denied": {"20002": "Access Denied", "20047": "Card Expired"},
+    "Alarm": {"23001": "Door Forced", "23002": "Door Held Open"},
+}
+FIRST_NAMES = ["John", "Jane", "Max", "Ana", "Omar", "Li", "Sara", "Tom"]
+LAST_NAMES = ["Doe", "Smith", "Khan", "Garcia", "Chen", "Novak", "Haddad"]
+STATUSES = [("normal", "Normal"), ("open", "Door open"), ("forced", "Door forced")]
+
+
+@dataclass
+class FakeSite:
+    """Size and shape of the synthetic site."""
+
+    cardholders: int = 100_000
+    doors: int = 5_000
+    access_zones: int = 500
+    events: int = 1_000_000
+    alarms: int = 50
+    start: datetime = field(default_factory=lambda: datetime(2025, 1, 1, tzinfo=UTC))
+    event_interval: timedelta = timedelta(seconds=1)
+    live_event_rate: float = 20.0
+    status_change_rate: float = 0.1
+    page_size: int = 1000
+
+
+@dataclass(slots=True)
+class _Request:
+    """The parts of a request the route handlers use."""
+
+    method: str
+    ids: list[str]
+    params: dict[str, str]
+    body: Any
+
+
+_Handler = Callable[[_Request], dict[str, Any] | Awaitable[dict[str, Any]]]
+
+
+class FakeCommandCentre(httpx.AsyncBaseTransport):
+    """httpx transport serving a synthetic Command Centre site.
+
+    Supported endpoints: /api/, cardholders (search with next paging, by ID and changes),
+    doors, access zones, items by ID, items/updates status subscriptions, events
+    (history, groups and updates long-poll), alarms (list and updates) and
+    personal data fields.
+    """
+
+    def __init__(
+        self,
+        site: FakeSite | None = None,
+        *,
+        host: str = "localhost",
+        port: int = 8904,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        long_poll_timeout: float = 1.0,
+        seed: int = 0,
+    ) -> None:
+        """Initialize the fake server.
+
+        Args:
+            site: The synthetic site to serve.
+            host: Host the client is configured with.
+            port: Port the client is configured with.
+            latency: Seconds added to every response.
+            jitter: Maximum random seconds added on top of the latency.
+            error_rate: Fraction of requests answered with 503 Service Unavailable.
+            long_poll_timeout: Seconds an updates request waits for new data.
+            seed: Seed of the random generator used for jitter, errors and status changes.
+        """
+        self.site = site or FakeSite()
+        self.base_url = f"https://{host}:{port}/api"
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.long_poll_timeout = long_poll_timeout
+        self.random = random.Random(seed)
+        self.requests: Counter[str] = Counter()
+        self.bytes_sent = 0
+        self._started = time.monotonic()
+        self._subscriptions: dict[str, list[str]] = {}
+        self._route_table = self._routes()
+
+    def client(self, api_key: str = "fake-api-key") -> Client:
+        """Return a Client connected to this fake server."""
+        host, port = self.base_url.removeprefix("https://").split("/")[0].split(":")
+        return Client(
+            api_key,
+            host=host,
+            port=int(port),
+            httpx_client=httpx.AsyncClient(transport=self),
+        )
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        """Answer a request from the client."""
+        delay = self.latency + (
+            self.random.uniform(0, self.jitter) if self.jitter else 0
+        )
+        if delay:
+            await asyncio.sleep(delay)
+        path = request.url.path.removeprefix("/api").strip("/")
+        self.requests[path.split("/")[0] or "api"] += 1
+        if self.error_rate and self.random.random() < self.error_rate:
+            return httpx.Response(503, request=request)
+        params = dict(request.url.params)
+        body = json.loads(request.content) if request.content else None
+        try:
+            payload = await self._route(request.method, path, params, body)
+        except KeyError:
+            return httpx.Response(404, request=request)
+        content = json.dumps(payload).encode()
+        self.bytes_sent += len(content)
+        return httpx.Response(
+            200,
+            content=content,
+            headers={"content-type": "application/json; charset=utf-8"},
+            request=request,
+        )
+
+    # region Routing
+
+    def _routes(self) -> dict[tuple[str, ...], _Handler]:
+        """Return the handler of every path. A "*" segment matches any ID."""
+        site = self.site
+        return {
+            (): lambda request: {"version": "9.30.0.0", "features": self._features()},
+            ("cardholders",): lambda request: self._collection(
+                "cardholders",
+                lambda index: self._cardholder(index, request.params),
+                request.params,
+            ),
+            ("cardholders", "changes"): lambda request: self._cardholder_changes(
+                request.params
+            ),
+            ("cardholders", "*"): lambda request: self._cardholder(
+                self._index(request.ids[0], site.cardholders), request.params
+            ),
+            ("doors",): lambda request: self._collection(
+                "doors", self._door, request.params
+            ),
+            ("doors", "*"): lambda request: self._door(
+                self._index(request.ids[0], site.doors)
+            ),
+            ("access_zones",): lambda request: self._collection(
+                "access_zones", self._access_zone, request.params
+            ),
+            ("access_zones", "*"): lambda request: self._access_zone(
+                self._index(request.ids[0], site.access_zones)
+            ),
+            ("items", "updates"): self._items_updates,
+            ("items", "updates", "*"): lambda request: self._status_updates(
+                request.ids[0]
+            ),
+            ("items", "*"): lambda request: self._item(request.ids[0]),
+            ("events",): lambda request: self._events(request.params),
+            ("events", "groups"): lambda request: self._event_groups(),
+            ("events", "updates"): lambda request: self._event_updates(request.params),
+            ("alarms",): lambda request: self._alarms(),
+            ("alarms", "updates"): lambda request: self._alarm_updates(request.params),
+            ("personal_data_fields",): lambda request: {
+                "results": [self._pdf_definition()]
+            },
+        }
+
+    async def _route(
+        self, method: str, path: str, params: dict[str, str], body: Any
+    ) -> dict[str, Any]:
+        """Dispatch a request path to its handler. Raise KeyError for unknown paths.
+
+        Routes are tried in order, so fixed segments win over "*" segments.
+        """
+        parts = tuple(path.split("/")) if path else ()
+        for pattern, handler in self._route_table.items():
+            if len(pattern) == len(parts) and all(
+                segment in ("*", part)
+                for segment, part in zip(pattern, parts, strict=True)
+            ):
+                ids = [
+                    part
+                    for segment, part in zip(pattern, parts, strict=True)
+                    if segment == "*"
+                ]
+                result = handler(_Request(method, ids, params, body))
+                return await result if inspect.isawaitable(result) else result
+        raise KeyError(path)
+
+    def _items_updates(self, request: _Request) -> dict[str, Any]:
+        """Subscribe to item status updates. Only POST is supported."""
+        if request.method != "POST":
+            raise KeyError(request.method)
+        return self._subscribe(request.body["itemIds"])
+
+    def _features(self) -> dict[str, Any]:
+        """Return the api features with their hrefs."""
+        sub_features = {
+            "cardholders": {"changes": "cardholders/changes"},
+            "cardTypes": {"assign": "card_types/assign"},
+            "events": {"updates": "events/updates", "eventGroups": "events/groups"},
+            "alarms": {"updates": "alarms/updates"},
+            "items": {"itemTypes": "items/types", "updates": "items/updates"},
+        }
+        paths = {
+            "accessGroups": "access_groups",
+            "accessZones": "access_zones",
+            "alarms": "alarms",
+            "alarmZones": "alarm_zones",
+            "cardholders": "cardholders",
+            "cardTypes": "card_types",
+            "doors": "doors",
+            "events": "events",
+            "fenceZones": "fence_zones",
+            "inputs": "inputs",
+            "items": "items",
+            "lockerBanks": "locker_banks",
+            "operatorGroups": "operator_groups",
+            "outputs": "outputs",
+            "personalDataFields": "personal_data_fields",
+        }
+        return {
+            name: {
+                name: {"href": f"{self.base_url}/{path}"},
+                **{
+                    sub: {"href": f"{self.base_url}/{sub_path}"}
+                    for sub, sub_path in sub_features.get(name, {}).items()
+                },
+            }
+            for name, path in paths.items()
+        }
+
+    @staticmethod
+    def _index(id: str, count: int) -> int:
+        """Return the index of an item ID. Raise KeyError if it does not exist."""
+        if not id.isdigit() or not 0 < int(id) <= count:
+            raise KeyError(id)
+        return int(id) - 1
+
+    def _collection(
+        self,
+        path: str,
+        build: Callable[[int], dict[str, Any]],
+        params: dict[str, str],
+    ) -> dict[str, Any]:
+        """Return a page of a collection, with a next link if there are more items."""
+        count = {
+            "cardholders": self.site.cardholders,
+            "doors": self.site.doors,
+            "access_zones": self.site.access_zones,
+        }[path]
+        top = int(params.get("top") or self.site.page_size)
+        skip = int(params.get("skip", 0))
+        name = params.get("name", "").casefold()
+        results: list[dict[str, Any]] = []
+        index = skip
+        while index < count and len(results) < top:
+            item = build(index)
+            index += 1
+            if name and name not in item.get("name", "").casefold():
+                continue
+            results.append(item)
+        response: dict[str, Any] = {"results": results}
+        if index < count:
+            next_params = {k: v for k, v in params.items() if k != "skip"}
+            next_params |= {"skip": str(index), "top": str(top)}
+            response["next"] = {
+                "href": f"{self.base_url}/{path}?{urlencode(next_params)}"
+            }
+        return response
+
+    # endregion Routing
+
+    # region Items
+
+    def _cardholder(self, index: int, params: dict[str, str]) -> dict[str, Any]:
+        """Return the cardholder at an index."""
+        id = str(index + 1)
+        href = f"{self.base_url}/cardholders/{id}"
+        first_name = FIRST_NAMES[index % len(FIRST_NAMES)]
+        last_name = LAST_NAMES[index // len(FIRST_NAMES) % len(LAST_NAMES)]
+        fields = set(params.get("fields", "defaults").split(","))
+        cardholder: dict[str, Any] = {
+            "href": href,
+            "id": id,
+            "name": f"{first_name} {last_name}",
+            "firstName": first_name,
+            "lastName": last_name,
+            "shortName": f"{first_name[0]}{last_name}",
+            "description": f"Employee {id}",
+            "authorised": index % 50 != 0,
+            "division": {"id": "2", "href": f"{self.base_url}/divisions/2"},
+        }
+        if "personalDataFields" in fields:
+            cardholder |= {
+                "@Employee ID": f"E{index + 1:07d}",
+                "@Email": f"{first_name.lower()}.{id}@example.com",
+                "@Photo": {"href": f"{href}/personal_data/100"},
+            }
+        if "cards" in fields:
+            cardholder["cards"] = [
+                {
+                    "href": f"{href}/cards/{id}",
+                    "number": str(1_000_000 + index),
+                    "cardSerialNumber": f"{index:08X}",
+                    "issueLevel": 1,
+                    "status": {"value": "Active", "type": "active"},
+                    "type": {"href": f"{self.base_url}/card_types/600", "name": "Card"},
+                }
+            ]
+        if "accessGroups" in fields:
+            cardholder["accessGroups"] = [
+                {
+                    "href": f"{href}/access_groups/{group}",
+                    "accessGroup": {
+                        "name": f"Access group {group}",
+                        "href": f"{self.base_url}/access_groups/{group}",
+                    },
+                    "status": {"value": "Active", "type": "active"},
+                }
+                for group in (1 + index % 20, 21 + index % 5)
+            ]
+        return cardholder
+
+    def _door(self, index: int) -> dict[str, Any]:
+        """Return the door at an index."""
+        id = str(index + 1)
+        return {
+            "href": f"{self.base_url}/doors/{id}",
+            "id": id,
+            "name": f"Door {id}",
+            "description": f"Door {id} of access zone {index % self.site.access_zones + 1}",
+            "division": {"id": "2", "href": f"{self.base_url}/divisions/2"},
+            "statusFlags": ["closed", "secure"],
+            "entryAccessZone": {
+                "name": f"Access zone {index % self.site.access_zones + 1}",
+                "href": f"{self.base_url}/access_zones/{index % self.site.access_zones + 1}",
+            },
+        }
+
+    def _access_zone(self, index: int) -> dict[str, Any]:
+        """Return the access zone at an index."""
+        id = str(index + 1)
+        return {
+            "href": f"{self.base_url}/access_zones/{id}",
+            "id": id,
+            "name": f"Access zone {id}",
+            "division": {"id": "2", "href": f"{self.base_url}/divisions/2"},
+            "statusFlags": ["secure"],
+            "zoneCount": index % 30,
+            "commands": {
+                "free": {"href": f"{self.base_url}/access_zones/{id}/free"},
+                "secure": {"href": f"{self.base_url}/access_zones/{id}/secure"},
+                "codeOnly": {"disabled": "Not licensed"},
+            },
+        }
+
+    def _item(self, id: str) -> dict[str, Any]:
+        """Return a generic item. Door IDs are used for the items endpoint."""
+        door = self._door(self._index(id, self.site.doors))
+        return {
+            "href": f"{self.base_url}/items/{id}",
+            "id": id,
+            "name": door["name"],
+            "type": {"id": "11", "name": "Door"},
+        }
+
+    def _pdf_definition(self) -> dict[str, Any]:
+        """Return the image personal data field definition."""
+        return {
+            "href": f"{self.base_url}/personal_data_fields/100",
+            "id": "100",
+            "name": "Photo",
+            "type": "image",
+            "isProfileImage": True,
+        }
+
+    # endregion Items
+
+    # region Cardholder changes and status updates
+
+    def _cardholder_changes(self, params: dict[str, str]) -> dict[str, Any]:
+        """Return an empty changes page with the next link."""
+        pos = int(params.get("pos", 0))
+        return {
+            "results": [],
+            "next": {"href": f"{self.base_url}/cardholders/changes?pos={pos + 1}"},
+        }
+
+    def _item_status(self, id: str) -> dict[str, Any]:
+        """Return a random status of an item."""
+        status, text = self.random.choice(STATUSES)
+        return {"id": id, "status": status, "statusText": text, "statusFlags": [status]}
+
+    def _subscribe(self, item_ids: list[str]) -> dict[str, Any]:
+        """Start a status subscription and return the current status of every item."""
+        subscription = str(len(self._subscriptions) + 1)
+        self._subscriptions[subscription] = item_ids
+        return {
+            "updates": [self._item_status(id) for id in item_ids],
+            "next": {"href": f"{self.base_url}/items/updates/{subscription}"},
+        }
+
+    async def _status_updates(self, subscription: str) -> dict[str, Any]:
+        """Return the status changes of a subscription since the last poll."""
+        item_ids = self._subscriptions[subscription]
+        await asyncio.sleep(self.long_poll_timeout)
+        changed = [
+            self._item_status(id)
+            for id in item_ids
+            if self.random.random() < self.site.status_change_rate
+        ]
+        return {
+            "updates": changed,
+            "next": {"href": f"{self.base_url}/items/updates/{subscription}"},
+        }
+
+    # endregion Cardholder changes and status updates
+
+    # region Events and alarms
+
+    def _event(self, index: int) -> dict[str, Any]:
+        """Return the event at an index. Indexes past the history are live events."""
+        id = str(index + 1)
+        groups = list(EVENT_GROUPS.items())
+        group_name, types = groups[index % len(groups)]
+        type_id, type_name = list(types.items())[index // len(groups) % len(types)]
+        door = index % self.site.doors
+        cardholder = index % self.site.cardholders
+        occurred = self.site.start + index * self.site.event_interval
+        event: dict[str, Any] = {
+            "href": f"{self.base_url}/events/{id}",
+            "id": id,
+            "serverDisplayName": "fake",
+            "time": occurred.isoformat().replace("+00:00", "Z"),
+            "message": f"{type_name} at Door {door + 1}",
+            "occurrences": 1,
+            "priority": 8 if group_name == "Alarm" else 3,
+            "type": {"id": type_id, "name": type_name},
+            "eventType": {"id": type_id, "name": type_name},
+            "group": {
+                "id": str(groups.index((group_name, types)) + 1),
+                "name": group_name,
+            },
+            "source": {
+                "id": str(door + 1),
+                "name": f"Door {door + 1}",
+                "href": f"{self.base_url}/doors/{door + 1}",
+            },
+            "division": {"id": "2", "href": f"{self.base_url}/divisions/2"},
+            "door": {
+                "name": f"Door {door + 1}",
+                "href": f"{self.base_url}/doors/{door + 1}",
+            },
+        }
+        if group_name != "Alarm":
+            event["cardholder"] = {
+                "href": f"{self.base_url}/cardholders/{cardholder + 1}",
+                "id": str(cardholder + 1),
+                "firstName": FIRST_NAMES[cardholder % len(FIRST_NAMES)],
+            }
+        return event
+
+    def _time_index(self, value: str) -> int:
+        """Return the index of the first event at or after an ISO time."""
+        moment = datetime.fromisoformat(value)
+        if moment.tzinfo is None:
+            moment = moment.replace(tzinfo=UTC)
+        offset = (moment - self.site.start) / self.site.event_interval
+        return max(0, min(self.site.events, -int(-offset // 1)))
+
+    def _events(self, params: dict[str, str]) -> dict[str, Any]:
+        """Return a page of historical events, oldest first unless previous is set."""
+        top = int(params.get("top") or self.site.page_size)
+        low = self._time_index(params["after"]) if "after" in params else 0
+        high = (
+            self._time_index(params["before"])
+            if "before" in params
+            else self.site.events
+        )
+        previous = params.get("previous") in ("true", "True")
+        if "pos" in params:
+            if previous:
+                high = int(params["pos"])
+            else:
+                low = int(params["pos"])
+        if previous:
+            indexes = range(high - 1, max(low, high - top) - 1, -1)
+            pos = max(low, high - top)
+        else:
+            indexes = range(low, min(high, low + top))
+            pos = min(high, low + top)
+        next_params = {k: v for k, v in params.items() if k != "pos"} | {
+            "pos": str(pos)
+        }
+        return {
+            "events": [self._event(index) for index in indexes],
+            "next": {"href": f"{self.base_url}/events?{urlencode(next_params)}"},
+            "updates": {
+                "href": f"{self.base_url}/events/updates?pos={self.site.events}"
+            },
+        }
+
+    def _live_index(self) -> int:
+        """Return the index of the next live event to be generated."""
+        elapsed = time.monotonic() - self._started
+        return self.site.events + int(elapsed * self.site.live_event_rate)
+
+    async def _event_updates(self, params: dict[str, str]) -> dict[str, Any]:
+        """Long-poll the live events after the position in the updates link."""
+        pos = int(params.get("pos", self._live_index()))
+        deadline = time.monotonic() + self.long_poll_timeout
+        while (live := self._live_index()) <= pos:
+            if time.monotonic() >= deadline:
+                break
+            await asyncio.sleep(1 / max(self.site.live_event_rate, 1))
+        end = min(live, pos + self.site.page_size)
+        return {
+            "events": [self._event(index) for index in range(pos, max(pos, end))],
+            "updates": {"href": f"{self.base_url}/events/updates?pos={max(pos, end)}"},
+        }
+
+    def _event_groups(self) -> dict[str, Any]:
+        """Return the event groups and their types."""
+        return {
+            "eventGroups": [
+                {
+                    "id": str(number),
+                    "name": name,
+                    "href": f"{self.base_url}/events/groups/{number}",
+                    "eventTypes": [
+                        {
+                            "id": type_id,
+                            "name": type_name,
+                            "href": f"{self.base_url}/events/types/{type_id}",
+                        }
+                        for type_id, type_name in types.items()
+                    ],
+                }
+                for number, (name, types) in enumerate(EVENT_GROUPS.items(), 1)
+            ]
+        }
+
+    def _alarm(self, index: int) -> dict[str, Any]:
+        """Return the alarm raised by the event at an index."""
+        event = self._event(index)
+        href = f"{self.base_url}/alarms/{event['id']}"
+        return event | {
+            "href": href,
+            "state": "unacknowledged",
+            "active": True,
+            "event": {"href": event["href"]},
+            "view": {"href": f"{href}/view"},
+            "comment": {"href": f"{href}/comment"},
+            "acknowledge": {"href": f"{href}/acknowledge"},
+            "process": {"href": f"{href}/process"},
+        }
+
+    def _alarms(self) -> dict[str, Any]:
+        """Return the current alarms."""
+        count = min(self.site.alarms, self.site.events)
+        return {
+            "alarms": [
+                self._alarm(self.site.events - 1 - index) for index in range(count)
+            ],
+            "updates": {"href": f"{self.base_url}/alarms/updates"},
+        }
+
+    async def _alarm_updates(self, params: dict[str, str]) -> dict[str, Any]:
+        """Long-poll the alarm updates. The live events of the alarm group raise alarms."""
+        events = await self._event_updates(params)
+        pos = events["updates"]["href"].rsplit("=", 1)[-1]
+        return {
+            "updates": [
+                self._alarm(int(event["id"]) - 1)
+                for event in events["events"]
+                if event["group"]["name"] == "Alarm"
+            ],
+            "next": {"href": f"{self.base_url}/alarms/updates?pos={pos}"},
+        }
+
+    # endregion Events and alarms
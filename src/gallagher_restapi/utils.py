@@ -0,0 +1,51 @@
+"""Helper functions shared by the gallagher_restapi modules."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import IO, Any
+
+
+def id_from_href(href: str) -> str:
+    """Return the item ID at the end of an item href.
+
+    Example: 'https://host:8904/api/cardholders/325' -> '325'
+    """
+    return href.rstrip("/").rsplit("/", 1)[-1]
+
+
+def ref_id(item: Any) -> str | None:
+    """Return the ID of an item reference, from a raw response dict or a model.
+
+    Uses the id when present, otherwise the ID at the end of the href.
+    Plain strings are returned as is.
+    """
+    if item is None or isinstance(item, str):
+        return item
+    if isinstance(item, dict):
+        id, href = item.get("id"), item.get("href")
+    else:
+        id, href = getattr(item, "id", None), getattr(item, "href", None)
+    if id:
+        return str(id)
+    if href:
+        return id_from_href(href)
+    return None
+
+
+@asynccontextmanager
+async def open_partial(path: Path, mode: str, **kwargs: Any) -> AsyncIterator[IO[Any]]:
+    """Open a partial file in a thread that replaces path when the block succeeds.
+
+    The partial file is removed when the block fails, so path is never left half written.
+    """
+    partial = path.with_name(f"{path.name}.partial")
+    file: IO[Any] = await asyncio.to_thread(lambda: partial.open(mode, **kwargs))
+    try:
+        yield file
+        await asyncio.to_thread(file.close)
+        await asyncio.to_thread(partial.replace, path)
+    finally:
+        file.close()
+        partial.unlink(missing_ok=True)
@@ -27,10 +27,16 @@ def mock_fixtures() -> dict[str, Any]:
 
 @pytest.fixture(autouse=True)
 def respx_mock(fixtures: dict[str, Any]) -> Generator[respx.MockRouter, None, None]:
-    """Mock the respx router."""
+    """Mock the respx router.
+
+    Pure unit tests never initialize a client, so the API route is optional.
+    This applies to every route of the router: tests that depend on a request
+    being sent must assert it themselves, e.g. `assert route.called`.
+    """
     api_features = fixtures["features"]
     with respx.mock(
         base_url="https://localhost:8904",
+        assert_all_called=False,
     ) as mock:
         mock.get("/api/").mock(
             return_value=httpx.Response(
@@ -1,5 +1,9 @@
 """Tests for models module."""
 
+from datetime import UTC, datetime
+
+import pytest
+
 from gallagher_restapi import models
 
 
@@ -135,3 +139,35 @@ def test_ftdoor_model(fixtures) -> None:
     assert obj.commands
     assert obj.commands.open
     assert obj.entry_access_zone
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        models.QueryBase(
+            name="x", division=["1", "2"], sort="-id", response_fields=["a"], top=5
+        ),
+        models.ItemQuery(item_types=["11"]),
+        models.CardholderQuery(access_zones="*", description="y"),
+        models.CardholderChangesQuery(cardholder_fields=["id"], filter=["a", "b"]),
+        models.EventQuery(
+            after=datetime(2025, 1, 1, tzinfo=UTC), event_types=["1"], previous=True
+        ),
+    ],
+)
+def test_query_to_params_matches_model_dump(query: models.QueryBase) -> None:
+    """Validate the precompiled query serialization against pydantic."""
+    assert query.to_params() == query.model_dump()
+
+
+def test_query_params() -> None:
+    """Validate cached query params and the expansion of pdf filters."""
+    params = models.query_params(models.QueryBase, response_fields=["id", "name"])
+    assert params == {"fields": "id,name"}
+    params["top"] = 1
+    assert models.query_params(models.QueryBase, response_fields=["id", "name"]) == {
+        "fields": "id,name"
+    }
+    assert models.query_params(models.CardholderQuery, pdfs={"pdf_1": "x"}) == {
+        "pdf_1": "x"
+    }
@@ -0,0 +1,185 @@
+"""Test the local access group indexes."""
+
+from datetime import UTC, datetime
+
+import httpx
+import pytest
+import respx
+
+from gallagher_restapi import Client, models
+from gallagher_restapi.access_groups import AccessGroupHierarchy, AccessGroupMemberships
+
+BASE = "https://localhost:8904/api"
+
+
+def _group(id: str) -> dict[str, str | dict[str, str]]:
+    """Return a raw access group."""
+    return {
+        "href": f"{BASE}/access_groups/{id}",
+        "id": id,
+        "cardholders": {"href": f"{BASE}/access_groups/{id}/cardholders"},
+    }
+
+
+def _membership(
+    cardholder: str, group: str, **validity: str
+) -> dict[str, str | dict[str, str]]:
+    """Return a raw access group membership."""
+    return {
+        "href": f"{BASE}/cardholders/{cardholder}/access_groups/{group}",
+        "cardholder": {"href": f"{BASE}/cardholders/{cardholder}"},
+        "accessGroup": {"href": f"{BASE}/access_groups/{group}"},
+    } | validity
+
+
+async def test_access_group_memberships(
+    gll_client: Client, respx_mock: respx.MockRouter
+) -> None:
+    """Test loading the memberships and applying cardholder changes."""
+    respx_mock.get("/api/cardholders/changes", params={"pos": "1"}).mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "results": [
+                    {
+                        "type": "update",
+                        "item": {"href": f"{BASE}/cardholders/1"},
+                        "newValues": {"accessGroups": [_membership("1", "20")]},
+                    },
+                    {"type": "remove", "item": {"href": f"{BASE}/cardholders/2"}},
+                ],
+                "next": {"href": f"{BASE}/cardholders/changes?pos=2"},
+            },
+        )
+    )
+    respx_mock.get("/api/cardholders/changes").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "results": [],
+                "next": {"href": f"{BASE}/cardholders/changes?pos=1"},
+            },
+        )
+    )
+    respx_mock.get("/api/access_groups").mock(
+        return_value=httpx.Response(200, json={"results": [_group("10"), _group("20")]})
+    )
+    respx_mock.get("/api/access_groups/10/cardholders", params={"p": "2"}).mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "cardholders": [
+                    _membership("3", "10", until="2020-01-01T00:00:00Z"),
+                ]
+            },
+        )
+    )
+    respx_mock.get("/api/access_groups/10/cardholders").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "cardholders": [_membership("1", "10"), _membership("2", "10")],
+                "next": {"href": f"{BASE}/access_groups/10/cardholders?p=2"},
+            },
+        )
+    )
+    respx_mock.get("/api/access_groups/20/cardholders").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "cardholders": [
+                    _membership("2", "20", **{"from": "2020-01-01T00:00:00Z"})
+                ]
+            },
+        )
+    )
+
+    await gll_client.initialize()
+    memberships = AccessGroupMemberships(gll_client)
+    await memberships.load()
+
+    assert len(memberships) == 3
+    assert memberships.members_of("10") == {"1", "2"}
+    assert memberships.members_of("10", at=datetime(2019, 1, 1, tzinfo=UTC)) == {
+        "1",
+        "2",
+        "3",
+    }
+    assert memberships.groups_of("2") == {"10", "20"}
+    assert memberships.groups_of("2", at=datetime(2019, 1, 1, tzinfo=UTC)) == {"10"}
+    assert memberships.validities("3", "10") == [
+        (None, datetime(2020, 1, 1, tzinfo=UTC))
+    ]
+    assert memberships.validities("3", "20") == []
+
+    await memberships.sync()
+
+    assert memberships.groups_of("1") == {"20"}
+    assert memberships.groups_of("2") == set()
+    assert memberships.members_of("10") == set()
+    assert memberships.members_of("20") == {"1"}
+
+
+async def test_access_group_memberships_of_several_periods(gll_client: Client) -> None:
+    """Test a cardholder who is a member of a group for two periods."""
+    memberships = AccessGroupMemberships(gll_client)
+    memberships.apply_changes(
+        [
+            models.CardholderChange.model_validate(
+                {
+                    "type": "update",
+                    "item": {"href": f"{BASE}/cardholders/4"},
+                    "newValues": {
+                        "accessGroups": [
+                            _membership("4", "10", until="2020-01-01T00:00:00Z"),
+                            _membership("4", "10", **{"from": "2021-01-01T00:00:00Z"}),
+                        ]
+                    },
+                }
+            )
+        ]
+    )
+
+    assert len(memberships.validities("4", "10")) == 2
+    for year, active in ((2019, True), (2020, False), (2022, True)):
+        at = datetime(year, 6, 1, tzinfo=UTC)
+        assert memberships.groups_of("4", at) == ({"10"} if active else set())
+        assert memberships.members_of("10", at) == ({"4"} if active else set())
+
+
+async def test_access_group_hierarchy(
+    gll_client: Client, respx_mock: respx.MockRouter
+) -> None:
+    """Test the ancestor and descendant closures of the access groups."""
+    groups = [
+        {"id": "1"},
+        {"id": "2", "parent": {"href": f"{BASE}/access_groups/1"}},
+        {"id": "3", "parent": {"href": f"{BASE}/access_groups/2"}},
+        {"id": "4", "parent": {"href": f"{BASE}/access_groups/1"}},
+        {"id": "5"},
+    ]
+    route = respx_mock.get("/api/access_groups").mock(
+        return_value=httpx.Response(200, json={"results": groups})
+    )
+    await gll_client.initialize()
+    memberships = AccessGroupMemberships(gll_client)
+    memberships._add("7", "3", (None, None))
+    memberships._add("7", "5", (None, None))
+    hierarchy = AccessGroupHierarchy(gll_client, memberships)
+    await hierarchy.ensure_loaded()
+    await hierarchy.ensure_loaded()
+
+    assert route.call_count == 1
+    assert hierarchy.ancestors("3") == {"1", "2"}
+    assert hierarchy.descendants("1") == {"2", "3", "4"}
+    assert hierarchy.is_descendant("3", "1")
+    assert not hierarchy.is_descendant("1", "3")
+    assert not hierarchy.is_descendant("4", "2")
+    assert hierarchy.effective_groups_of("7") == {"1", "2", "3", "5"}
+
+    hierarchy.invalidate()
+    with pytest.raises(ValueError):
+        hierarchy.effective_groups_of("7")
+    await hierarchy.ensure_loaded()
+    assert route.call_count == 2
+    assert hierarchy.parent("3") == "2"
@@ -127,3 +127,28 @@ async def test_override_access_zone(
     # Note: In real scenario, statusFlags would reflect the command
     # For this test, we're just verifying the call was made
     assert new_access_zone[0].status_flags == [command_name]
+
+
+async def test_yield_access_zones(
+    gll_client: Client, fixtures: dict[str, Any], respx_mock: respx.MockRouter
+) -> None:
+    """Test yielding access zones follows the next links."""
+    access_zone = fixtures["access_zone"]
+    respx_mock.get(url__regex=r"/api/access_zones\?.*top=2.*").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "results": [access_zone] * 2,
+                "next": {"href": "https://localhost:8904/api/access_zones?skip=2"},
+            },
+        )
+    )
+    respx_mock.get(url__regex=r"/api/access_zones\?skip=2").mock(
+        return_value=httpx.Response(200, json={"results": [access_zone]})
+    )
+
+    await gll_client.initialize()
+    pages = [page async for page in gll_client.yield_access_zones(top=2)]
+
+    assert [len(page) for page in pages] == [2, 1]
+    assert all(zone.id == "345" for page in pages for zone in page)
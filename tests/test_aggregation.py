@@ -0,0 +1,71 @@
+"""Test the streaming event aggregation."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from gallagher_restapi import models
+from gallagher_restapi.aggregation import EventAggregator, WindowResult
+from gallagher_restapi.testing import FakeCommandCentre, FakeSite
+
+START = datetime(2024, 1, 1, tzinfo=UTC)
+
+
+def _events(count: int) -> list[models.FTEvent]:
+    """Return events 20 seconds apart on 3 doors, from START."""
+    fake = FakeCommandCentre(
+        FakeSite(doors=3, start=START, event_interval=timedelta(seconds=20))
+    )
+    return [models.FTEvent.model_validate(fake._event(index)) for index in range(count)]
+
+
+async def test_tumbling_windows() -> None:
+    """Test per-door counts and denied rates of one-minute windows."""
+    emitted: list[WindowResult] = []
+    aggregator = EventAggregator(
+        "door",
+        measures={
+            "count": None,
+            "denied": lambda event: event.group is not None and event.group.id == "2",
+        },
+        on_window=emitted.append,
+    )
+    events = _events(7)
+    await aggregator.process(events)
+
+    # The event of the third minute closes the first two windows
+    assert [(result.start, result.end) for result in emitted] == [
+        (START, START + timedelta(minutes=1)),
+        (START + timedelta(minutes=1), START + timedelta(minutes=2)),
+    ]
+    assert emitted[0].counts == {
+        "count": {"1": 1, "2": 1, "3": 1},
+        "denied": {"2": 1},
+    }
+    assert emitted[0].rate("denied") == {"1": 0.0, "2": 1.0, "3": 0.0}
+
+    aggregator.add(events[:1])
+    assert aggregator.late == 1
+    assert [result.counts["count"] for result in aggregator.flush()] == [{"1": 1}]
+
+
+async def test_sliding_windows() -> None:
+    """Test sliding windows and skipped idle periods."""
+    aggregator = EventAggregator(
+        "source", window=timedelta(minutes=2), slide=timedelta(minutes=1)
+    )
+    results = aggregator.add(_events(9))
+    assert [sum(result.counts["count"].values()) for result in results] == [3, 6]
+    assert results[1].start == START
+
+    results = aggregator.advance(START + timedelta(hours=1))
+    assert [sum(result.counts["count"].values()) for result in results] == [6, 3]
+    assert aggregator.flush() == []
+
+
+async def test_invalid_windows() -> None:
+    """Test the window and key checks."""
+    with pytest.raises(ValueError):
+        EventAggregator(window=timedelta(minutes=1), slide=timedelta(seconds=25))
+    with pytest.raises(ValueError):
+        EventAggregator("operator")
@@ -0,0 +1,118 @@
+"""Test the parallel event backfill."""
+
+import asyncio
+import json
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+
+from gallagher_restapi import Client, models
+from gallagher_restapi.backfill import (
+    BACKFILL_BUFFERED_PAGES,
+    BackfillProgress,
+    EventBackfill,
+)
+from gallagher_restapi.exceptions import RequestError
+from gallagher_restapi.testing import FakeCommandCentre, FakeSite
+
+SITE = FakeSite(events=2000, page_size=40)
+
+
+async def test_backfill_stream_merges_windows_in_order() -> None:
+    """Test that concurrent windows are streamed back in time order."""
+    fake = FakeCommandCentre(SITE, jitter=0.002)
+    client = fake.client()
+    await client.initialize()
+    reports: list[int] = []
+    backfill = EventBackfill(
+        client,
+        models.EventQuery(
+            after=SITE.start + timedelta(seconds=100),
+            before=SITE.start + timedelta(seconds=1100),
+        ),
+        window=timedelta(seconds=150),
+        max_concurrency=3,
+        progress=lambda progress: reports.append(progress.completed),
+    )
+    assert len(backfill.windows()) == 7
+
+    ids = [int(event.id) async for page in backfill.stream() for event in page]
+    assert ids == list(range(101, 1101))
+    assert sorted(reports) == list(range(1, 8))
+
+
+async def test_backfill_stream_buffers_few_pages() -> None:
+    """Test that windows wait for a slow consumer instead of buffering."""
+    fake = FakeCommandCentre(SITE)
+    client = fake.client()
+    await client.initialize()
+    backfill = EventBackfill(
+        client,
+        models.EventQuery(
+            after=SITE.start, before=SITE.start + timedelta(seconds=2000)
+        ),
+        window=timedelta(seconds=1000),
+        max_concurrency=2,
+    )
+    stream = backfill.stream()
+    await anext(stream)
+    await asyncio.sleep(0.05)
+    # Each window is 25 pages long. A window holds its buffered pages, the page
+    # waiting to be queued and the page prefetched by the client.
+    assert fake.requests["events"] <= 1 + 2 * (BACKFILL_BUFFERED_PAGES + 2)
+    await stream.aclose()
+
+
+async def test_backfill_to_files(tmp_path: Path) -> None:
+    """Test writing one file per window and resuming an export."""
+    client = FakeCommandCentre(SITE).client()
+    await client.initialize()
+    progress: list[BackfillProgress] = []
+
+    async def report(value: BackfillProgress) -> None:
+        progress.append(value)
+
+    backfill = EventBackfill(
+        client,
+        models.EventQuery(after=SITE.start, before=SITE.start + timedelta(seconds=300)),
+        window=timedelta(seconds=100),
+        progress=report,
+    )
+    paths = await backfill.to_files(tmp_path)
+    assert len(paths) == 3
+    ids = [
+        int(json.loads(line)["id"])
+        for path in paths
+        for line in path.read_text().splitlines()
+    ]
+    assert ids == list(range(1, 301))
+    assert progress[-1].events == 300
+    assert progress[-1].fraction == 1
+
+    paths[1].unlink()
+    await backfill.to_files(tmp_path)
+    assert paths[1].exists()
+
+
+async def test_backfill_requires_after(gll_client: Client) -> None:
+    """Test that the query must have an after time."""
+    await gll_client.initialize()
+    with pytest.raises(ValueError):
+        EventBackfill(gll_client, models.EventQuery())
+
+
+async def test_backfill_to_files_removes_failed_windows(tmp_path: Path) -> None:
+    """Test that a failed window leaves no partial file behind."""
+    fake = FakeCommandCentre(SITE)
+    client = fake.client()
+    await client.initialize()
+    fake.error_rate = 1
+    backfill = EventBackfill(
+        client,
+        models.EventQuery(after=SITE.start, before=SITE.start + timedelta(seconds=300)),
+        window=timedelta(seconds=100),
+    )
+    with pytest.raises(RequestError):
+        await backfill.to_files(tmp_path)
+    assert not list(tmp_path.iterdir())
@@ -0,0 +1,92 @@
+"""Test the local card index."""
+
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+from gallagher_restapi import Client
+from gallagher_restapi.card_index import CardIndex
+
+
+async def test_card_index(
+    gll_client: Client, fixtures: dict[str, Any], respx_mock: respx.MockRouter
+) -> None:
+    """Test seeding the index and applying card changes."""
+    cardholder = fixtures["cardholder"]
+    card = cardholder["cards"][0]
+    other = {
+        "href": "https://localhost:8904/api/cardholders/364",
+        "id": "364",
+        "cards": [
+            {
+                "href": "https://localhost:8904/api/cardholders/364/cards/7",
+                "number": "5678",
+                "cardSerialNumber": "1234",
+                "type": card["type"],
+            }
+        ],
+    }
+    respx_mock.get("/api/cardholders/changes", params={"pos": "1"}).mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "results": [
+                    {
+                        "type": "update",
+                        "item": {"href": cardholder["href"]},
+                        "newValues": {"firstName": "Jack"},
+                    },
+                    {
+                        "type": "update",
+                        "item": {"href": other["href"]},
+                        "cardholder": {"cards": [card | {"href": f"{card['href']}9"}]},
+                    },
+                    {"type": "remove", "item": {"href": cardholder["href"]}},
+                ],
+                "next": {
+                    "href": "https://localhost:8904/api/cardholders/changes?pos=2"
+                },
+            },
+        )
+    )
+    respx_mock.get("/api/cardholders/changes").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "results": [],
+                "next": {
+                    "href": "https://localhost:8904/api/cardholders/changes?pos=1"
+                },
+            },
+        )
+    )
+    respx_mock.get("/api/cardholders").mock(
+        return_value=httpx.Response(200, json={"results": [cardholder, other]})
+    )
+
+    await gll_client.initialize()
+    index = CardIndex(gll_client)
+    await index.load()
+
+    assert len(index) == 2
+    assert index.cardholder_id("1234") == "363"
+    assert index.cardholder_id(card["cardSerialNumber"], "serial_number") == "363"
+    assert index.cardholder_id(card["href"], "href") == "363"
+    assert index.cardholder_id("5678") == "364"
+    # The number of one card is the serial number of another
+    assert index.cardholder_id("1234", "serial_number") == "364"
+    assert index.cardholder_id("0000") is None
+    with pytest.raises(ValueError):
+        index.cardholder_id("1234", "pin")
+
+    changes = await index.sync()
+
+    # The card moved to cardholder 364 before 363 was removed
+    assert len(changes) == 3
+    assert len(index) == 1
+    assert index.cardholder_id("1234") == "364"
+    assert index.cardholder_id("5678") is None
+    assert index.cardholder_id("1234", "serial_number") is None
+    assert index.cardholder_id(card["href"], "href") is None
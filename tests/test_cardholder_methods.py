@@ -1,6 +1,7 @@
 """Test cardholder methods."""
 
 from datetime import datetime
+from pathlib import Path
 from typing import Any
 
 import httpx
@@ -9,6 +10,7 @@ import respx
 
 from gallagher_restapi import Client
 from gallagher_restapi import models
+from gallagher_restapi.exceptions import RequestError
 
 
 @pytest.mark.asyncio
@@ -244,3 +246,121 @@ async def test_get_cardholder_changes(gll_client: Client) -> None:
     changes, next_link = await gll_client.get_cardholder_changes(changes_href.href)
     assert len(changes) > 0
     assert next_link
+
+
+async def test_get_cardholders_by_ids(
+    gll_client: Client, fixtures: dict[str, Any], respx_mock: respx.MockRouter
+) -> None:
+    """Test batch fetching cardholders deduplicates IDs and reports misses."""
+    found_route = respx_mock.get(url__regex=r"/api/cardholders/363").mock(
+        return_value=httpx.Response(200, json=fixtures["cardholder"])
+    )
+    missing_route = respx_mock.get(url__regex=r"/api/cardholders/999").mock(
+        return_value=httpx.Response(404)
+    )
+
+    await gll_client.initialize()
+    cardholders = await gll_client.get_cardholders_by_ids(
+        ["363", "999", "363"], response_fields=["defaults", "cards"]
+    )
+
+    assert list(cardholders) == ["363", "999"]
+    assert cardholders["363"] and cardholders["363"].first_name == "John"
+    assert cardholders["999"] is None
+    assert found_route.call_count == 1
+    assert missing_route.call_count == 1
+    assert found_route.calls.last.request.url.params["fields"] == "defaults,cards"
+
+    respx_mock.get(url__regex=r"/api/cardholders/500").mock(
+        return_value=httpx.Response(503)
+    )
+    with pytest.raises(RequestError) as err:
+        await gll_client.get_cardholders_by_ids(["363", "500"])
+    assert err.value.status_code == 503
+
+
+async def test_yield_cardholder_changes(
+    gll_client: Client, respx_mock: respx.MockRouter
+) -> None:
+    """Test chaining cardholder changes with batching and checkpoints."""
+    base = "https://localhost:8904/api/cardholders/changes"
+
+    def changes_page(pos: int, count: int) -> httpx.Response:
+        change = {"type": "update", "item": {"href": f"{base[:-8]}/{pos}"}}
+        return httpx.Response(
+            200,
+            json={"results": [change] * count, "next": {"href": f"{base}?pos={pos}"}},
+        )
+
+    respx_mock.get("/api/cardholders/changes", params={"pos": "1"}).mock(
+        return_value=changes_page(2, 1)
+    )
+    respx_mock.get("/api/cardholders/changes", params={"pos": "2"}).mock(
+        return_value=changes_page(3, 2)
+    )
+    respx_mock.get("/api/cardholders/changes", params={"pos": "3"}).mock(
+        return_value=changes_page(4, 1)
+    )
+
+    await gll_client.initialize()
+    checkpoints: list[str] = []
+    batches: list[list[models.CardholderChange]] = []
+    async for changes in gll_client.yield_cardholder_changes(
+        f"{base}?pos=1", checkpoint=checkpoints.append
+    ):
+        batches.append(changes)
+        if len(batches) == 3:
+            break
+
+    assert [len(batch) for batch in batches] == [1, 2, 1]
+    assert checkpoints == [f"{base}?pos=2", f"{base}?pos=3"]
+
+
+@pytest.mark.parametrize("b64", [False, True])
+async def test_stream_image_pdf(
+    gll_client: Client, respx_mock: respx.MockRouter, b64: bool
+) -> None:
+    """Test streaming an image in chunks with incremental base64 encoding."""
+    image = bytes(range(256)) * 10
+    respx_mock.get("/api/cardholders/363/personal_data/123").mock(
+        return_value=httpx.Response(
+            200, content=image, headers={"content-type": "image/jpeg"}
+        )
+    )
+    await gll_client.initialize()
+    href = f"{gll_client.server_url}/api/cardholders/363/personal_data/123"
+
+    chunks = [
+        chunk
+        async for chunk in gll_client.stream_image_pdf(href, b64=b64, chunk_size=100)
+    ]
+
+    expected = await gll_client.get_image_pdf(href, b64=b64)
+    if b64:
+        assert "".join(chunks) == expected  # type: ignore[arg-type]
+    else:
+        assert b"".join(chunks) == expected  # type: ignore[arg-type]
+
+
+async def test_download_image_pdf(
+    gll_client: Client, respx_mock: respx.MockRouter, tmp_path: Path
+) -> None:
+    """Test downloading an image to a file and handling errors."""
+    respx_mock.get("/api/cardholders/363/personal_data/123").mock(
+        return_value=httpx.Response(
+            200, content=b"image", headers={"content-type": "image/jpeg"}
+        )
+    )
+    respx_mock.get("/api/cardholders/363/personal_data/999").mock(
+        return_value=httpx.Response(404)
+    )
+    await gll_client.initialize()
+    base = f"{gll_client.server_url}/api/cardholders/363/personal_data"
+
+    written = await gll_client.download_image_pdf(f"{base}/123", tmp_path / "photo")
+
+    assert written == 5
+    assert (tmp_path / "photo").read_bytes() == b"image"
+    with pytest.raises(RequestError, match="does not exist"):
+        await gll_client.download_image_pdf(f"{base}/999", tmp_path / "missing")
+    assert [path.name for path in tmp_path.iterdir()] == ["photo"]
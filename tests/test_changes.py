@@ -0,0 +1,58 @@
+"""Test cardholder change compaction."""
+
+from typing import Any
+
+from gallagher_restapi import models
+from gallagher_restapi.changes import compact_cardholder_changes
+
+HREF = "https://localhost:8904/api/cardholders/{}"
+
+
+def change(id: int, type: str, **values: Any) -> models.CardholderChange:
+    """Build a cardholder change."""
+    return models.CardholderChange.model_validate(
+        {"type": type, "item": {"href": HREF.format(id)}} | values
+    )
+
+
+def test_compact_cardholder_changes() -> None:
+    """Test collapsing, cancelling and ordering of cardholder changes."""
+    changes = [
+        change(1, "update", oldValues={"firstName": "A"}, newValues={"firstName": "B"}),
+        change(2, "add", newValues={"firstName": "New"}),
+        change(3, "update", oldValues={"notes": "x"}, newValues={"notes": "y"}),
+        change(1, "update", oldValues={"firstName": "B"}, newValues={"firstName": "C"}),
+        change(2, "update", oldValues={"lastName": None}, newValues={"lastName": "L"}),
+        change(4, "add", newValues={"firstName": "Temp"}),
+        change(3, "update", oldValues={"notes": "y"}, newValues={"notes": "x"}),
+        change(4, "remove"),
+    ]
+
+    compacted = compact_cardholder_changes(changes)
+
+    assert [(c.item.href, c.type) for c in compacted if c.item] == [
+        (HREF.format(1), models.CardholderChangeType.UPDATE),
+        (HREF.format(2), models.CardholderChangeType.ADD),
+    ]
+    assert compacted[0].old_values == {"firstName": "A"}
+    assert compacted[0].new_values == {"firstName": "C"}
+    assert compacted[1].new_values == {"firstName": "New", "lastName": "L"}
+    # The input changes are left untouched
+    assert changes[0].new_values == {"firstName": "B"}
+
+
+def test_compact_cardholder_changes_update_then_remove() -> None:
+    """Test that an update followed by a remove becomes a remove."""
+    compacted = compact_cardholder_changes(
+        [
+            change(1, "update", oldValues={"notes": "x"}, newValues={"notes": "y"}),
+            change(1, "remove"),
+            change(2, "remove"),
+        ]
+    )
+
+    assert [c.type for c in compacted] == [
+        models.CardholderChangeType.REMOVE,
+        models.CardholderChangeType.REMOVE,
+    ]
+    assert compacted[0].new_values is None
@@ -11,6 +11,7 @@ from pydantic import BaseModel
 
 import gallagher_restapi.models as models
 from gallagher_restapi import Client, CloudGateway
+from gallagher_restapi.client import PollScheduler
 from gallagher_restapi.exceptions import (
     ConnectError,
     LicenseError,
@@ -279,3 +280,104 @@ async def test_async_request_with_body_data(
     assert route.called
     # Verify the request had JSON content
     assert route.calls.last.request.content == b'{"name":"test","value":42}'
+
+
+async def test_yield_pages_stops_on_empty_page(
+    gll_client: Client, respx_mock: respx.MockRouter
+) -> None:
+    """Test that endpoints which always return a next link stop on an empty page."""
+    empty_route = respx_mock.get("/api/events?pos=1").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "events": [],
+                "next": {"href": "https://localhost:8904/api/events?pos=2"},
+            },
+        )
+    )
+    respx_mock.get("/api/events").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "events": [{"id": "1"}],
+                "next": {"href": "https://localhost:8904/api/events?pos=1"},
+            },
+        )
+    )
+
+    await gll_client.initialize()
+    pages = [
+        page
+        async for page in gll_client._yield_pages(
+            f"{gll_client.server_url}/api/events",
+            results_key="events",
+            stop_on_empty=True,
+        )
+    ]
+
+    assert pages == [[{"id": "1"}]]
+    assert empty_route.call_count == 1
+
+
+async def test_yield_pages_without_prefetch(
+    gll_client: Client, respx_mock: respx.MockRouter
+) -> None:
+    """Test that the next page is only requested once the current page is consumed."""
+    next_route = respx_mock.get("/api/doors?skip=1").mock(
+        return_value=httpx.Response(200, json={"results": [{"id": "2"}]})
+    )
+    respx_mock.get("/api/doors").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "results": [{"id": "1"}],
+                "next": {"href": "https://localhost:8904/api/doors?skip=1"},
+            },
+        )
+    )
+
+    await gll_client.initialize()
+    pages = gll_client._yield_pages(
+        f"{gll_client.server_url}/api/doors", prefetch=False
+    )
+    assert await anext(pages) == [{"id": "1"}]
+    assert not next_route.called
+    assert await anext(pages) == [{"id": "2"}]
+    with pytest.raises(StopAsyncIteration):
+        await anext(pages)
+
+
+async def test_poll_scheduler_backs_off_when_idle() -> None:
+    """Test the adaptive delay between update polls."""
+    scheduler = PollScheduler(min_delay=1, max_delay=4)
+    assert scheduler.next_delay(True) == 0
+    assert [scheduler.next_delay(False) for _ in range(4)] == [1, 2, 4, 4]
+    assert scheduler.next_delay(True) == 0
+
+
+async def test_async_request_debug_log_is_truncated(
+    gll_client: Client, respx_mock: respx.MockRouter, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that response bodies are truncated in debug logs and skipped otherwise."""
+    await gll_client.initialize()
+    endpoint = f"{gll_client.server_url}/api/events"
+    respx_mock.get("/api/events").mock(
+        return_value=httpx.Response(200, json={"events": [{"id": "1"}] * 100})
+    )
+    gll_client.log_body_limit = 20
+
+    with caplog.at_level("INFO", logger="gallagher_restapi.client"):
+        await gll_client._async_request(models.HTTPMethods.GET, endpoint)
+    assert not caplog.records
+
+    with caplog.at_level("DEBUG", logger="gallagher_restapi.client"):
+        await gll_client._async_request(models.HTTPMethods.GET, endpoint)
+    assert caplog.records[-1].getMessage() == (
+        'status_code: 200, response: {"events":[{"id":"1"... <1112 bytes>'
+    )
+
+    caplog.clear()
+    gll_client.log_sample_rate = 0
+    with caplog.at_level("DEBUG", logger="gallagher_restapi.client"):
+        await gll_client._async_request(models.HTTPMethods.GET, endpoint)
+    assert not caplog.records
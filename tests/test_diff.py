@@ -0,0 +1,137 @@
+"""Test computing minimal cardholder patches."""
+
+from copy import deepcopy
+from datetime import UTC, datetime
+from typing import Any
+
+import httpx
+import respx
+
+from gallagher_restapi import Client, models
+from gallagher_restapi.diff import diff_cardholder
+
+API = "https://localhost:8904/api"
+
+
+def current_cardholder() -> models.FTCardholder:
+    """Return a cardholder with cards, access groups and pdfs."""
+    return models.FTCardholder.model_validate(
+        {
+            "href": f"{API}/cardholders/363",
+            "firstName": "John",
+            "lastName": "Doe",
+            "@Email": "john@example.com",
+            "cards": [
+                {
+                    "href": f"{API}/cardholders/363/cards/1",
+                    "number": "100",
+                    "type": {"href": f"{API}/card_types/600"},
+                },
+                {
+                    "href": f"{API}/cardholders/363/cards/2",
+                    "number": "200",
+                    "type": {"href": f"{API}/card_types/600"},
+                },
+            ],
+            "accessGroups": [
+                {
+                    "href": f"{API}/cardholders/363/access_groups/1",
+                    "accessGroup": {"href": f"{API}/access_groups/10"},
+                },
+                {
+                    "href": f"{API}/cardholders/363/access_groups/2",
+                    "accessGroup": {"href": f"{API}/access_groups/20"},
+                },
+            ],
+        }
+    )
+
+
+def test_diff_cardholder_without_changes() -> None:
+    """Test that an identical desired state produces no patch."""
+    current = current_cardholder()
+    desired = current.model_copy(deep=True)
+    assert diff_cardholder(current, desired) is None
+    assert diff_cardholder(current, models.FTCardholder(first_name="John")) is None
+
+
+def test_diff_cardholder_compares_division_id() -> None:
+    """Test the division is compared by its reference only."""
+    current = current_cardholder()
+    current.division = models.FTItem(href=f"{API}/divisions/2", name="Root")
+
+    same = models.FTCardholder(division=models.FTItem(href=f"{API}/divisions/2"))
+    assert diff_cardholder(current, same) is None
+
+    moved = models.FTCardholder(division=models.FTItem(href=f"{API}/divisions/3"))
+    patch = diff_cardholder(current, moved)
+    assert patch is not None
+    assert patch.model_dump() == {"division": {"href": f"{API}/divisions/3"}}
+
+
+def test_diff_cardholder() -> None:
+    """Test the patch covers scalars, pdfs, cards and access groups."""
+    current = current_cardholder()
+    until = datetime(2030, 1, 1, tzinfo=UTC)
+    card_type = models.FTLinkItem(href=f"{API}/card_types/600")
+    desired = models.FTCardholder(
+        first_name="John",
+        last_name="Smith",
+        pdfs={"Email": "john@example.com", "Phone": "123"},
+        cards=[
+            models.FTCardholderCard(number="100", type=card_type, active_until=until),
+            models.FTCardholderCard(number="300", type=card_type),
+        ],
+        access_groups=[
+            models.FTAccessGroupMembership(
+                access_group=models.FTAccessGroup(href=f"{API}/access_groups/10")
+            ),
+            models.FTAccessGroupMembership(
+                access_group=models.FTAccessGroup(href=f"{API}/access_groups/30")
+            ),
+        ],
+    )
+
+    patch = diff_cardholder(current, desired)
+
+    assert patch is not None
+    body: dict[str, Any] = patch.model_dump()
+    assert body["lastName"] == "Smith"
+    assert "firstName" not in body
+    assert body["@Phone"] == "123"
+    assert "@Email" not in body
+    assert "pdfs" not in body
+    assert body["cards"] == {
+        "add": [{"number": "300", "type": {"href": f"{API}/card_types/600"}}],
+        "update": [
+            {
+                "href": f"{API}/cardholders/363/cards/1",
+                "until": "2030-01-01T00:00:00Z",
+            }
+        ],
+        "remove": [{"href": f"{API}/cardholders/363/cards/2"}],
+    }
+    assert body["accessGroups"] == {
+        "add": [{"accessGroup": {"href": f"{API}/access_groups/30"}}],
+        "remove": [{"href": f"{API}/cardholders/363/access_groups/2"}],
+    }
+
+
+async def test_sync_cardholder_skips_unchanged(
+    gll_client: Client, respx_mock: respx.MockRouter
+) -> None:
+    """Test that sync_cardholder only sends a request when something changed."""
+    route = respx_mock.patch("/api/cardholders/363").mock(
+        return_value=httpx.Response(204)
+    )
+    await gll_client.initialize()
+    current = current_cardholder()
+
+    assert await gll_client.sync_cardholder(current, deepcopy(current)) is None
+    assert not route.called
+
+    patch = await gll_client.sync_cardholder(
+        current, models.FTCardholder(notes="New notes")
+    )
+    assert patch is not None
+    assert route.call_count == 1
@@ -0,0 +1,75 @@
+"""Test the cached event enrichment."""
+
+import asyncio
+
+import pytest
+
+from gallagher_restapi import models
+from gallagher_restapi.enrichment import EventEnricher
+from gallagher_restapi.testing import FakeCommandCentre, FakeSite
+
+
+async def test_event_enricher() -> None:
+    """Test enriching events with cached, batched and coalesced lookups."""
+    fake = FakeCommandCentre(FakeSite(doors=3, cardholders=2))
+    client = fake.client()
+    await client.initialize()
+    events = [models.FTEvent.model_validate(fake._event(index)) for index in range(6)]
+    enricher = EventEnricher(client, fields=("source", "door", "cardholder"))
+
+    first, second = await asyncio.gather(
+        enricher.enrich(events[:3]), enricher.enrich(events[3:])
+    )
+
+    assert first[0].door and first[0].door.name == "Door 1"
+    assert first[0].source is first[0].door
+    assert first[0].cardholder and first[0].cardholder.id == "1"
+    assert first[2].cardholder is None
+    assert second[0].cardholder is first[1].cardholder
+    # 3 doors and 2 cardholders, each requested once
+    assert enricher.misses == 5
+    assert fake.requests["doors"] == 3
+    assert fake.requests["cardholders"] == 2
+
+    await enricher.enrich(events)
+    assert enricher.misses == 5
+    enricher.invalidate()
+    await enricher.enrich(events[:1])
+    assert enricher.misses == 7
+
+
+async def test_event_enricher_cancelled_or_failed_fetch(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test that joined calls survive a cancelled caller and see fetch errors."""
+    fake = FakeCommandCentre(FakeSite(doors=3, cardholders=2))
+    client = fake.client()
+    await client.initialize()
+    events = [models.FTEvent.model_validate(fake._event(index)) for index in range(3)]
+    enricher = EventEnricher(client, fields=("door",))
+
+    owner = asyncio.create_task(enricher.enrich(events))
+    await asyncio.sleep(0)
+    joined = asyncio.create_task(enricher.enrich(events))
+    await asyncio.sleep(0)
+    owner.cancel()
+    enriched = await joined
+    assert [event.door and event.door.name for event in enriched] == [
+        "Door 1",
+        "Door 2",
+        "Door 3",
+    ]
+    assert owner.cancelled()
+    assert enricher.misses == 3
+    assert not enricher._pending
+
+    async def fail(*args: object, **kwargs: object) -> None:
+        raise ValueError("Invalid response")
+
+    enricher.invalidate()
+    monkeypatch.setattr(client, "get_doors_by_ids", fail)
+    results = await asyncio.gather(
+        enricher.enrich(events), enricher.enrich(events), return_exceptions=True
+    )
+    assert [type(result) for result in results] == [ValueError, ValueError]
+    assert not enricher._pending
@@ -0,0 +1,62 @@
+"""Test the in-memory buffer of recent events."""
+
+from datetime import UTC, datetime, timedelta
+
+from gallagher_restapi import models
+from gallagher_restapi.event_buffer import EventBuffer
+from gallagher_restapi.testing import FakeCommandCentre, FakeSite
+
+
+def _events(count: int, minutes_apart: float) -> list[models.FTEvent]:
+    """Return events ending now, oldest first."""
+    fake = FakeCommandCentre(FakeSite(doors=3))
+    now = datetime.now(UTC)
+    return [
+        models.FTEvent.model_validate(
+            fake._event(index)
+            | {
+                "time": (
+                    now - timedelta(minutes=(count - 1 - index) * minutes_apart)
+                ).isoformat()
+            }
+        )
+        for index in range(count)
+    ]
+
+
+async def test_event_buffer_queries_recent_events() -> None:
+    """Test recent-window queries by source, type and cardholder."""
+    buffer = EventBuffer(retention=timedelta(minutes=30))
+    events = _events(60, minutes_apart=1)
+    buffer.add(events)
+
+    assert len(buffer) == 30
+    door = buffer.query(since=timedelta(minutes=15, seconds=30), source="2")
+    assert door == [event for event in events[-16:] if event.source.id == "2"]
+    assert buffer.query(type="20001", source="1") == [
+        event
+        for event in events[-30:]
+        if event.type.id == "20001" and event.source.id == "1"
+    ]
+    cardholder = next(event.cardholder for event in events if event.cardholder)
+    assert buffer.query(cardholder=cardholder.id) == [
+        event
+        for event in events[-30:]
+        if event.cardholder and event.cardholder.id == cardholder.id
+    ]
+    assert buffer.query(source="unknown") == []
+
+
+async def test_event_buffer_limits_count() -> None:
+    """Test retention by count and the memory report."""
+    buffer = EventBuffer(max_events=10)
+
+    async def stream():
+        yield _events(25, minutes_apart=0)
+
+    await buffer.feed(stream())
+    assert len(buffer) == 10
+    assert sum(len(index) for index in buffer._indexes["source"].values()) == 10
+    usage = buffer.memory_usage()
+    assert usage["events"] == 10
+    assert usage["total_bytes"] > usage["events_bytes"] > 0
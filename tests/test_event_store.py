@@ -0,0 +1,85 @@
+"""Test the local SQLite event store."""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from gallagher_restapi import models
+from gallagher_restapi.event_store import EventStore
+from gallagher_restapi.testing import FakeCommandCentre, FakeSite
+
+SITE = FakeSite(events=500, doors=10, page_size=25)
+
+
+def _query(after: int, before: int, **kwargs) -> models.EventQuery:
+    """Return an event query between two offsets in seconds from the site start."""
+    return models.EventQuery(
+        after=SITE.start + timedelta(seconds=after),
+        before=SITE.start + timedelta(seconds=before),
+        **kwargs,
+    )
+
+
+async def test_event_store_answers_covered_ranges_locally() -> None:
+    """Test that only missing ranges are fetched from the server."""
+    fake = FakeCommandCentre(SITE)
+    client = fake.client()
+    await client.initialize()
+    store = EventStore(client, window=timedelta(seconds=20))
+
+    events = await store.get_events(_query(10, 60, top=20))
+    assert [event.id for event in events] == [str(id) for id in range(11, 31)]
+    requests = fake.requests["events"]
+
+    events = await store.get_events(_query(10, 60, top=5, previous=True))
+    assert [event.id for event in events] == ["60", "59", "58", "57", "56"]
+    assert fake.requests["events"] == requests
+
+    assert store.missing_ranges(
+        SITE.start + timedelta(seconds=50), SITE.start + timedelta(seconds=100)
+    ) == [(SITE.start + timedelta(seconds=60), SITE.start + timedelta(seconds=100))]
+    events = await store.get_events(_query(50, 100, source=["3"]))
+    assert [event.id for event in events] == ["53", "63", "73", "83", "93"]
+    assert fake.requests["events"] > requests
+    assert len(store.covered_ranges()) == 1
+
+
+async def test_event_store_filters() -> None:
+    """Test the local filters without a client."""
+    fake = FakeCommandCentre(SITE)
+    store = EventStore()
+    store.add_events(
+        models.FTEvent.model_validate(fake._event(index)) for index in range(100)
+    )
+
+    related = store.query(_query(0, 100, related_items=["5"]))
+    assert [event.id for event in related] == [str(id) for id in range(5, 101, 10)]
+    alarms = store.query(_query(0, 30, event_groups=["3"]))
+    assert {event.group.name for event in alarms if event.group} == {"Alarm"}
+    assert len(store.query(_query(0, 100, cardholders=["1"]))) == 1
+    assert len(store.query(models.EventQuery(top=10))) == 10
+    assert len(await store.get_events(_query(0, 30, event_groups=["3"]))) == len(alarms)
+    # Names can only be resolved by a client
+    with pytest.raises(ValueError):
+        await store.get_events(_query(0, 30, event_groups=["Alarm"]))
+    store.close()
+
+
+async def test_event_store_does_not_cover_recent_events() -> None:
+    """Test that ranges within the settle time are fetched again."""
+    fake = FakeCommandCentre(SITE)
+    client = fake.client()
+    await client.initialize()
+    settled = SITE.start + timedelta(seconds=30)
+    store = EventStore(client, settle_time=datetime.now(UTC) - settled)
+
+    await store.get_events(_query(10, 60))
+    ((after, before),) = store.covered_ranges()
+    assert after == (SITE.start + timedelta(seconds=10)).timestamp()
+    assert (
+        settled.timestamp() <= before < (SITE.start + timedelta(seconds=60)).timestamp()
+    )
+    requests = fake.requests["events"]
+
+    await store.get_events(_query(10, 60))
+    assert fake.requests["events"] > requests
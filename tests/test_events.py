@@ -1,7 +1,15 @@
 """Test Gallagher Events methods."""
 
+from datetime import UTC, datetime
+
+import httpx
+import pytest
+import respx
+
 from gallagher_restapi import Client
 from gallagher_restapi import models
+from gallagher_restapi.columnar import MISSING, StringTable
+from gallagher_restapi.records import EventRecord
 
 
 async def test_get_event(gll_client: Client) -> None:
@@ -58,3 +66,163 @@ async def test_push_event(gll_client: Client) -> None:
     event = await gll_client.push_event(event_post)
     assert event
     assert event.href is not None
+
+
+async def test_yield_event_batches(
+    gll_client: Client, respx_mock: respx.MockRouter
+) -> None:
+    """Test yielding events as columnar batches."""
+    event = {
+        "href": "https://localhost:8904/api/events/1",
+        "id": "1",
+        "time": "2025-01-01T00:00:00Z",
+        "message": "Access granted",
+        "priority": 3,
+        "type": {"id": "20001", "name": "Card Event"},
+        "source": {
+            "id": "359",
+            "name": "Door",
+            "href": "https://localhost:8904/api/doors/359",
+        },
+        "door": {"name": "Door", "href": "https://localhost:8904/api/doors/359"},
+        "cardholder": {"href": "https://localhost:8904/api/cardholders/325"},
+    }
+    respx_mock.get("/api/events?pos=1").mock(
+        return_value=httpx.Response(200, json={"events": []})
+    )
+    respx_mock.get("/api/events").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "events": [event, event | {"id": "2", "cardholder": None}],
+                "next": {"href": "https://localhost:8904/api/events?pos=1"},
+            },
+        )
+    )
+    await gll_client.initialize()
+
+    strings = StringTable()
+    batches = [batch async for batch in gll_client.yield_event_batches(None, strings)]
+    assert len(batches) == 1
+    batch = batches[0]
+    assert len(batch) == 2
+    assert batch.time[0] == datetime(2025, 1, 1, tzinfo=UTC).timestamp()
+    assert list(batch.rows()) == [
+        (batch.time[0], "20001", "359", "325"),
+        (batch.time[0], "20001", "359", None),
+    ]
+    assert batch.source[0] == batch.door[0]
+    assert batch.cardholder[1] == MISSING
+    assert batch.nbytes == 2 * (8 + 5 * 4 + 1)
+    assert batch.strings is strings
+    assert strings.lookup("20001") == batch.type[0]
+
+
+async def test_yield_new_event_records(
+    gll_client: Client, respx_mock: respx.MockRouter
+) -> None:
+    """Test yielding new events as lightweight records."""
+    event = {
+        "href": "https://localhost:8904/api/events/1",
+        "id": "1",
+        "time": "2025-01-01T00:00:00Z",
+        "message": "Access granted",
+        "priority": 3,
+        "type": {"id": "20001", "name": "Card Event"},
+        "source": {"id": "359", "name": "Door"},
+        "cardholder": {"href": "https://localhost:8904/api/cardholders/325"},
+    }
+    respx_mock.get("/api/events/updates").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "events": [event],
+                "updates": {"href": "https://localhost:8904/api/events/updates?p=1"},
+            },
+        )
+    )
+    await gll_client.initialize()
+
+    updates = gll_client.yield_new_event_records()
+    records = await anext(updates)
+    await updates.aclose()
+    assert records == [
+        EventRecord(
+            "1",
+            datetime(2025, 1, 1, tzinfo=UTC),
+            "20001",
+            "359",
+            "325",
+            3,
+            "Access granted",
+        )
+    ]
+
+
+async def test_get_events_by_type_and_group_names(
+    gll_client: Client, respx_mock: respx.MockRouter
+) -> None:
+    """Test resolving event type and group names in the event filter."""
+    event_groups = {
+        "eventGroups": [
+            {
+                "id": "2",
+                "name": "Access Denied",
+                "href": "https://localhost:8904/api/events/groups/2",
+                "eventTypes": [
+                    {
+                        "id": "20002",
+                        "name": "Access Denied",
+                        "href": "https://localhost:8904/api/events/types/20002",
+                    }
+                ],
+            }
+        ]
+    }
+    groups_route = respx_mock.get("/api/events/groups").mock(
+        return_value=httpx.Response(200, json=event_groups)
+    )
+    events_route = respx_mock.get(
+        "/api/events", params={"type": "20002,20047", "group": "2"}
+    ).mock(return_value=httpx.Response(200, json={"events": []}))
+    await gll_client.initialize()
+
+    event_filter = models.EventQuery(
+        event_types=["Access Denied", "20047"], event_groups=["Access Denied"]
+    )
+    assert await gll_client.get_events(event_filter) == []
+    assert await gll_client.get_events(event_filter) == []
+    assert groups_route.call_count == 1
+    assert events_route.call_count == 2
+
+    with pytest.raises(ValueError, match="Unknown event group: Door Forced"):
+        await gll_client.get_events(models.EventQuery(event_groups=["Door Forced"]))
+    assert groups_route.call_count == 2
+
+
+async def test_yield_new_events_does_not_back_off(
+    gll_client: Client, respx_mock: respx.MockRouter, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that idle long-polls are repeated after the fixed delay."""
+    delays: list[float] = []
+
+    async def sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr("gallagher_restapi.client.asyncio.sleep", sleep)
+    respx_mock.get("/api/events/updates").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "events": [],
+                "updates": {"href": "https://localhost:8904/api/events/updates?p=1"},
+            },
+        )
+    )
+    await gll_client.initialize()
+
+    updates = gll_client.yield_new_events()
+    for _ in range(6):
+        assert await anext(updates) == []
+    await updates.aclose()
+    assert delays == [1.0] * 5
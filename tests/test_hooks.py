@@ -0,0 +1,98 @@
+"""Test request hooks and metrics."""
+
+import httpx
+import pytest
+import respx
+
+from gallagher_restapi import Client
+from gallagher_restapi.exceptions import RequestError
+from gallagher_restapi.hooks import MetricsCollector, endpoint_family
+
+
+@pytest.mark.parametrize(
+    "method,url,family",
+    [
+        ("GET", "https://localhost:8904/api/cardholders?top=10", "cardholders"),
+        ("GET", "https://localhost:8904/api/events/updates", "events"),
+        ("POST", "https://localhost:8904/api/items/updates", "items/updates"),
+        ("GET", "https://localhost:8904/api/items/updates/1_2", "items/updates"),
+        ("POST", "https://localhost:8904/api/doors/359/open", "commands"),
+        ("POST", "https://localhost:8904/api/cardholders", "cardholders"),
+        ("GET", "https://localhost:8904/api/", "api"),
+    ],
+)
+async def test_endpoint_family(method: str, url: str, family: str) -> None:
+    """Test grouping requests into endpoint families."""
+    assert endpoint_family(method, url) == family
+
+
+async def test_metrics_collector(
+    gll_client: Client, respx_mock: respx.MockRouter
+) -> None:
+    """Test that the collector records latency, bytes, errors and validation time."""
+    metrics = MetricsCollector()
+    gll_client.hooks.append(metrics)
+    await gll_client.initialize()
+    respx_mock.get("/api/events").mock(
+        return_value=httpx.Response(200, json={"events": []})
+    )
+    respx_mock.post("/api/doors/359/open").mock(return_value=httpx.Response(404))
+
+    assert await gll_client.get_events() == []
+    with pytest.raises(RequestError):
+        await gll_client.override_door("https://localhost:8904/api/doors/359/open")
+
+    snapshot = metrics.snapshot()
+    assert snapshot.keys() == {"api", "events", "commands"}
+    assert snapshot["events"]["latency"]["count"] == 1
+    assert snapshot["events"]["status_codes"] == {200: 1}
+    assert snapshot["events"]["bytes_received"] == len(b'{"events":[]}')
+    assert snapshot["events"]["validated_rows"] == 0
+    assert snapshot["commands"]["status_codes"] == {404: 1}
+    assert snapshot["commands"]["errors"] == {"RequestError": 1}
+
+    metrics.reset()
+    assert metrics.snapshot() == {}
+
+
+async def test_metrics_collector_single_items_and_images(
+    gll_client: Client, respx_mock: respx.MockRouter
+) -> None:
+    """Test that single item validation and image streams reach the hooks."""
+    metrics = MetricsCollector()
+    gll_client.hooks.append(metrics)
+    await gll_client.initialize()
+    respx_mock.get("/api/doors/1").mock(
+        return_value=httpx.Response(200, json={"id": "1", "name": "Door 1"})
+    )
+    respx_mock.get("/api/cardholders/1/personal_data/10").mock(
+        return_value=httpx.Response(
+            200, content=b"photo", headers={"content-type": "image/jpeg"}
+        )
+    )
+    respx_mock.get("/api/cardholders/2/personal_data/10").mock(
+        return_value=httpx.Response(404)
+    )
+
+    assert len(await gll_client.get_door(id="1")) == 1
+    image = b"".join(
+        [
+            chunk
+            async for chunk in gll_client.stream_image_pdf(
+                "https://localhost:8904/api/cardholders/1/personal_data/10"
+            )
+            if isinstance(chunk, bytes)
+        ]
+    )
+    assert image == b"photo"
+    with pytest.raises(RequestError):
+        async for _ in gll_client.stream_image_pdf(
+            "https://localhost:8904/api/cardholders/2/personal_data/10"
+        ):
+            pass
+
+    snapshot = metrics.snapshot()
+    assert snapshot["doors"]["validated_rows"] == 1
+    assert snapshot["cardholders"]["status_codes"] == {200: 1, 404: 1}
+    assert snapshot["cardholders"]["bytes_received"] == len(b"photo")
+    assert snapshot["cardholders"]["errors"] == {"RequestError": 1}
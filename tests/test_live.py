@@ -0,0 +1,69 @@
+"""Test the gap-aware live event feed."""
+
+from typing import Any
+
+import httpx
+import respx
+
+from gallagher_restapi import Client
+from gallagher_restapi.live import LiveEventFeed
+
+UPDATES = "https://localhost:8904/api/events/updates"
+
+
+def _event(id: int) -> dict[str, Any]:
+    """Return a raw event."""
+    return {
+        "href": f"https://localhost:8904/api/events/{id}",
+        "id": str(id),
+        "time": f"2025-01-01T00:00:0{id}Z",
+        "message": "Access granted",
+        "priority": 3,
+        "type": {"id": "20001", "name": "Card Event"},
+        "source": {"id": "359", "name": "Door"},
+    }
+
+
+async def test_live_feed_fills_gap_after_reconnect(
+    gll_client: Client, respx_mock: respx.MockRouter
+) -> None:
+    """Test that missed events are fetched after a reconnect and delivered once."""
+    respx_mock.get(f"{UPDATES}?p=1").mock(
+        side_effect=httpx.ConnectError("Connection lost")
+    )
+    respx_mock.get(UPDATES).mock(
+        side_effect=[
+            httpx.Response(
+                200,
+                json={
+                    "events": [_event(1), _event(2)],
+                    "updates": {"href": f"{UPDATES}?p=1"},
+                },
+            ),
+            httpx.Response(
+                200,
+                json={
+                    "events": [_event(3), _event(4)],
+                    "updates": {"href": f"{UPDATES}?p=2"},
+                },
+            ),
+        ]
+    )
+    catch_up = respx_mock.get("/api/events").mock(
+        side_effect=[
+            httpx.Response(200, json={"events": [_event(2), _event(3)]}),
+            httpx.Response(200, json={"events": [_event(3)]}),
+        ]
+    )
+    await gll_client.initialize()
+
+    feed = LiveEventFeed(gll_client, reconnect_min_delay=0.01)
+    delivered = []
+    async for events in feed:
+        delivered.append([event.id for event in events])
+        if events[-1].id == "4":
+            break
+
+    assert delivered == [["1", "2"], ["3"], ["4"]]
+    assert feed.last_id == "4"
+    assert catch_up.calls[0].request.url.params["after"] == "2025-01-01T00:00:02Z"
@@ -0,0 +1,83 @@
+"""Test the local cardholder mirror."""
+
+from copy import deepcopy
+from typing import Any
+
+import httpx
+import respx
+
+from gallagher_restapi import Client, models
+from gallagher_restapi.mirror import CardholderMirror
+
+
+async def test_cardholder_mirror(
+    gll_client: Client, fixtures: dict[str, Any], respx_mock: respx.MockRouter
+) -> None:
+    """Test seeding the mirror and applying add, update and remove changes."""
+    cardholder = fixtures["cardholder"]
+    other = deepcopy(cardholder) | {
+        "href": "https://localhost:8904/api/cardholders/364",
+        "id": "364",
+        "firstName": "Jane",
+        "@Email": "jane@example.com",
+    }
+    respx_mock.get("/api/cardholders/changes", params={"pos": "1"}).mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "results": [
+                    {
+                        "type": "update",
+                        "item": {"href": cardholder["href"]},
+                        "newValues": {"lastName": "Smith"},
+                    },
+                    {"type": "remove", "item": {"href": other["href"]}},
+                    {
+                        "type": "add",
+                        "item": {"href": "https://localhost:8904/api/cardholders/365"},
+                        "cardholder": {"firstName": "Max", "@Email": "max@example.com"},
+                    },
+                ],
+                "next": {
+                    "href": "https://localhost:8904/api/cardholders/changes?pos=2"
+                },
+            },
+        )
+    )
+    respx_mock.get("/api/cardholders/changes").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "results": [],
+                "next": {
+                    "href": "https://localhost:8904/api/cardholders/changes?pos=1"
+                },
+            },
+        )
+    )
+    respx_mock.get("/api/cardholders").mock(
+        return_value=httpx.Response(200, json={"results": [cardholder, other]})
+    )
+
+    await gll_client.initialize()
+    mirror = CardholderMirror(gll_client)
+    await mirror.load()
+
+    assert len(mirror) == 2
+    assert mirror.find_by_name("john", "doe")[0].id == "363"
+    assert mirror.find_by_pdf("Email", "jane@example.com")[0].id == "364"
+
+    changes = await mirror.sync()
+
+    assert len(changes) == 3
+    assert mirror.changes_href.endswith("pos=2")
+    assert "364" not in mirror
+    assert not mirror.find_by_pdf("Email", "jane@example.com")
+    updated = mirror.get("363")
+    assert updated and updated.last_name == "Smith"
+    assert updated.pdfs["Email"] == "john.doe@example.com"
+    assert mirror.find_by_name("John", "Smith")
+    assert not mirror.find_by_name("John", "Doe")
+    added = mirror.find_by_pdf("Email", "max@example.com")
+    assert added[0].id == "365"
+    assert isinstance(added[0], models.FTCardholder)
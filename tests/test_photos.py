@@ -0,0 +1,107 @@
+"""Test the bulk cardholder photo exporter."""
+
+from pathlib import Path
+
+import httpx
+import respx
+
+from gallagher_restapi import Client
+from gallagher_restapi.photos import PhotoExporter
+
+API = "https://localhost:8904/api"
+
+
+async def test_photo_export(
+    gll_client: Client, respx_mock: respx.MockRouter, tmp_path: Path
+) -> None:
+    """Test incremental and refresh photo exports."""
+    respx_mock.get("/api/personal_data_fields").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "results": [
+                    {"id": "10", "name": "Photo", "type": "image"},
+                    {"id": "11", "name": "Email", "type": "email"},
+                ]
+            },
+        )
+    )
+    cardholders = [
+        {
+            "id": str(id),
+            "@Photo": {"href": f"{API}/cardholders/{id}/personal_data/10"},
+            "@Email": "someone@example.com",
+        }
+        for id in (1, 2)
+    ]
+    respx_mock.get("/api/cardholders").mock(
+        return_value=httpx.Response(200, json={"results": cardholders})
+    )
+    photo_routes = [
+        respx_mock.get(f"/api/cardholders/{id}/personal_data/10").mock(
+            return_value=httpx.Response(
+                200,
+                content=f"photo {id}".encode(),
+                headers={"content-type": "image/jpeg"},
+            )
+        )
+        for id in (1, 2)
+    ]
+
+    await gll_client.initialize()
+    exporter = PhotoExporter(gll_client, tmp_path)
+
+    result = await exporter.export()
+    assert (result.downloaded, result.skipped) == (2, 0)
+    assert (tmp_path / "1_10").read_bytes() == b"photo 1"
+    assert (tmp_path / "manifest.json").exists()
+
+    result = await PhotoExporter(gll_client, tmp_path).export()
+    assert (result.downloaded, result.skipped) == (0, 2)
+    assert photo_routes[0].call_count == 1
+
+    photo_routes[1].mock(
+        return_value=httpx.Response(
+            200, content=b"new photo", headers={"content-type": "image/jpeg"}
+        )
+    )
+    result = await PhotoExporter(gll_client, tmp_path).export(refresh=True)
+    assert (result.downloaded, result.unchanged) == (1, 1)
+    assert (tmp_path / "2_10").read_bytes() == b"new photo"
+    assert sorted(path.name for path in tmp_path.iterdir()) == [
+        "1_10",
+        "2_10",
+        "manifest.json",
+    ]
+
+    photo_routes[0].mock(side_effect=httpx.ConnectError("unreachable"))
+    photo_routes[1].mock(
+        return_value=httpx.Response(
+            200, content=b"newer photo", headers={"content-type": "image/jpeg"}
+        )
+    )
+    result = await PhotoExporter(gll_client, tmp_path).export(refresh=True)
+    assert (result.downloaded, result.failed) == (1, 1)
+    assert (tmp_path / "1_10").read_bytes() == b"photo 1"
+    assert (tmp_path / "2_10").read_bytes() == b"newer photo"
+
+    photo_routes[0].mock(
+        return_value=httpx.Response(
+            200,
+            json={"message": "Not an image"},
+            headers={"content-type": "application/json"},
+        )
+    )
+    result = await PhotoExporter(gll_client, tmp_path).export(refresh=True)
+    assert (result.unchanged, result.failed) == (1, 1)
+
+    photo_routes[0].mock(
+        return_value=httpx.Response(
+            200, content=b"new photo 1", headers={"content-type": "image/jpeg"}
+        )
+    )
+    (tmp_path / "1_10").unlink()
+    (tmp_path / "1_10").mkdir()
+    result = await PhotoExporter(gll_client, tmp_path).export(refresh=True)
+    assert (result.unchanged, result.failed) == (1, 1)
+    assert (tmp_path / "2_10").read_bytes() == b"newer photo"
@@ -1,6 +1,10 @@
 """Test getting the status of items."""
 
+import httpx
+import respx
+
 from gallagher_restapi import Client
+from gallagher_restapi.records import StatusRecord
 
 
 async def test_get_item_status(gll_client: Client) -> None:
@@ -15,3 +19,30 @@ async def test_get_item_status(gll_client: Client) -> None:
 
     controller_new_status = await gll_client.get_item_status(next_link=update)
     assert controller_new_status is not None
+
+
+async def test_get_item_status_records(
+    gll_client: Client, respx_mock: respx.MockRouter
+) -> None:
+    """Test getting the status of items as lightweight records."""
+    update = {
+        "id": "359",
+        "status": "closed",
+        "statusText": "Closed",
+        "statusFlags": ["closed", "secure"],
+    }
+    respx_mock.post("/api/items/updates").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "updates": [update, update | {"id": "360"}],
+                "next": {"href": "https://localhost:8904/api/items/updates/1"},
+            },
+        )
+    )
+    await gll_client.initialize()
+
+    records, next_link = await gll_client.get_item_status_records(["359", "360"])
+    assert next_link == "https://localhost:8904/api/items/updates/1"
+    assert records[0] == StatusRecord("359", "closed", "Closed", ("closed", "secure"))
+    assert records[0].status_flags is records[1].status_flags
@@ -0,0 +1,80 @@
+"""Test the fake Command Centre transport."""
+
+from datetime import timedelta
+
+import pytest
+
+from gallagher_restapi import models
+from gallagher_restapi.exceptions import RequestError
+from gallagher_restapi.testing import FakeCommandCentre, FakeSite
+
+SITE = FakeSite(cardholders=250, doors=30, events=2500, page_size=100)
+
+
+async def test_fake_command_centre_serves_cardholders() -> None:
+    """Test paging through the cardholders of the fake site."""
+    fake = FakeCommandCentre(SITE)
+    client = fake.client()
+    await client.initialize()
+
+    pages = [
+        page
+        async for page in client.yield_cardholders(
+            response_fields=["defaults", "cards"], top=100
+        )
+    ]
+    assert [len(page) for page in pages] == [100, 100, 50]
+    assert pages[0][0].cards and pages[0][0].cards[0].number == "1000000"
+    assert fake.requests["cardholders"] == 3
+
+    cardholder = await client.get_cardholder(id="42")
+    assert cardholder[0].id == "42"
+    with pytest.raises(RequestError):
+        await client.get_cardholder(id="251")
+
+
+async def test_fake_command_centre_serves_events() -> None:
+    """Test filtering and paging through the events of the fake site."""
+    client = FakeCommandCentre(SITE).client()
+    await client.initialize()
+
+    after = SITE.start + timedelta(seconds=2000)
+    events = [
+        event
+        async for page in client.yield_events(models.EventQuery(after=after, top=200))
+        for event in page
+    ]
+    assert len(events) == 500
+    assert events[0].id == "2001"
+    assert events[0].time == after
+
+    newest = await client.get_events(models.EventQuery(previous=True, top=1))
+    assert newest[0].id == "2500"
+    assert len(await client.get_event_groups()) == 3
+
+
+async def test_fake_command_centre_serves_live_updates() -> None:
+    """Test the live events and item status updates of the fake site."""
+    fake = FakeCommandCentre(
+        FakeSite(events=10, live_event_rate=1000), long_poll_timeout=0.01
+    )
+    client = fake.client()
+    await client.initialize()
+
+    updates = client.yield_new_events()
+    events = await anext(updates)
+    while not events:
+        events = await anext(updates)
+    assert int(events[0].id) > 10
+    await updates.aclose()
+
+    statuses, next_link = await client.get_item_status(item_ids=["1", "2"])
+    assert [status.id for status in statuses] == ["1", "2"]
+    await client.get_item_status(next_link=next_link.href)
+
+
+async def test_fake_command_centre_injects_errors() -> None:
+    """Test that the configured error rate answers with Service Unavailable."""
+    client = FakeCommandCentre(SITE, error_rate=1).client()
+    with pytest.raises(RequestError, match="Service Unavailable"):
+        await client.initialize()